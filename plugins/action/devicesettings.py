@@ -0,0 +1,21 @@
+# devicesettings.py - Runs the be_networks.verity.devicesettings module in the worker process.
+# Copyright: (c) 2025, BeyondEdge Networks <you@example.com>
+# GNU General Public License v3.0+
+
+from __future__ import absolute_import, annotations, division, print_function
+
+__metaclass__ = type  # pylint: disable=C0103
+
+from ansible_collections.be_networks.verity.plugins.plugin_utils.verity_action import (
+    VerityResourceAction,
+)
+
+
+class ActionModule(VerityResourceAction):
+    """
+    Action plugin: devicesettings
+    Calls the Verity API for be_networks.verity.devicesettings without AnsiballZ.
+    """
+
+    RESOURCE = "devicesettings"
+    PATH = "/devicesettings"
@@ -0,0 +1,21 @@
+# ipv4prefixlists.py - Runs the be_networks.verity.ipv4prefixlists module in the worker process.
+# Copyright: (c) 2025, BeyondEdge Networks <you@example.com>
+# GNU General Public License v3.0+
+
+from __future__ import absolute_import, annotations, division, print_function
+
+__metaclass__ = type  # pylint: disable=C0103
+
+from ansible_collections.be_networks.verity.plugins.plugin_utils.verity_action import (
+    VerityResourceAction,
+)
+
+
+class ActionModule(VerityResourceAction):
+    """
+    Action plugin: ipv4prefixlists
+    Calls the Verity API for be_networks.verity.ipv4prefixlists without AnsiballZ.
+    """
+
+    RESOURCE = "ipv4prefixlists"
+    PATH = "/ipv4prefixlists"
@@ -0,0 +1,21 @@
+# ipv6lists.py - Runs the be_networks.verity.ipv6lists module in the worker process.
+# Copyright: (c) 2025, BeyondEdge Networks <you@example.com>
+# GNU General Public License v3.0+
+
+from __future__ import absolute_import, annotations, division, print_function
+
+__metaclass__ = type  # pylint: disable=C0103
+
+from ansible_collections.be_networks.verity.plugins.plugin_utils.verity_action import (
+    VerityResourceAction,
+)
+
+
+class ActionModule(VerityResourceAction):
+    """
+    Action plugin: ipv6lists
+    Calls the Verity API for be_networks.verity.ipv6lists without AnsiballZ.
+    """
+
+    RESOURCE = "ipv6lists"
+    PATH = "/ipv6lists"
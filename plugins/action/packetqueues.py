@@ -0,0 +1,21 @@
+# packetqueues.py - Runs the be_networks.verity.packetqueues module in the worker process.
+# Copyright: (c) 2025, BeyondEdge Networks <you@example.com>
+# GNU General Public License v3.0+
+
+from __future__ import absolute_import, annotations, division, print_function
+
+__metaclass__ = type  # pylint: disable=C0103
+
+from ansible_collections.be_networks.verity.plugins.plugin_utils.verity_action import (
+    VerityResourceAction,
+)
+
+
+class ActionModule(VerityResourceAction):
+    """
+    Action plugin: packetqueues
+    Calls the Verity API for be_networks.verity.packetqueues without AnsiballZ.
+    """
+
+    RESOURCE = "packetqueues"
+    PATH = "/packetqueues"
@@ -0,0 +1,28 @@
+# verity_batch.py - Runs the be_networks.verity.verity_batch module in the worker process.
+# Copyright: (c) 2025, BeyondEdge Networks <you@example.com>
+# GNU General Public License v3.0+
+
+from __future__ import absolute_import, annotations, division, print_function
+
+__metaclass__ = type  # pylint: disable=C0103
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_batch import (
+    BATCH_ARGS,
+    run_batch,
+)
+from ansible_collections.be_networks.verity.plugins.plugin_utils.verity_action import (
+    InProcessModule,
+    VerityResourceAction,
+)
+
+
+class ActionModule(VerityResourceAction):
+    """
+    Action plugin: verity_batch
+    Runs all operations of be_networks.verity.verity_batch without AnsiballZ.
+    """
+
+    ARGUMENT_SPEC = BATCH_ARGS
+
+    def run_module(self, module: InProcessModule) -> None:
+        run_batch(module)
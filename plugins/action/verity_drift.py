@@ -0,0 +1,28 @@
+# verity_drift.py - Runs the be_networks.verity.verity_drift module in the worker process.
+# Copyright: (c) 2025, BeyondEdge Networks <you@example.com>
+# GNU General Public License v3.0+
+
+from __future__ import absolute_import, annotations, division, print_function
+
+__metaclass__ = type  # pylint: disable=C0103
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_drift import (
+    DRIFT_ARGS,
+    run_drift,
+)
+from ansible_collections.be_networks.verity.plugins.plugin_utils.verity_action import (
+    InProcessModule,
+    VerityResourceAction,
+)
+
+
+class ActionModule(VerityResourceAction):
+    """
+    Action plugin: verity_drift
+    Detects the drift of vNetC resources without AnsiballZ.
+    """
+
+    ARGUMENT_SPEC = DRIFT_ARGS
+
+    def run_module(self, module: InProcessModule) -> None:
+        run_drift(module)
@@ -0,0 +1,103 @@
+# verity_objects.py - Compressed cache plugin for the Verity inventory.
+# Copyright: (c) 2025, BeyondEdge Networks <you@example.com>
+# GNU General Public License v3.0+
+
+from __future__ import absolute_import, annotations, division, print_function
+
+__metaclass__ = type  # pylint: disable=C0103
+
+DOCUMENTATION = """
+    name: verity_objects
+    author: BeyondEdge Networks (@yourhandle)
+    version_added: "1.1.0"
+    short_description: Compressed cache for the Verity inventory.
+    description:
+      - Cache plugin for the C(cache_plugin) option of the
+        be_networks.verity.verity inventory, which keeps large inventories
+        compressed with a size cap.
+      - "Stores documents of the form C({object type: {name: object}}) in the
+        C(inventory) directory of O(_uri), each entry a separate gzip file,
+        readable by the owner only, of one line per object, that expires
+        after O(_timeout) seconds."
+      - Once the entries take more than O(max_size) MiB, the least recently
+        used ones are evicted.
+      - It is only a cache of the inventory. The resource modules do not
+        read it, and their writes do not expire its entries.
+    options:
+      _uri:
+        description:
+          - Directory holding the cache.
+          - Defaults to C(~/.ansible/verity), the directory the modules use
+            unless their I(cache_dir) option is set.
+        env:
+          - name: VERITY_CACHE_DIR
+        type: path
+      _timeout:
+        default: 300
+        description: Seconds an entry is kept before it is read again.
+        type: integer
+      max_size:
+        default: 256
+        description:
+          - Size in MiB, compressed, above which the least recently used
+            entries are evicted. V(0) keeps every entry until it expires.
+        env:
+          - name: VERITY_INVENTORY_CACHE_SIZE
+        type: integer
+"""
+
+from typing import Any, Dict, Iterator, List, Tuple
+
+from ansible.plugins.cache import BaseCacheModule  # type: ignore
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_snapshot import (
+    SnapshotCache,
+)
+
+
+def _items(value: Dict[str, Any]) -> Iterator[Tuple[str, Any, Any]]:
+    # The (type_key, name, object) triples SnapshotCache stores; values
+    # other than non-empty dicts are kept whole, under no name
+    for type_key, objects in value.items():
+        if isinstance(objects, dict) and objects:
+            for name, obj in objects.items():
+                yield type_key, name, obj
+        else:
+            yield type_key, None, objects
+
+
+class CacheModule(BaseCacheModule):  # type: ignore[misc]
+    """
+    Cache plugin: verity_objects
+    Compressed, size-capped store of the Verity inventory.
+    """
+
+    # Inventory plugins only read back persistent cache plugins. ansible-core
+    # 2.19 wraps their values in a one-key JSON envelope, which is stored
+    # whole, as a value under no name.
+    _persistent = True
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._snapshots = SnapshotCache(self.get_option("_uri"), self.get_option("_timeout"),
+                                        max_size=self.get_option("max_size"), store="inventory")
+
+    def get(self, key: str) -> Dict[str, Any]:
+        objects = self._snapshots.get(key)
+        if objects is None:
+            raise KeyError(key)
+        return objects
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        self._snapshots.set(key, _items(value))
+
+    def keys(self) -> List[str]:
+        return self._snapshots.keys()
+
+    def contains(self, key: str) -> bool:
+        return self._snapshots.get(key) is not None
+
+    def delete(self, key: str) -> None:
+        self._snapshots.delete(key)
+
+    def flush(self) -> None:
+        self._snapshots.flush()
@@ -0,0 +1,82 @@
+# verity_token.py - Cache plugin holding Verity API tokens.
+# Copyright: (c) 2025, BeyondEdge Networks <you@example.com>
+# GNU General Public License v3.0+
+
+from __future__ import absolute_import, annotations, division, print_function
+
+__metaclass__ = type  # pylint: disable=C0103
+
+DOCUMENTATION = """
+    name: verity_token
+    author: BeyondEdge Networks (@yourhandle)
+    version_added: "1.1.0"
+    short_description: Cache of Verity API tokens.
+    description:
+      - Stores the tokens returned by the vNetC C(/api/auth) endpoint, keyed
+        by C(username@base_url) followed, for the modules, by a salted
+        fingerprint of the password, with an expiry.
+      - The resource modules read and refresh the same store when they
+        authenticate with I(username) and I(password), so a token obtained
+        by one task is reused by every later task, fork and play on the
+        controller until it expires.
+      - Entries are kept one file per key, readable by the owner only. The
+        tokens in them are not encrypted.
+    options:
+      _uri:
+        description:
+          - Directory holding the cache.
+          - Defaults to C(~/.ansible/verity), the directory the modules use
+            unless their I(cache_dir) option is set.
+        env:
+          - name: VERITY_CACHE_DIR
+        type: path
+      _timeout:
+        default: 1800
+        description: Seconds a token is kept before it is fetched again.
+        env:
+          - name: VERITY_TOKEN_CACHE_TTL
+        type: integer
+"""
+
+from typing import List
+
+from ansible.plugins.cache import BaseCacheModule  # type: ignore
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_cache import (
+    TokenCache,
+)
+
+
+class CacheModule(BaseCacheModule):  # type: ignore[misc]
+    """
+    Cache plugin: verity_token
+    Token store shared with the Verity resource modules.
+    """
+
+    # The modules read the files directly, so keys and values must be stored
+    # as given rather than wrapped in ansible-core's persistence envelope.
+    _persistent = False
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._tokens = TokenCache(self.get_option("_uri"), self.get_option("_timeout"))
+
+    def get(self, key: str) -> str:
+        token = self._tokens.get(key)
+        if token is None:
+            raise KeyError(key)
+        return token
+
+    def set(self, key: str, value: str) -> None:
+        self._tokens.set(key, value)
+
+    def keys(self) -> List[str]:
+        return self._tokens.keys()
+
+    def contains(self, key: str) -> bool:
+        return self._tokens.get(key) is not None
+
+    def delete(self, key: str) -> None:
+        self._tokens.delete(key)
+
+    def flush(self) -> None:
+        self._tokens.flush()
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2025, BeyondEdge Networks <you@example.com>
+# GNU General Public License v3.0+
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    # Options shared by every module talking to the vNetC
+    DOCUMENTATION = r'''
+options:
+  base_url:
+    description:
+    - vNetC base URL.
+    - Required unless the task runs over the C(ansible.netcommon.httpapi)
+      connection with C(ansible_network_os=be_networks.verity.verity), in
+      which case the connection supplies the vNetC and its authentication.
+    required: false
+    type: str
+  cache_dir:
+    description:
+    - Directory on the host running the module where tokens and other
+      cached data are kept.
+    - Defaults to the C(VERITY_CACHE_DIR) environment variable, then
+      C(~/.ansible/verity).
+    required: false
+    type: path
+  changeset_name:
+    description:
+    - Changeset the API calls of the task are made in, opened and committed
+      on the vNetC outside of this collection.
+    - Snapshots kept with C(snapshot_cache) outside of the changeset are not
+      dropped when it is committed; they are read again once they expire.
+    - Sent as the C(changeset_name) query parameter of every API call that
+      does not already have one.
+    - Set it for all the modules of the collection at once with the
+      C(group/be_networks.verity.verity) group of C(module_defaults).
+    required: false
+    type: str
+  compression:
+    choices:
+    - auto
+    - gzip
+    - none
+    default: auto
+    description:
+    - gzip compression of API traffic with the vNetC.
+    - With C(auto), responses are requested gzip-encoded and request bodies
+      of 16 KiB or more are sent gzip-encoded. If the vNetC rejects a
+      compressed body, with HTTP 415 or an HTTP 400 error naming the
+      encoding, the call is resent uncompressed. Once an uncompressed
+      resend succeeds, later bodies to that vNetC are sent uncompressed.
+    - C(gzip) always compresses large request bodies, without falling back.
+    - C(none) disables compression in both directions.
+    - Set it per controller, for example with C(module_defaults), for a
+      vNetC that is known to reject compressed requests.
+    required: false
+    type: str
+  connect_timeout:
+    default: 10
+    description:
+    - Seconds to wait for a connection to the vNetC to be established.
+    required: false
+    type: float
+  deadline:
+    description:
+    - Overall time budget, in seconds, for the task. Authentication, every
+      API call and every retry share it.
+    - The connect and read timeouts of each call are shortened to the time
+      left, and no retry is started that could not finish before it.
+    - Unlimited when not set.
+    required: false
+    type: float
+  http_backend:
+    choices:
+    - builtin
+    - requests
+    default: builtin
+    description:
+    - HTTP client used to talk to the vNetC.
+    - C(builtin) uses the Python standard library and needs no extra package.
+    - C(requests) uses the C(requests) library, which must be installed, for
+      example to go through the proxy set in C(HTTPS_PROXY).
+    - Ignored over the be_networks.verity.verity httpapi connection.
+    required: false
+    type: str
+  keep_alive:
+    default: true
+    description:
+    - Keep connections to the vNetC open between API calls of the same run.
+    - Set to C(false) to close the connection after every call.
+    required: false
+    type: bool
+  max_attempts:
+    default: 4
+    description:
+    - Maximum number of times an API call is sent when it fails with a
+      connection error or with HTTP 429, 502, 503 or 504.
+    - Waits between attempts grow exponentially with random jitter, unless
+      the vNetC asks for a specific delay with a C(Retry-After) header,
+      which is honoured up to 60 seconds.
+    - Independently of this setting, a token rejected with HTTP 401 is
+      replaced once by authenticating again with I(username) and
+      I(password) when they are given.
+    required: false
+    type: int
+  password:
+    description:
+    - Password, used to authenticate when no I(token) is given.
+    required: false
+    type: str
+  pool_maxsize:
+    default: 10
+    description:
+    - Maximum number of connections kept open to the vNetC by the pooled session.
+    required: false
+    type: int
+  read_timeout:
+    default: 60
+    description:
+    - Seconds to wait for the vNetC to send data once connected.
+    required: false
+    type: float
+  retry_backoff:
+    default: 0.5
+    description:
+    - Base delay, in seconds, of the exponential backoff between attempts.
+    required: false
+    type: float
+  token:
+    description:
+    - API token, as returned by M(be_networks.verity.verity_auth).
+    - When neither I(token) nor the httpapi connection is used, the module
+      authenticates with I(username) and I(password).
+    required: false
+    type: str
+  token_cache:
+    default: true
+    description:
+    - When authenticating with I(username) and I(password), reuse a token
+      from the cache in I(cache_dir) and store newly obtained tokens there.
+    - The cache is shared with the P(be_networks.verity.verity_token#cache)
+      cache plugin and with every task and play on the same host, so the
+      vNetC only sees one authentication per user until the token expires.
+    - Entries are keyed by O(base_url), O(username) and a salted
+      fingerprint of O(password), so a cached token is only reused by
+      tasks giving the same password.
+    - B(The tokens are stored unencrypted), in files readable by the owner
+      only. Anyone able to read O(cache_dir) as that user can use them
+      until they expire. Set to V(false) on hosts shared with untrusted
+      users of the same account.
+    required: false
+    type: bool
+  token_cache_ttl:
+    default: 1800
+    description:
+    - Seconds a cached token is reused before a new one is requested.
+    required: false
+    type: int
+  username:
+    description:
+    - Username, used to authenticate when no I(token) is given.
+    required: false
+    type: str
+  validate_certs:
+    default: true
+    description:
+    - Validate the vNetC TLS certificate.
+    required: false
+    type: bool
+'''
+
+    # Options of the modules applying resource operations
+    RESOURCE = r'''
+notes:
+- In check mode, nothing is written to the vNetC. The current objects are
+  read and C(changed) tells whether the task would change them, as with
+  O(state), a create or update being compared like O(state=present) and a
+  delete like O(state=absent).
+- With C(--diff), tasks that compare objects, those with O(state) or in
+  check mode, return one before and after C(diff) per object that changes.
+options:
+  action:
+    choices:
+    - create
+    - update
+    - delete
+    - get
+    default: create
+    description:
+    - Operation to perform. C(create) sends a PUT, C(update) a PATCH and
+      C(delete) a DELETE.
+    - 'C(get) reads objects, never reports a change, and returns them in
+      C(response) as C({<object>: {<name>: {<field>: <value>}}}). See
+      O(names) and O(fields).'
+    required: false
+    type: str
+  snapshot_cache:
+    default: false
+    description:
+    - Read the objects returned by O(action=get), and the current objects
+      compared by O(state) and by check mode, from a snapshot of the whole
+      resource cached in O(cache_dir), instead of from the vNetC.
+    - The first task that needs a resource of a vNetC reads it all once,
+      while tasks in other forks wait for it, and the other tasks use the
+      snapshot until it expires. A plan of thousands of objects then costs
+      one GET per resource.
+    - A write by a task with this option drops the snapshot of its
+      resource. Writes from elsewhere are only seen once the snapshot
+      expires, so keep O(snapshot_cache_ttl) short, and prefer it for check
+      mode runs.
+    required: false
+    type: bool
+  snapshot_cache_size:
+    default: 256
+    description:
+    - Size in MiB, compressed, of the snapshots in O(cache_dir) above which
+      the least recently used ones are evicted when a snapshot is stored.
+    - V(0) keeps every snapshot until it expires.
+    required: false
+    type: int
+  snapshot_cache_ttl:
+    default: 300
+    description:
+    - Seconds a snapshot is used before the resource is read again.
+    required: false
+    type: int
+  state:
+    choices:
+    - present
+    - absent
+    description:
+    - Desired state of the objects, which makes the task idempotent. When
+      set, O(action) is ignored.
+    - The current objects are read from the vNetC first and C(changed) is
+      only reported when something had to be sent.
+    - C(present) creates the objects of O(data) that do not exist, with a
+      PUT, and sends a PATCH with only the fields that differ for the
+      others. Fields that O(data) does not set are left as they are.
+      Entries of list fields keyed by C(index), such as C(eths), are
+      compared one by one and only the added and changed ones are sent.
+      Entries with index C(0), the way to add one, are matched with an
+      existing entry of the same fields. Entries that O(data) does not
+      describe are left as they are, and an empty list, which removes
+      nothing, gives a warning. Other lists are sent whole when they
+      differ. Nothing is sent when every object is already as described.
+    - C(absent) deletes the objects named by O(names), or else by O(data)
+      or by the C(<object>_name) of O(params), that exist.
+    - When not set, O(action) is sent as is and always reports a change.
+    required: false
+    type: str
+  validate_data:
+    default: true
+    description:
+    - Check O(data) against the fields documented by the module before
+      anything is sent, with O(action=create), O(action=update) or
+      O(state=present). Unknown fields, values of the wrong type and values
+      outside of the documented choices fail the task, listing every
+      problem found in C(errors).
+    - Values are converted to their documented type, for example C("10") to
+      C(10) for an integer field, and objects created get the documented
+      default of the fields they do not set.
+    - Set to V(false) to send O(data) as is, for example for fields this
+      version of the collection does not know yet.
+    required: false
+    type: bool
+'''
+
+    # Options of the resource modules selecting what action=get returns
+    READ = r'''
+options:
+  fields:
+    description:
+    - With O(action=get), only return these attributes of each object, for
+      example C([pod, rack]) for switchpoints.
+    - The other attributes are dropped while the response is read, so large
+      collections can be read without holding whole objects.
+    - All attributes are returned when not set.
+    elements: str
+    required: false
+    type: list
+  names:
+    description:
+    - With O(action=get), only return the objects with these names.
+    - They are sent to the vNetC as the C(<object>_name) query parameter,
+      for example C(tenant_name), and also filtered on the response.
+    - All objects are returned when not set.
+    elements: str
+    required: false
+    type: list
+'''
@@ -0,0 +1,170 @@
+# verity.py - HttpApi plugin for the Verity vNetC API.
+# Copyright: (c) 2025, BeyondEdge Networks <you@example.com>
+# GNU General Public License v3.0+
+
+from __future__ import absolute_import, annotations, division, print_function
+
+__metaclass__ = type  # pylint: disable=C0103
+
+DOCUMENTATION = """
+    name: verity
+    author: BeyondEdge Networks (@yourhandle)
+    version_added: "1.1.0"
+    short_description: HttpApi plugin for the Verity vNetC API.
+    description:
+      - Keeps one authenticated, keep-alive HTTPS session per vNetC open for
+        the whole play and relays the calls of the Verity modules through it.
+      - Authentication happens once, when the persistent connection starts,
+        using C(ansible_user) and C(ansible_httpapi_pass). A token can be
+        supplied instead through C(ansible_httpapi_session_key).
+      - The session is re-authenticated transparently when the vNetC answers
+        a call with HTTP 401.
+    requirements:
+      - The ansible.netcommon collection, version 2.0.0 or later, which is
+        not installed with this collection.
+    notes:
+      - Use with C(ansible_connection=ansible.netcommon.httpapi) and
+        C(ansible_network_os=be_networks.verity.verity).
+      - The modules only need ansible.netcommon when run over this
+        connection.
+"""
+
+EXAMPLES = """
+# inventory
+# [vnetc]
+# vnc-address.com
+#
+# [vnetc:vars]
+# ansible_connection=ansible.netcommon.httpapi
+# ansible_network_os=be_networks.verity.verity
+# ansible_httpapi_use_ssl=true
+# ansible_user=admin
+# ansible_httpapi_pass=******
+
+- name: Create Pod over the persistent connection
+  be_networks.verity.pods:
+    action: create
+    data:
+      pod:
+        TestPod:
+          enable: true
+"""
+
+from typing import Any, Dict, Optional
+
+from ansible.errors import AnsibleAuthenticationFailure  # type: ignore
+from ansible_collections.ansible.netcommon.plugins.plugin_utils.httpapi_base import (  # type: ignore
+    HttpApiBase,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_api import (
+    build_headers,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_transport import (
+    TransportError,
+    get_session,
+    send_json,
+)
+
+
+class HttpApi(HttpApiBase):  # type: ignore[misc]
+    """
+    HttpApi plugin: verity
+    Persistent, authenticated session to a Verity vNetC.
+    """
+
+    def _session(self) -> Any:
+        """Return the keep-alive session owned by this persistent connection."""
+        return get_session(
+            self.connection._url,
+            validate_certs=self.connection.get_option("validate_certs"),
+        )
+
+    def _timeout(self) -> int:
+        return self.connection.get_option("persistent_command_timeout")
+
+    def login(self, username: str, password: str) -> None:
+        """
+        Authenticate against ``/api/auth`` and keep the token for the session.
+
+        Args:
+            username: vNetC username.
+            password: vNetC password.
+
+        Raises:
+            AnsibleAuthenticationFailure: If the vNetC does not return a token.
+        """
+        payload = {"auth": {"username": username, "password": password}}
+        try:
+            response = send_json(
+                self._session(),
+                "POST",
+                f"{self.connection._url}/api/auth",
+                {"Content-Type": "application/json"},
+                data=payload,
+                timeout=self._timeout(),
+            )
+        except TransportError as e:
+            raise AnsibleAuthenticationFailure(f"Authentication to {self.connection._url} failed: {e}")
+        resp_data = response.data()
+        token = resp_data.get("token") if isinstance(resp_data, dict) else None
+        if response.status != 200 or not token:
+            raise AnsibleAuthenticationFailure(
+                f"Authentication to {self.connection._url} failed with HTTP {response.status}",
+            )
+        self.connection._auth = build_headers(token)
+
+    def update_auth(self, response: Any, response_text: Any) -> None:
+        """The token from login() stays valid for the session; nothing to update."""
+        return None
+
+    def send_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Any] = None,
+        compression: str = "auto",
+    ) -> Dict[str, Any]:
+        """
+        Send one API call on behalf of a module.
+
+        Args:
+            method: HTTP method.
+            path: API path relative to ``/api``, e.g. ``/pods``.
+            params: Query string parameters.
+            data: JSON body.
+            timeout: Timeout or (connect, read) timeouts chosen by the module,
+                defaults to the persistent command timeout.
+            compression: Body compression mode chosen by the module.
+
+        Returns:
+            dict: ``status``, ``headers`` and ``body`` of the response.
+        """
+        # Logs in on first use, like the methods of the connection itself
+        self.connection._connect()
+        if isinstance(timeout, list):
+            # (connect, read) arrives as a list after the JSON-RPC round trip
+            timeout = tuple(timeout)
+
+        response = None
+        for _attempt in range(2):
+            response = send_json(
+                self._session(),
+                method,
+                f"{self.connection._url}/api{path}",
+                self.connection._auth,
+                params=params,
+                data=data,
+                timeout=timeout or self._timeout(),
+                compression=compression,
+            )
+            if response.status != 401:
+                break
+            # Token expired on the controller side, authenticate again once
+            self.login(
+                self.connection.get_option("remote_user"),
+                self.connection.get_option("password"),
+            )
+
+        return dict(status=response.status, headers=response.headers, body=response.body)
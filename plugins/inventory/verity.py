@@ -0,0 +1,252 @@
+# verity.py - Inventory plugin building hosts from the Verity switchpoints.
+# Copyright: (c) 2025, BeyondEdge Networks <you@example.com>
+# GNU General Public License v3.0+
+
+from __future__ import absolute_import, annotations, division, print_function
+
+__metaclass__ = type  # pylint: disable=C0103
+
+DOCUMENTATION = """
+    name: verity
+    author: BeyondEdge Networks (@yourhandle)
+    version_added: "1.1.0"
+    short_description: Verity switchpoints as inventory hosts.
+    description:
+      - Reads the switchpoints of a vNetC and adds one host per switchpoint,
+        named after it, to the C(verity_switchpoints) group and to groups by
+        pod, super pod, rack, type and badge, see O(group_by).
+      - The attributes of each switchpoint are set as host variables named
+        after them with a C(verity_) prefix, for example C(verity_pod), so
+        that O(compose), O(groups) and O(keyed_groups) can use them.
+      - With O(devicecontrollers), C(ansible_host) is set from the switch
+        address of the device controller of each switchpoint.
+      - Uses a YAML configuration file whose name ends with C(verity.yml) or
+        C(verity.yaml).
+      - With O(cache), the switchpoints are read once per O(cache_timeout)
+        and kept by the configured inventory cache plugin.
+    extends_documentation_fragment:
+      - constructed
+      - inventory_cache
+    options:
+      plugin:
+        description: Token that ensures this is a source file for this plugin.
+        required: true
+        choices: ['be_networks.verity.verity']
+      base_url:
+        description: Base URL of the vNetC, for example C(https://vnc-address.com).
+        required: true
+        type: str
+        env:
+          - name: VERITY_BASE_URL
+      username:
+        description: API username, used with O(password) unless O(token) is set.
+        type: str
+        env:
+          - name: VERITY_USERNAME
+      password:
+        description: API password.
+        type: str
+        env:
+          - name: VERITY_PASSWORD
+      token:
+        description: API token, used instead of O(username) and O(password).
+        type: str
+        env:
+          - name: VERITY_TOKEN
+      validate_certs:
+        description: Verify the TLS certificate of the vNetC.
+        type: bool
+        default: true
+      changeset_name:
+        description: Read the switchpoints as seen from this changeset.
+        type: str
+      cache_dir:
+        description:
+          - Directory of the API token cache shared with the modules.
+          - Defaults to C(~/.ansible/verity).
+        type: path
+        env:
+          - name: VERITY_CACHE_DIR
+      devicecontrollers:
+        description:
+          - Also read the device controllers and set C(ansible_host) and
+            C(verity_device_controller) on the switchpoint each one manages.
+          - C(ansible_host) is the address of C(switch_ip_and_mask), when the
+            device controller sets it.
+        type: bool
+        default: false
+      fields:
+        description:
+          - Only keep these switchpoint attributes as host variables, which
+            makes large fabrics quicker to cache and load. The attributes
+            O(group_by) needs are always read.
+          - All attributes are kept when not set.
+        type: list
+        elements: str
+      group_by:
+        description:
+          - Switchpoint attributes to add groups for, named
+            C(verity_<attribute>_<value>), for example C(verity_pod_pod1) or
+            C(verity_type_spine). C(badge) adds one group per badge of the
+            switchpoint.
+          - Switchpoints do not reference a site; use O(keyed_groups) on any
+            other attribute.
+        type: list
+        elements: str
+        choices: ['pod', 'super_pod', 'rack', 'type', 'badge']
+        default: ['pod', 'super_pod', 'type', 'badge']
+"""
+
+EXAMPLES = """
+# verity.yml
+plugin: be_networks.verity.verity
+base_url: https://vnc-address.com
+username: admin
+# password from the VERITY_PASSWORD environment variable
+devicecontrollers: true
+fields: [pod, super_pod, rack, type, badges, device_serial_number]
+cache: true
+# compressed entries, with a size cap
+cache_plugin: be_networks.verity.verity_objects
+cache_timeout: 3600
+keyed_groups:
+  - key: verity_rack
+    prefix: rack
+compose:
+  serial_number: verity_device_serial_number
+"""
+
+from typing import Any, Dict, List, Optional
+
+from ansible.errors import AnsibleError, AnsibleParserError  # type: ignore
+from ansible.plugins.inventory import (  # type: ignore
+    BaseInventoryPlugin,
+    Cacheable,
+    Constructable,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_client import (
+    VerityClient,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_resource import (
+    read_resource,
+)
+from ansible_collections.be_networks.verity.plugins.plugin_utils.verity_action import (
+    ModuleExit,
+    plugin_client,
+)
+
+# Plugin options passed to VerityClient as the module options of the same name
+CLIENT_OPTIONS = ("base_url", "username", "password", "token", "validate_certs", "changeset_name",
+                  "cache_dir")
+# Switchpoint attribute read for each group_by choice
+GROUP_FIELDS = {"pod": "pod", "super_pod": "super_pod", "rack": "rack", "type": "type", "badge": "badges"}
+PREFIX = "verity_"
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):  # type: ignore[misc]
+    """
+    Inventory plugin: verity
+    One host per switchpoint of the vNetC.
+    """
+
+    NAME = "be_networks.verity.verity"
+
+    def verify_file(self, path: str) -> bool:
+        return super(InventoryModule, self).verify_file(path) and path.endswith(("verity.yml", "verity.yaml"))
+
+    def _client(self) -> VerityClient:
+        try:
+            return plugin_client(self.NAME, dict((name, self.get_option(name)) for name in CLIENT_OPTIONS))
+        except AnsibleError as e:
+            raise AnsibleParserError(str(e))
+
+    def _read(self, client: VerityClient, resource: str, fields: Optional[List[str]]) -> Dict[str, Any]:
+        try:
+            result = read_resource(client, resource, f"/{resource}", fields=fields)
+        except ModuleExit as e:
+            result = e.result
+        if result.get("failed"):
+            raise AnsibleParserError(result["msg"])
+        return result["response"]
+
+    def fetch(self) -> Dict[str, Any]:
+        """
+        Read the switchpoints, and the device controllers if asked, from the vNetC.
+
+        Returns:
+            dict: ``{"switchpoint": {name: object}, "device_controller": {name: object}}``.
+        """
+        client = self._client()
+        fields = self.get_option("fields")
+        if fields:
+            fields = sorted(set(fields) | set(GROUP_FIELDS[group] for group in self.get_option("group_by")))
+        objects = dict(switchpoint=self._read(client, "switchpoints", fields).get("switchpoint") or {})
+        if self.get_option("devicecontrollers"):
+            controllers = self._read(client, "devicecontrollers", ["switchpoint", "switch_ip_and_mask"])
+            objects["device_controller"] = controllers.get("device_controller") or {}
+        return objects
+
+    def _group(self, attribute: str, value: Any, host: str) -> None:
+        if value in (None, ""):
+            return
+        group = self.inventory.add_group(self._sanitize_group_name(f"{PREFIX}{attribute}_{value}"))
+        self.inventory.add_child(group, host)
+
+    def populate(self, objects: Dict[str, Any]) -> None:
+        """
+        Add the hosts and groups of the objects returned by :meth:`fetch`.
+
+        Args:
+            objects: Switchpoints and device controllers by name.
+        """
+        self.inventory.add_group(f"{PREFIX}switchpoints")
+        controllers = {}
+        for name, controller in (objects.get("device_controller") or {}).items():
+            if isinstance(controller, dict) and controller.get("switchpoint"):
+                controllers[controller["switchpoint"]] = (name, controller)
+
+        strict = self.get_option("strict")
+        for name, switchpoint in (objects.get("switchpoint") or {}).items():
+            if not isinstance(switchpoint, dict):
+                continue
+            host = self.inventory.add_host(name, group=f"{PREFIX}switchpoints")
+            for attribute, value in switchpoint.items():
+                self.inventory.set_variable(host, PREFIX + attribute, value)
+            if name in controllers:
+                controller_name, controller = controllers[name]
+                self.inventory.set_variable(host, f"{PREFIX}device_controller", controller_name)
+                address = (controller.get("switch_ip_and_mask") or "").split("/")[0]
+                if address:
+                    self.inventory.set_variable(host, "ansible_host", address)
+
+            for group in self.get_option("group_by"):
+                if group == "badge":
+                    for badge in switchpoint.get("badges") or ():
+                        if isinstance(badge, dict):
+                            self._group(group, badge.get("badge"), host)
+                else:
+                    self._group(group, switchpoint.get(GROUP_FIELDS[group]), host)
+
+            hostvars = self.inventory.get_host(host).get_vars()
+            self._set_composite_vars(self.get_option("compose"), hostvars, host, strict=strict)
+            self._add_host_to_composed_groups(self.get_option("groups"), hostvars, host, strict=strict)
+            self._add_host_to_keyed_groups(self.get_option("keyed_groups"), hostvars, host, strict=strict)
+
+    def parse(self, inventory: Any, loader: Any, path: str, cache: bool = True) -> None:
+        super(InventoryModule, self).parse(inventory, loader, path, cache)
+        self._read_config_data(path)
+
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option("cache") and cache
+        update_cache = self.get_option("cache") and not cache
+        objects = None
+        if use_cache:
+            try:
+                objects = self._cache[cache_key]
+            except KeyError:
+                update_cache = True
+        if objects is None:
+            objects = self.fetch()
+        if update_cache:
+            self._cache[cache_key] = objects
+        self.populate(objects)
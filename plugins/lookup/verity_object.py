@@ -0,0 +1,244 @@
+# verity_object.py - Lookup plugin reading objects from the Verity vNetC.
+# Copyright: (c) 2025, BeyondEdge Networks <you@example.com>
+# GNU General Public License v3.0+
+
+from __future__ import absolute_import, annotations, division, print_function
+
+__metaclass__ = type  # pylint: disable=C0103
+
+DOCUMENTATION = """
+    name: verity_object
+    author: BeyondEdge Networks (@yourhandle)
+    version_added: "1.1.0"
+    short_description: Read objects of a Verity resource.
+    description:
+      - Returns the objects of a vNetC resource named by the terms, one per
+        name, in the order of the names.
+      - All the names of one lookup are read with a single GET. Objects are
+        remembered by the worker process of the task, so later lookups of
+        the same objects in that task, for example in a loop over every port
+        of a host, send nothing.
+      - Each task of each host runs in a fork of its own, which forgets those
+        objects when the task ends. To share reads between tasks and hosts,
+        set O(snapshot_cache); the whole resource is then read once into the
+        snapshot cache shared with the modules, and lookups read it from
+        there until it expires.
+    options:
+      _terms:
+        description:
+          - The resource, as named by its module, such as C(services) or
+            C(tenants), followed by the names of its objects.
+        required: true
+        type: list
+        elements: str
+      base_url:
+        description: Base URL of the vNetC, for example C(https://vnc-address.com).
+        required: true
+        type: str
+        env:
+          - name: VERITY_BASE_URL
+        vars:
+          - name: verity_base_url
+      username:
+        description: API username, used with O(password) unless O(token) is set.
+        type: str
+        env:
+          - name: VERITY_USERNAME
+        vars:
+          - name: verity_username
+      password:
+        description: API password.
+        type: str
+        env:
+          - name: VERITY_PASSWORD
+        vars:
+          - name: verity_password
+      token:
+        description: API token, used instead of O(username) and O(password).
+        type: str
+        env:
+          - name: VERITY_TOKEN
+        vars:
+          - name: verity_token
+      validate_certs:
+        description: Verify the TLS certificate of the vNetC.
+        type: bool
+        default: true
+        vars:
+          - name: verity_validate_certs
+      changeset_name:
+        description: Read the objects as seen from this changeset.
+        type: str
+        vars:
+          - name: verity_changeset_name
+      cache_dir:
+        description:
+          - Directory of the API token and snapshot caches shared with the
+            modules.
+          - Defaults to C(~/.ansible/verity).
+        type: path
+        env:
+          - name: VERITY_CACHE_DIR
+      fields:
+        description:
+          - Only return these attributes of each object.
+          - All attributes are returned when not set.
+        type: list
+        elements: str
+      on_missing:
+        description:
+          - What to do with names that have no object.
+          - V(error) fails the lookup, V(warn) warns and V(skip) silently
+            leaves them out of the result.
+        type: str
+        choices: ['error', 'warn', 'skip']
+        default: error
+      snapshot_cache:
+        description:
+          - Read the objects from a snapshot of the whole resource cached in
+            O(cache_dir), reading it from the vNetC first if there is none,
+            see the I(snapshot_cache) option of the modules.
+          - Writes by modules with I(snapshot_cache) drop the snapshot of
+            their resource; other changes are only seen once it expires.
+        type: bool
+        default: false
+        env:
+          - name: VERITY_SNAPSHOT_CACHE
+        vars:
+          - name: verity_snapshot_cache
+      snapshot_cache_ttl:
+        description: Seconds a snapshot is used before the resource is read again.
+        type: int
+        default: 300
+        env:
+          - name: VERITY_SNAPSHOT_CACHE_TTL
+"""
+
+EXAMPLES = """
+- name: Show two services
+  ansible.builtin.debug:
+    msg: "{{ query('be_networks.verity.verity_object', 'services', 'svc1', 'svc2',
+             base_url='https://vnc-address.com', fields=['vlan', 'vni']) }}"
+
+- name: VLAN of the service of each port, one GET for the whole play
+  vars:
+    verity_base_url: https://vnc-address.com
+    verity_snapshot_cache: true
+  ansible.builtin.debug:
+    msg: "{{ lookup('be_networks.verity.verity_object', 'services', item.service)['vlan'] }}"
+  loop: "{{ ports }}"
+"""
+
+RETURN = """
+_list:
+  description: The objects, one per name found, in the order of the names.
+  type: list
+  elements: dict
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from ansible.errors import AnsibleError  # type: ignore
+from ansible.plugins.lookup import LookupBase  # type: ignore
+from ansible.utils.display import Display  # type: ignore
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_resource import (
+    RESOURCES,
+    read_resource,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_snapshot import (
+    SnapshotCache,
+)
+from ansible_collections.be_networks.verity.plugins.plugin_utils.verity_action import (
+    ModuleExit,
+    plugin_client,
+)
+
+display = Display()
+
+# Lookup options passed to VerityClient as the module options of the same name
+CLIENT_OPTIONS = ("base_url", "username", "password", "token", "validate_certs", "changeset_name",
+                  "cache_dir")
+
+# (controller, changeset, resource) -> name -> object, or None for names
+# the vNetC has no object for; kept for the life of the worker process,
+# which runs a single task
+_OBJECTS: Dict[Tuple[str, Optional[str], str], Dict[str, Any]] = {}
+
+
+class LookupModule(LookupBase):  # type: ignore[misc]
+    """
+    Lookup plugin: verity_object
+    Objects of a Verity resource, read in one GET per lookup and memoized.
+    """
+
+    NAME = "be_networks.verity.verity_object"
+
+    def _read(self, resource: str, names: List[str]) -> Dict[str, Any]:
+        client = plugin_client(self.NAME, dict((name, self.get_option(name)) for name in CLIENT_OPTIONS))
+        snapshots = None
+        if self.get_option("snapshot_cache"):
+            snapshots = SnapshotCache(self.get_option("cache_dir"), self.get_option("snapshot_cache_ttl"))
+        try:
+            result = read_resource(client, resource, RESOURCES[resource]["path"], names=names,
+                                   snapshots=snapshots)
+        except ModuleExit as e:
+            result = e.result
+        if result.get("failed") and result.get("status") != 404:
+            raise AnsibleError(f"{self.NAME}: {result['msg']}")
+        # By name, whatever their object type, as acls answer with ipv4_filter
+        # and ipv6_filter objects
+        found = {}
+        for objects in (result.get("response") or {}).values():
+            if isinstance(objects, dict):
+                found.update(objects)
+        return found
+
+    def run(
+        self,
+        terms: List[str],
+        variables: Optional[Dict[str, Any]] = None,
+        **kwargs: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the objects named by the terms.
+
+        Args:
+            terms: The resource, then the names of its objects.
+            variables: Variables, read for the options with vars.
+            **kwargs: Options.
+
+        Returns:
+            list: The objects, one per name found.
+
+        Raises:
+            AnsibleError: If the resource is unknown, the vNetC cannot be
+                read, or a name has no object and on_missing is error.
+        """
+        self.set_options(var_options=variables, direct=kwargs)
+        if not terms or terms[0] not in RESOURCES:
+            raise AnsibleError(f"{self.NAME}: the first term must be one of {', '.join(sorted(RESOURCES))}")
+        resource, names = terms[0], [str(name) for name in terms[1:]]
+
+        objects = _OBJECTS.setdefault(
+            ((self.get_option("base_url") or "").rstrip("/"), self.get_option("changeset_name"), resource), {})
+        missing = sorted(set(name for name in names if name not in objects))
+        if missing:
+            display.vvv(f"{self.NAME}: reading {len(missing)} {resource} object(s)")
+            found = self._read(resource, missing)
+            for name in missing:
+                objects[name] = found.get(name)
+
+        fields = self.get_option("fields")
+        results = []
+        for name in names:
+            obj = objects[name]
+            if obj is None:
+                if self.get_option("on_missing") == "error":
+                    raise AnsibleError(f"{self.NAME}: no {resource} object named {name}")
+                if self.get_option("on_missing") == "warn":
+                    display.warning(f"{self.NAME}: no {resource} object named {name}")
+                continue
+            if fields and isinstance(obj, dict):
+                obj = dict((field, obj[field]) for field in fields if field in obj)
+            results.append(obj)
+        return results
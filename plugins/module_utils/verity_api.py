@@ -1,34 +1,42 @@
 # -*- coding: utf-8 -*-
 # Common utilities for Verity API modules
 
-from ansible.module_utils.urls import open_url
-import json
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_cache import (
+    DEFAULT_LOCK_TIMEOUT,
+    DEFAULT_TOKEN_TTL,
+    TokenCache,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_transport import (
+    TransportError,
+    module_session,
+    module_timeouts,
+    send_json,
+)
 
 
-def authenticate(module, base_url, username, password):
+def authenticate(module, base_url, username, password, timeout=None):
     """
     Authenticate against the Verity API and return a token string.
+    The request goes through the pooled session, so the API calls that
+    follow reuse its connection.
+    - timeout: (connect, read) timeouts, defaults to the module options
     """
     url = f"{base_url}/api/auth"
     headers = {"Content-Type": "application/json"}
     payload = {"auth": {"username": username, "password": password}}
 
     try:
-        response = open_url(
-            url,
-            method="POST",
-            headers=headers,
-            data=json.dumps(payload),
-            validate_certs=not module.params.get("validate_certs", True),
-            timeout=30,
-        )
-        resp_data = json.loads(response.read())
-        token = resp_data.get("token")
-        if not token:
-            module.fail_json(msg="Authentication succeeded but no token returned", response=resp_data)
-        return token
-    except Exception as e:
+        response = send_json(module_session(module, base_url), "POST", url, headers, data=payload,
+                             timeout=timeout or module_timeouts(module))
+    except TransportError as e:
         module.fail_json(msg=f"Authentication failed: {str(e)}")
+    resp_data = response.data()
+    if not response.ok:
+        module.fail_json(msg=f"Authentication failed with HTTP {response.status}", response=resp_data)
+    token = resp_data.get("token") if isinstance(resp_data, dict) else None
+    if not token:
+        module.fail_json(msg="Authentication succeeded but no token returned", response=resp_data)
+    return token
 
 
 def build_headers(token):
@@ -36,3 +44,41 @@ def build_headers(token):
     Build standard headers for API calls.
     """
     return {"Cookie": f"ivn_api={token}", "Content-Type": "application/json"}
+
+
+def get_token(module, base_url, username, password, timeout=None, wait=DEFAULT_LOCK_TIMEOUT):
+    """
+    Return a token for username on base_url. With token_cache enabled the
+    token is shared through the on-disk TokenCache and only requested
+    again once it expires; concurrent forks needing a new token wait up
+    to wait seconds for the one that requests it. Cached tokens are keyed
+    by a fingerprint of password too, so a wrong password is always sent
+    to the vNetC, and rejected there.
+    """
+    if not module.params.get("token_cache"):
+        return authenticate(module, base_url, username, password, timeout)
+
+    cache = TokenCache(module.params.get("cache_dir"),
+                       module.params.get("token_cache_ttl") or DEFAULT_TOKEN_TTL)
+    key = TokenCache.key(base_url, username, password)
+    try:
+        # Single flight: concurrent forks wait for one /api/auth call
+        token = cache.get_or_create(key, lambda: authenticate(module, base_url, username, password, timeout),
+                                    timeout=wait)
+    except OSError as e:
+        module.warn(f"Could not use the token cache: {str(e)}")
+        token = authenticate(module, base_url, username, password, timeout)
+    return token
+
+
+def discard_token(module, base_url, username, password, token):
+    """
+    Forget a cached token that the vNetC has rejected.
+    """
+    if not module.params.get("token_cache"):
+        return
+    cache = TokenCache(module.params.get("cache_dir"))
+    try:
+        cache.discard(TokenCache.key(base_url, username, password), token)
+    except OSError as e:
+        module.warn(f"Could not update the token cache: {str(e)}")
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# Several resource operations in one module run
+
+import threading
+import time
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_client import (
+    VerityApiError,
+    VerityClient,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_parallel import (
+    DEFAULT_MAX_WORKERS,
+    run_parallel,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_resource import (
+    ACTION_METHODS,
+    MODULE_ARGS,
+    RESOURCES,
+    apply_resource,
+    data_errors,
+    resource_snapshots,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_scheduler import (
+    plan_waves,
+)
+
+BATCH_ARGS = dict(
+        {name: spec for name, spec in MODULE_ARGS.items()
+         if name not in ("data", "params", "names", "fields")},
+        operations=dict(type="list", elements="dict", required=True, options=dict(
+            resource=dict(type="str", required=True, choices=sorted(RESOURCES)),
+            action=dict(type="str", choices=list(ACTION_METHODS)),
+            state=dict(type="str", choices=["present", "absent"]),
+            data=dict(type="dict"),
+            params=dict(type="dict"),
+            names=dict(type="list", elements="str"),
+            fields=dict(type="list", elements="str"),
+        )),
+        stop_on_error=dict(type="bool", default=True),
+        max_workers=dict(type="int", default=DEFAULT_MAX_WORKERS),
+        rate_limit=dict(type="float", required=False),
+        order=dict(type="str", choices=["input", "dependency"], default="input"),
+)
+
+
+def run_operations(client, operations, default_action="create", stop_on_error=True,
+                   max_workers=DEFAULT_MAX_WORKERS, waves=None, default_state=None, options=None):
+    """
+    Apply operations through client and return one result per operation,
+    in input order, with its resource, action (or state) and elapsed
+    seconds. options are keyword arguments of apply_resource shared by
+    every operation: check_mode, diff, snapshots and validate.
+    With max_workers above 1 the operations run concurrently, so they must
+    not depend on each other, unless waves (lists of operation indexes,
+    see plan_waves) are given: waves then run one after the other, each
+    one concurrently. Once an operation failed, those not started yet are
+    skipped if stop_on_error.
+    """
+    stop = threading.Event()
+
+    def run_one(index):
+        operation = operations[index]
+        resource = operation["resource"]
+        action = operation.get("action") or default_action
+        state = operation.get("state") or default_state
+        result = dict(resource=resource, action=action)
+        if state:
+            result["state"] = state
+        if stop.is_set():
+            result.update(changed=False, skipped=True)
+            return result
+
+        started = time.monotonic()
+        result.update(apply_resource(client, resource, RESOURCES[resource]["path"], action,
+                                     data=operation.get("data"), params=operation.get("params"),
+                                     names=operation.get("names"), fields=operation.get("fields"),
+                                     state=state, **(options or {})))
+        result["elapsed"] = round(time.monotonic() - started, 3)
+        result.setdefault("changed", False)
+        if result.get("failed") and stop_on_error:
+            stop.set()
+        return result
+
+    results = [None] * len(operations)
+    for number, wave in enumerate(waves or [range(len(operations))]):
+        for index, result in zip(wave, run_parallel(run_one, wave, max_workers)):
+            if waves:
+                result["wave"] = number
+            results[index] = result
+    return results
+
+
+def run_batch(module):
+    """
+    Runner of the verity_batch module: all operations share one
+    authenticated client, and so one token and one connection pool.
+    """
+    started = time.monotonic()
+    if (module.params["rate_limit"] or 0) < 0:
+        module.fail_json(msg="rate_limit must be 0 or more")
+    try:
+        client = VerityClient(module)
+    except VerityApiError as e:
+        module.fail_json(msg=f"verity_batch failed: {str(e)}")
+
+    operations = module.params["operations"]
+    if module.params["validate_data"]:
+        # Nothing is sent unless the data of every operation is valid
+        errors = [f"operations[{index}].{error}" for index, operation in enumerate(operations)
+                  for error in data_errors(operation["resource"],
+                                           operation.get("action") or module.params["action"],
+                                           operation.get("state") or module.params["state"],
+                                           operation.get("data"))]
+        if errors:
+            module.fail_json(msg=f"verity_batch data is invalid: {'; '.join(errors)}", errors=errors)
+    waves = None
+    if module.params["order"] == "dependency":
+        waves, cyclic = plan_waves(operations, module.params["action"], module.params["state"])
+        if cyclic:
+            module.warn(f"Operations {', '.join(str(index) for index in cyclic)} are part of a reference "
+                        "cycle; each was sent on its own, before objects it references")
+    options = dict(check_mode=module.check_mode,
+                   diff=module._diff, snapshots=resource_snapshots(module, memory=True),
+                   validate=module.params["validate_data"])
+    results = run_operations(client, operations, module.params["action"],
+                             module.params["stop_on_error"], module.params["max_workers"], waves,
+                             module.params["state"], options)
+    result = dict(
+        changed=any(r["changed"] for r in results),
+        results=results,
+        elapsed=round(time.monotonic() - started, 3),
+    )
+    if module._diff:
+        result["diff"] = [entry for r in results for entry in r.get("diff", ())]
+    failures = [r for r in results if r.get("failed")]
+    if failures:
+        module.fail_json(msg=f"{len(failures)} of {len(results)} operations failed, first: {failures[0]['msg']}",
+                         **result)
+    module.exit_json(**result)
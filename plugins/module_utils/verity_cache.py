@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# On-disk caches shared by the Verity modules and controller-side plugins
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+DEFAULT_CACHE_DIR = "~/.ansible/verity"
+DEFAULT_TOKEN_TTL = 1800
+DEFAULT_LOCK_TIMEOUT = 60
+
+# PBKDF2 rounds of the password fingerprint in token cache keys
+CREDENTIAL_ROUNDS = 50000
+
+
+def cache_root(cache_dir=None):
+    """
+    Return the expanded cache directory, falling back to VERITY_CACHE_DIR
+    and then to ~/.ansible/verity.
+    """
+    return os.path.expanduser(cache_dir or os.environ.get("VERITY_CACHE_DIR") or DEFAULT_CACHE_DIR)
+
+
+def atomic_write(path, text):
+    """
+    Write text to path so that concurrent readers never see a partial file.
+    Files are created readable by the owner only.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w") as fp:
+            fp.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+@contextlib.contextmanager
+def file_lock(path, timeout=DEFAULT_LOCK_TIMEOUT):
+    """
+    Hold an exclusive flock on path for the duration of the block.
+
+    Yields True once the lock is held, or False if it could not be taken
+    within timeout seconds, in which case the caller proceeds unlocked.
+    """
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                locked = True
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    locked = False
+                    break
+                time.sleep(0.05)
+        try:
+            yield locked
+        finally:
+            if locked:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+class TokenCache(object):
+    """
+    File-backed store of API tokens keyed by base_url, username and a
+    fingerprint of the password the token was obtained with.
+
+    Each entry is a separate 0600 file under <cache_dir>/tokens, so forks
+    and plays running at the same time on the controller share tokens
+    without rewriting each other's entries. Entries expire after ttl
+    seconds.
+    """
+
+    def __init__(self, cache_dir=None, ttl=DEFAULT_TOKEN_TTL):
+        self.path = os.path.join(cache_root(cache_dir), "tokens")
+        self.ttl = ttl
+
+    @staticmethod
+    def key(base_url, username, password=None):
+        """
+        Return the key of the token of username on base_url. With password,
+        the key ends with a salted PBKDF2 fingerprint of it, so that a
+        token is only handed to tasks giving the password it was obtained
+        with, and the password cannot be read back from the cache.
+        """
+        key = f"{username}@{base_url.rstrip('/')}"
+        if password is None:
+            return key
+        fingerprint = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), key.encode("utf-8"),
+                                          CREDENTIAL_ROUNDS)
+        return f"{key}#{fingerprint.hex()[:32]}"
+
+    def _file(self, key):
+        return os.path.join(self.path, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+    def _load(self, path):
+        try:
+            with open(path) as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, key):
+        """
+        Return the cached token for key, or None if missing or expired.
+        """
+        entry = self._load(self._file(key))
+        if not entry or entry.get("key") != key:
+            return None
+        if entry.get("expires", 0) <= time.time():
+            self.delete(key)
+            return None
+        return entry.get("token")
+
+    def get_or_create(self, key, factory, timeout=DEFAULT_LOCK_TIMEOUT):
+        """
+        Return the cached token for key, calling factory() to obtain and
+        store one if there is none.
+
+        Callers racing for the same key are serialised on a lock file, so
+        only the first one calls factory(); the others wait and then pick
+        up the token it stored.
+        """
+        token = self.get(key)
+        if token:
+            return token
+        lock_path = self._file(key)[:-len(".json")] + ".lock"
+        with file_lock(lock_path, timeout):
+            token = self.get(key)
+            if not token:
+                token = factory()
+                self.set(key, token)
+        return token
+
+    def set(self, key, token):
+        entry = dict(key=key, token=token, expires=time.time() + self.ttl)
+        atomic_write(self._file(key), json.dumps(entry))
+
+    def delete(self, key):
+        try:
+            os.unlink(self._file(key))
+        except FileNotFoundError:
+            pass
+
+    def discard(self, key, token):
+        """
+        Drop the entry for key if it still holds token. A fork that finds
+        its token rejected must not remove a fresh one that another fork
+        has stored in the meantime.
+        """
+        entry = self._load(self._file(key))
+        if entry and entry.get("token") == token:
+            self.delete(key)
+
+    def keys(self):
+        """
+        Return the keys of all unexpired entries.
+        """
+        try:
+            names = os.listdir(self.path)
+        except FileNotFoundError:
+            return []
+        keys = []
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            entry = self._load(os.path.join(self.path, name))
+            if entry and entry.get("expires", 0) > time.time():
+                keys.append(entry.get("key"))
+        return keys
+
+    def flush(self):
+        try:
+            names = os.listdir(self.path)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name.endswith(".json"):
+                os.unlink(os.path.join(self.path, name))
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# Authenticated, retrying access to the Verity API for one module run
+
+import threading
+import time
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_api import (
+    build_headers,
+    discard_token,
+    get_token,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_cache import (
+    DEFAULT_LOCK_TIMEOUT,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_parallel import (
+    get_bucket,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_retry import (
+    RETRY_STATUS_CODES,
+    RetryPolicy,
+    parse_retry_after,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_stream import (
+    iter_objects,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_transport import (
+    ConnectionTransport,
+    SessionTransport,
+    TransportError,
+    module_session,
+    module_timeouts,
+)
+
+
+class VerityApiError(Exception):
+    """
+    An API call failed for good: the transport kept failing until the
+    retry budget ran out, the task deadline expired, or a streamed read
+    was answered with an error status (kept in status and response).
+    """
+
+    def __init__(self, msg, status=None, response=None):
+        super(VerityApiError, self).__init__(msg)
+        self.status = status
+        self.response = response
+
+
+class VerityClient(object):
+    """
+    Sends the API calls of a module run to one vNetC.
+
+    Over the be_networks.verity.verity httpapi connection the persistent,
+    already authenticated connection is reused; otherwise the pooled
+    session is authenticated with the token or username/password.
+    Transport errors and throttling/unavailable statuses are retried
+    according to the module's retry options, and a token rejected with
+    HTTP 401 is replaced once by authenticating again. Every call,
+    including authentication, gets connect/read timeouts shortened to the
+    time left before the task deadline.
+
+    A client can be shared by threads. With the rate_limit option, the
+    calls of all clients of the process to the same vNetC share one
+    token bucket.
+    """
+
+    def __init__(self, module):
+        self.module = module
+        self.policy = RetryPolicy.from_params(module.params)
+        self.token = None
+        self._auth_lock = threading.Lock()
+        self.transport = self._connect()
+        self.controller = getattr(module, "_socket_path", None) or module.params.get("base_url")
+        self.changeset_name = module.params.get("changeset_name")
+        self.limiter = None
+        if module.params.get("rate_limit"):
+            self.limiter = get_bucket(self.controller, module.params["rate_limit"])
+
+    def _connect(self):
+        module = self.module
+        socket_path = getattr(module, "_socket_path", None)
+        compression = module.params.get("compression") or "auto"
+        if socket_path:
+            return ConnectionTransport(socket_path, compression)
+
+        base_url = module.params.get("base_url")
+        username = module.params.get("username")
+        password = module.params.get("password")
+        self.token = module.params.get("token")
+
+        if not base_url:
+            module.fail_json(msg="base_url is required unless the be_networks.verity.verity httpapi connection is used")
+        if not self.token:
+            # Fallback: authenticate with username/password
+            if not username or not password:
+                module.fail_json(msg="Either token or username/password must be provided")
+            self.token = get_token(module, base_url, username, password,
+                                   timeout=self._timeouts(), wait=self._lock_wait())
+        return SessionTransport(module_session(module), base_url, build_headers(self.token), compression)
+
+    def _timeouts(self):
+        """
+        Return the (connect, read) timeouts for the next call, shortened so
+        that it cannot outlive the task deadline.
+        """
+        connect, read = module_timeouts(self.module)
+        remaining = self.policy.remaining()
+        if remaining is None:
+            return connect, read
+        if remaining <= 0:
+            raise VerityApiError(f"Deadline of {self.policy.deadline}s exceeded")
+        return min(connect, remaining), min(read, remaining)
+
+    def _lock_wait(self):
+        """
+        Return how long to wait for another fork that is authenticating.
+        """
+        remaining = self.policy.remaining()
+        if remaining is None:
+            return DEFAULT_LOCK_TIMEOUT
+        return max(0, min(DEFAULT_LOCK_TIMEOUT, remaining))
+
+    def _can_reauthenticate(self):
+        params = self.module.params
+        return isinstance(self.transport, SessionTransport) and params.get("username") and params.get("password")
+
+    def _reauthenticate(self):
+        params = self.module.params
+        discard_token(self.module, params["base_url"], params["username"], params["password"],
+                      self.token)
+        self.token = get_token(self.module, params["base_url"], params["username"], params["password"],
+                               timeout=self._timeouts(), wait=self._lock_wait())
+        self.transport.headers = build_headers(self.token)
+
+    def request(self, method, path, params=None, data=None, stream=False):
+        """
+        Send one API call and return its VerityResponse, whatever its status.
+        Raises VerityApiError if no response could be obtained in time.
+        With stream, a successful response body is left unread.
+        The changeset_name option is added to params unless they set one.
+        """
+        if self.changeset_name and "changeset_name" not in (params or {}):
+            params = dict(params or {}, changeset_name=self.changeset_name)
+        attempt = 0
+        reauthenticated = False
+        while True:
+            attempt += 1
+            token = self.token
+            if self.limiter is not None:
+                self.limiter.acquire()
+            try:
+                response = self.transport.request(method, path, params=params, data=data,
+                                                  timeout=self._timeouts(), stream=stream)
+            except TransportError as e:
+                delay = self.policy.next_delay(attempt)
+                if delay is None:
+                    raise VerityApiError(f"{method} {path} failed after {attempt} attempt(s): {str(e)}")
+                time.sleep(delay)
+                continue
+
+            if response.status == 401 and not reauthenticated and self._can_reauthenticate():
+                response.close()
+                reauthenticated = True
+                with self._auth_lock:
+                    # Another thread may have replaced the token meanwhile
+                    if self.token == token:
+                        self._reauthenticate()
+                continue
+            if response.status in RETRY_STATUS_CODES:
+                delay = self.policy.next_delay(attempt, parse_retry_after(response.header("Retry-After")))
+                if delay is not None:
+                    response.close()
+                    time.sleep(delay)
+                    continue
+            return response
+
+    def iter_objects(self, path, params=None):
+        """
+        GET path and yield its (type_key, name, object) triples as they are
+        decoded, so that reading a large collection keeps memory flat.
+        Raises VerityApiError if the read fails.
+        """
+        response = self.request("GET", path, params=params, stream=True)
+        if not response.ok:
+            raise VerityApiError(f"GET {path} failed with HTTP {response.status}",
+                                 status=response.status, response=response.data())
+        try:
+            for item in iter_objects(response.stream()):
+                yield item
+        except (TransportError, ValueError, EOFError) as e:
+            raise VerityApiError(f"GET {path} returned an unreadable body: {str(e)}")
+        finally:
+            response.close()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# Differences between the current and the desired Verity objects
+
+
+def same_value(current, desired):
+    """
+    Compare two decoded JSON values, telling booleans from the numbers
+    Python considers equal to them (True == 1).
+    """
+    if isinstance(current, bool) or isinstance(desired, bool):
+        return isinstance(current, bool) and isinstance(desired, bool) and current == desired
+    if isinstance(current, dict) and isinstance(desired, dict):
+        return current.keys() == desired.keys() and all(
+            same_value(current[field], desired[field]) for field in desired)
+    if isinstance(current, list) and isinstance(desired, list):
+        return len(current) == len(desired) and all(
+            same_value(old, new) for old, new in zip(current, desired))
+    return current == desired
+
+
+def _indexed(entries):
+    return isinstance(entries, list) and all(
+        isinstance(entry, dict) and "index" in entry for entry in entries)
+
+
+def diff_list(current, desired):
+    """
+    Diff list fields whose entries are keyed by index, such as eths or
+    badges, and return (changed, patch) where patch only lists the entries
+    to send:
+    - an entry whose index exists is diffed like an object, and sent with
+      its index and its changed fields only
+    - an entry with index 0 (or none), the way to add one, is left out when
+      an entry of current not otherwise matched has the same fields, and
+      sent whole otherwise, as is an entry whose index does not exist
+    Entries of current that desired does not describe are left as they
+    are, the API documenting no way to remove one in a PATCH.
+    """
+    by_index = dict((entry["index"], entry) for entry in current if entry["index"])
+    matched = set(entry["index"] for entry in desired if entry.get("index") in by_index)
+    patch = []
+    for entry in desired:
+        index = entry.get("index")
+        if index in by_index:
+            changed, entry_patch = diff_value(by_index[index], entry)
+            if changed:
+                patch.append(dict(entry_patch, index=index))
+            continue
+        if not index:
+            fields = dict((field, value) for field, value in entry.items() if field != "index")
+            same = [old_index for old_index, old in by_index.items()
+                    if old_index not in matched and not diff_value(old, fields)[0]]
+            if same:
+                matched.add(same[0])
+                continue
+        patch.append(entry)
+    return bool(patch), patch
+
+
+def diff_value(current, desired):
+    """
+    Return (changed, patch): whether desired differs from current, and the
+    part of desired to send so that it is in place. Objects are compared
+    field by field, recursively, and fields of current that desired does
+    not set are left alone. Lists of indexed entries are diffed entry by
+    entry, see diff_list. Any other value is
+    replaced as a whole.
+    """
+    if isinstance(current, dict) and isinstance(desired, dict):
+        patch = {}
+        for field, value in desired.items():
+            if field not in current:
+                patch[field] = value
+                continue
+            changed, field_patch = diff_value(current[field], value)
+            if changed:
+                patch[field] = field_patch
+        return bool(patch), patch
+    if _indexed(current) and _indexed(desired) and (current or desired):
+        return diff_list(current, desired)
+    return not same_value(current, desired), desired
+
+
+def _kept_lists(current, desired, path):
+    if isinstance(current, dict) and isinstance(desired, dict):
+        for field, value in desired.items():
+            if field in current:
+                for kept in _kept_lists(current[field], value, path + (field,)):
+                    yield kept
+    elif desired == [] and current and _indexed(current):
+        yield path
+
+
+def kept_lists(current, desired):
+    """
+    Yield "<type_key> <name>.<field>" for the lists of indexed entries that
+    desired, a {type_key: {name: object}} document, sets empty while
+    current has entries. diff_objects leaves those entries in place, so
+    an empty list does not clear them.
+    """
+    for type_key, objects in desired.items():
+        existing = current.get(type_key) or {}
+        for name, obj in (objects or {}).items():
+            if name in existing:
+                for path in _kept_lists(existing[name], obj or {}, ()):
+                    yield f"{type_key} {name}.{'.'.join(path)}"
+
+
+def diff_objects(current, desired):
+    """
+    Compare {type_key: {name: object}} documents. Return (create, update):
+    the objects of desired missing from current, and for the others that
+    differ, only their changed fields, both shaped like desired and
+    without empty type keys.
+    """
+    create = {}
+    update = {}
+    for type_key, objects in desired.items():
+        existing = current.get(type_key) or {}
+        for name, obj in (objects or {}).items():
+            if name not in existing:
+                create.setdefault(type_key, {})[name] = obj
+                continue
+            changed, patch = diff_value(existing[name], obj or {})
+            if changed:
+                update.setdefault(type_key, {})[name] = patch
+    return create, update
+
+
+def apply_patch(current, patch):
+    """
+    Return current with patch, as built by diff_value, applied the way the
+    vNetC applies a PATCH, to show the object expected after it.
+    """
+    if isinstance(current, dict) and isinstance(patch, dict):
+        merged = dict(current)
+        for field, value in patch.items():
+            merged[field] = apply_patch(current[field], value) if field in current else value
+        return merged
+    if _indexed(current) and _indexed(patch) and patch:
+        entries = list(current)
+        positions = dict((entry["index"], position) for position, entry in enumerate(entries) if entry["index"])
+        for entry in patch:
+            index = entry.get("index")
+            if index not in positions:
+                entries.append(entry)
+            else:
+                entries[positions[index]] = apply_patch(entries[positions[index]], entry)
+        return entries
+    return patch
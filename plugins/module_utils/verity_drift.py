@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+# Drift of the resources of a vNetC from a baseline tree of object hashes
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_cache import (
+    cache_root,
+    file_lock,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_client import (
+    VerityApiError,
+    VerityClient,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_export import (
+    export_resource,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_parallel import (
+    run_parallel,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_resource import (
+    CONNECTION_ARGS,
+    RESOURCES,
+)
+
+DEFAULT_DRIFT_WORKERS = 8
+
+DRIFT_ARGS = dict(
+        CONNECTION_ARGS,
+        baseline=dict(type="str", default="default"),
+        resources=dict(type="list", elements="str", choices=sorted(RESOURCES)),
+        max_workers=dict(type="int", default=DEFAULT_DRIFT_WORKERS),
+        update_baseline=dict(type="bool", default=True),
+)
+
+
+def object_hash(obj):
+    """
+    Return the SHA-256 of the canonical JSON of obj, keys sorted and
+    without whitespace, so that equal objects hash alike whatever the
+    order of their fields.
+    """
+    return hashlib.sha256(json.dumps(obj, sort_keys=True, separators=(",", ":"))
+                          .encode("utf-8")).hexdigest()
+
+
+def tree_hash(hashes):
+    """
+    Return the hash of a node of the tree from the hashes of its
+    children, {name: hash}, whatever their order.
+    """
+    digest = hashlib.sha256()
+    for name in sorted(hashes):
+        digest.update(json.dumps([name, hashes[name]]).encode("utf-8") + b"\n")
+    return digest.hexdigest()
+
+
+def resource_node(objects):
+    """
+    Return the node of the tree of a resource from the hashes of its
+    objects, {type_key: {name: hash}}: its hash, and per object type its
+    hash and the hashes of its objects.
+    """
+    types = dict((type_key, dict(hash=tree_hash(hashes), objects=hashes))
+                 for type_key, hashes in objects.items())
+    return dict(hash=tree_hash(dict((type_key, node["hash"]) for type_key, node in types.items())),
+                types=types)
+
+
+EMPTY_TYPE = dict(hash=tree_hash({}), objects={})
+
+
+def compare_nodes(before, after):
+    """
+    Compare the nodes of one resource and return the names of its objects
+    added, removed and modified, only walking the object types whose
+    hashes differ.
+    """
+    changes = dict(added=[], removed=[], modified=[])
+    for type_key in sorted(set(before["types"]) | set(after["types"])):
+        old = before["types"].get(type_key, EMPTY_TYPE)
+        new = after["types"].get(type_key, EMPTY_TYPE)
+        if old["hash"] == new["hash"]:
+            continue
+        old, new = old["objects"], new["objects"]
+        changes["added"].extend(name for name in new if name not in old)
+        changes["removed"].extend(name for name in old if name not in new)
+        changes["modified"].extend(name for name in new if name in old and old[name] != new[name])
+    return dict((kind, sorted(names)) for kind, names in changes.items())
+
+
+def _read_documents(path, names):
+    # {name: object} of the records of an export part file with these names
+    found = {}
+    if not names or not os.path.exists(path):
+        return found
+    with gzip.open(path, "rt", encoding="utf-8") as fp:
+        for line in fp:
+            record = json.loads(line)
+            if record["name"] in names:
+                found[record["name"]] = record["object"]
+    return found
+
+
+class DriftBaseline(object):
+    """
+    Baseline of the drift of one vNetC, as seen from a changeset, under
+    <cache_dir>/drift: the tree of object hashes, and the objects of each
+    resource, written by export_resource, from which the diff of the
+    objects that drifted is taken.
+    """
+
+    def __init__(self, cache_dir, controller, changeset_name=None, name="default"):
+        key = json.dumps([(controller or "").rstrip("/"), changeset_name, name])
+        self.path = os.path.join(cache_root(cache_dir), "drift",
+                                 hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+    def documents(self, resource):
+        return os.path.join(self.path, resource + ".jsonl.gz")
+
+    def lock(self):
+        return file_lock(os.path.join(self.path, ".lock"))
+
+    def load(self):
+        """
+        Return the stored {resource: node}, or None if there is none.
+        """
+        try:
+            with gzip.open(os.path.join(self.path, "tree.json.gz"), "rt", encoding="utf-8") as fp:
+                return json.load(fp)["resources"]
+        except (OSError, EOFError, ValueError, KeyError):
+            return None
+
+    def save(self, nodes):
+        """
+        Store {resource: node} as the tree of the baseline.
+        """
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as gz:
+                gz.write(json.dumps(dict(root=tree_hash(dict((resource, node["hash"])
+                                                             for resource, node in nodes.items())),
+                                         resources=nodes)).encode("utf-8"))
+            os.replace(tmp_path, os.path.join(self.path, "tree.json.gz"))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def detect_drift(client, baseline, resources, max_workers=DEFAULT_DRIFT_WORKERS, update=True,
+                 diff=False):
+    """
+    Read resources through client on max_workers threads, hashing each
+    object as it arrives, and compare them with baseline, a DriftBaseline.
+    Return the result: drifted and changed if objects were added, removed
+    or modified since the baseline, the root hash of resources now and in
+    the baseline, per drifted resource the names of its objects that
+    changed (and with diff their before/after diff), and the resources
+    not in the baseline yet; or failed with msg.
+    The trees are compared from the root down, resources and object types
+    whose hashes match being skipped whole. With update, the baseline is
+    then brought up to date; resources that did not drift are left as
+    they are.
+    """
+    os.makedirs(baseline.path, mode=0o700, exist_ok=True)
+    with baseline.lock():
+        stored = baseline.load() or {}
+        work = tempfile.mkdtemp(dir=baseline.path, prefix=".tmp-")
+        try:
+            def read_one(resource):
+                objects = {}
+
+                def visit(type_key, name, obj):
+                    if name is not None:
+                        objects.setdefault(type_key, {})[name] = object_hash(obj)
+
+                try:
+                    export_resource(client, resource, os.path.join(work, resource + ".jsonl.gz"), visit)
+                except VerityApiError as e:
+                    return dict(failed=True, msg=f"{resource} read failed: {str(e)}")
+                return resource_node(objects)
+
+            nodes = dict(zip(resources, run_parallel(read_one, resources, max_workers)))
+            failures = [node["msg"] for node in nodes.values() if node.get("failed")]
+            if failures:
+                return dict(failed=True, changed=False,
+                            msg=f"{len(failures)} of {len(resources)} resources failed, first: {failures[0]}")
+
+            compared = [resource for resource in resources if resource in stored]
+            result = dict(
+                root=tree_hash(dict((resource, node["hash"]) for resource, node in nodes.items())),
+                baseline_root=tree_hash(dict((resource, stored[resource]["hash"]) for resource in compared))
+                if compared else None,
+                baselined=[resource for resource in resources if resource not in stored],
+                resources={},
+                objects=sum(len(type_node["objects"]) for node in nodes.values()
+                            for type_node in node["types"].values()),
+            )
+            entries = []
+            # Equal roots: nothing below them can differ
+            if result["baseline_root"] == tree_hash(dict((resource, nodes[resource]["hash"])
+                                                         for resource in compared)):
+                compared = []
+            for resource in compared:
+                if stored[resource]["hash"] == nodes[resource]["hash"]:
+                    continue
+                changes = compare_nodes(stored[resource], nodes[resource])
+                result["resources"][resource] = changes
+                if diff:
+                    before = _read_documents(baseline.documents(resource),
+                                             set(changes["removed"] + changes["modified"]))
+                    after = _read_documents(os.path.join(work, resource + ".jsonl.gz"),
+                                            set(changes["added"] + changes["modified"]))
+                    for name in sorted(set(before) | set(after)):
+                        entries.append(dict(before_header=f"{resource} {name}",
+                                            after_header=f"{resource} {name}",
+                                            before=before.get(name, {}), after=after.get(name, {})))
+            result["drifted"] = result["changed"] = bool(result["resources"])
+            if diff:
+                result["diff"] = entries
+
+            outdated = [resource for resource, node in nodes.items()
+                        if resource not in stored or stored[resource]["hash"] != node["hash"]]
+            if update and outdated:
+                for resource in outdated:
+                    os.replace(os.path.join(work, resource + ".jsonl.gz"), baseline.documents(resource))
+                    stored[resource] = nodes[resource]
+                baseline.save(stored)
+            return result
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+
+
+def run_drift(module):
+    """
+    Runner of the verity_drift module.
+    """
+    try:
+        client = VerityClient(module)
+    except VerityApiError as e:
+        module.fail_json(msg=f"verity_drift failed: {str(e)}")
+
+    baseline = DriftBaseline(module.params["cache_dir"], client.controller, client.changeset_name,
+                             module.params["baseline"])
+    result = detect_drift(client, baseline, module.params["resources"] or sorted(RESOURCES),
+                          module.params["max_workers"],
+                          module.params["update_baseline"] and not module.check_mode, module._diff)
+    if result.pop("failed", False):
+        module.fail_json(**result)
+    module.exit_json(**result)
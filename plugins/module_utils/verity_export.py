@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+# Streaming export of the resources of a vNetC to JSON Lines
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_client import (
+    VerityApiError,
+    VerityClient,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_parallel import (
+    run_parallel,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_resource import (
+    CONNECTION_ARGS,
+    RESOURCES,
+    read_variants,
+)
+
+DEFAULT_EXPORT_WORKERS = 8
+
+EXPORT_ARGS = dict(
+        CONNECTION_ARGS,
+        dest=dict(type="path", required=True),
+        resources=dict(type="list", elements="str", choices=sorted(RESOURCES)),
+        max_workers=dict(type="int", default=DEFAULT_EXPORT_WORKERS),
+        resume=dict(type="bool", default=True),
+)
+
+
+def export_line(resource, type_key, name, obj, params=None):
+    """
+    Return the JSON Lines record of one object of resource, as written by
+    the export and read back by the import. params are the query
+    parameters the object was read with, for resources with variants.
+    """
+    record = dict(resource=resource, type=type_key, name=name, object=obj)
+    if params:
+        record["params"] = params
+    return json.dumps(record) + "\n"
+
+
+def _parts(dest):
+    return dest + ".parts"
+
+
+def _prepare_parts(parts, manifest, resume):
+    # Keep the finished parts of an earlier run of the same export, unless
+    # not resuming, and return the results of the resources they hold
+    try:
+        with open(os.path.join(parts, "manifest.json")) as fp:
+            previous = json.load(fp)
+    except (OSError, ValueError):
+        previous = None
+    if not resume or previous != manifest:
+        shutil.rmtree(parts, ignore_errors=True)
+        os.makedirs(parts, mode=0o700)
+        with open(os.path.join(parts, "manifest.json"), "w") as fp:
+            json.dump(manifest, fp)
+        return {}
+    done = {}
+    for name in os.listdir(parts):
+        if name.endswith(".done"):
+            with open(os.path.join(parts, name)) as fp:
+                done[name[:-len(".done")]] = json.load(fp)
+    return done
+
+
+def export_resource(client, resource, path, visit=None):
+    """
+    Stream every object of resource from client to the part file at path,
+    one record per line, without holding the collection in memory. The
+    part only appears at path once complete. Return the number of
+    objects; a resource the vNetC does not know (HTTP 404) is empty.
+    Resources with variants (see read_variants) are read once per variant,
+    each record keeping the params it was read with.
+    visit, if given, is called with the type_key, name and object of each
+    record as it is written.
+    Raises VerityApiError if the read fails.
+    """
+    count = 0
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        # mtime=0 so that the same objects always give the same bytes
+        with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6,
+                                                       mtime=0) as gz:
+            for params in read_variants(resource):
+                try:
+                    for type_key, name, obj in client.iter_objects(RESOURCES[resource]["path"],
+                                                                   params=params or None):
+                        gz.write(export_line(resource, type_key, name, obj, params).encode("utf-8"))
+                        if visit is not None:
+                            visit(type_key, name, obj)
+                        count += 1
+                except VerityApiError as e:
+                    if e.status != 404:
+                        raise
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return count
+
+
+def _assemble(dest, parts, resources):
+    # Concatenate the gzip members of the parts, which is itself a valid
+    # gzip file, and replace dest unless it already has the same content
+    digest = hashlib.sha256()
+    directory = os.path.dirname(os.path.abspath(dest))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            for resource in resources:
+                with open(os.path.join(parts, resource + ".jsonl.gz"), "rb") as part:
+                    for chunk in iter(lambda: part.read(1024 * 1024), b""):
+                        digest.update(chunk)
+                        out.write(chunk)
+        checksum = digest.hexdigest()
+        changed = checksum != file_checksum(dest)
+        if changed:
+            os.replace(tmp_path, dest)
+        else:
+            os.unlink(tmp_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return changed, checksum
+
+
+def file_checksum(path):
+    """
+    Return the SHA-256 of the file at path, or None if there is none.
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as fp:
+            for chunk in iter(lambda: fp.read(1024 * 1024), b""):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def export_resources(client, dest, resources, max_workers=DEFAULT_EXPORT_WORKERS, resume=True):
+    """
+    Export the objects of resources through client to dest, a gzip
+    compressed JSON Lines file of export_line records, and return the
+    result: changed if dest was replaced, its checksum and per resource
+    the number of objects, or failed with msg.
+    Each resource is read on one of max_workers threads and streamed to
+    its own part file under <dest>.parts as it arrives. If some fail, the
+    parts of the others are kept, and with resume the next export of the
+    same controller and resources only reads the missing ones.
+    """
+    parts = _parts(dest)
+    manifest = dict(controller=client.controller, changeset_name=client.changeset_name,
+                    resources=list(resources))
+    done = _prepare_parts(parts, manifest, resume)
+
+    def run_one(resource):
+        if resource in done:
+            return dict(done[resource], resumed=True)
+        started = time.monotonic()
+        try:
+            objects = export_resource(client, resource, os.path.join(parts, resource + ".jsonl.gz"))
+        except VerityApiError as e:
+            return dict(failed=True, msg=f"{resource} export failed: {str(e)}")
+        result = dict(objects=objects, elapsed=round(time.monotonic() - started, 3))
+        # Marks the part complete for a resumed run
+        with open(os.path.join(parts, resource + ".done"), "w") as fp:
+            json.dump(result, fp)
+        return dict(result, resumed=False)
+
+    results = dict(zip(resources, run_parallel(run_one, resources, max_workers)))
+    failures = [result["msg"] for result in results.values() if result.get("failed")]
+    if failures:
+        return dict(failed=True, changed=False, resources=results,
+                    msg=f"{len(failures)} of {len(resources)} resources failed, first: {failures[0]}; "
+                        f"the others are kept in {parts} for the next run")
+
+    changed, checksum = _assemble(dest, parts, resources)
+    shutil.rmtree(parts, ignore_errors=True)
+    return dict(changed=changed, dest=dest, checksum=checksum, resources=results)
+
+
+def run_export(module):
+    """
+    Runner of the verity_export module.
+    """
+    resources = module.params["resources"] or sorted(RESOURCES)
+    if module.check_mode:
+        module.exit_json(changed=True, dest=module.params["dest"], resources={})
+    try:
+        client = VerityClient(module)
+    except VerityApiError as e:
+        module.fail_json(msg=f"verity_export failed: {str(e)}")
+
+    result = export_resources(client, module.params["dest"], resources,
+                              module.params["max_workers"], module.params["resume"])
+    if result.pop("failed", False):
+        module.fail_json(**result)
+    module.exit_json(**result)
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+# Streaming import of a JSON Lines export in dependency order
+
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_client import (
+    VerityApiError,
+    VerityClient,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_parallel import (
+    run_parallel,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_resource import (
+    CONNECTION_ARGS,
+    RESOURCES,
+    apply_resource,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_scheduler import (
+    type_levels,
+)
+
+DEFAULT_IMPORT_BATCH = 100
+DEFAULT_IMPORT_WORKERS = 4
+
+IMPORT_ARGS = dict(
+        CONNECTION_ARGS,
+        src=dict(type="path", required=True),
+        resources=dict(type="list", elements="str", choices=sorted(RESOURCES)),
+        batch_size=dict(type="int", default=DEFAULT_IMPORT_BATCH),
+        max_workers=dict(type="int", default=DEFAULT_IMPORT_WORKERS),
+        validate_data=dict(type="bool", default=True),
+)
+
+
+class VerityImportError(ValueError):
+    """The import file cannot be read."""
+
+
+def _open(path):
+    # Text stream of path, gzip compressed or not, told apart by its magic
+    with open(path, "rb") as fp:
+        compressed = fp.read(2) == b"\x1f\x8b"
+    if compressed:
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def _spool_entry(resource, type_key, name, obj, params):
+    # [type_key, name, object, params] the object is written with: objects
+    # of the other types of resource (ipv4_filter and ipv6_filter for acls)
+    # go under its key, with the params of the variant they were read as
+    definition = RESOURCES[resource]
+    if type_key in definition.get("types", ()):
+        if not params and "variants" in definition:
+            variant, values = definition["variants"]
+            params = dict((variant, value) for value, variant_type in values.items()
+                          if variant_type == type_key)
+        type_key = definition["key"]
+    return [type_key, name, obj, params or {}]
+
+
+def spool_records(path, spool, resources=None):
+    """
+    Read the export_line records of the file at path, gzip compressed or
+    not, one line at a time, and append each object to the spool file of
+    its resource in the directory spool, so that nothing but a line is
+    held in memory. Objects of the other types of a resource (see
+    RESOURCES) are spooled under its key, with the params of their record,
+    or else of the variant of their type. Only resources are kept, when
+    given. Return {resource: number of objects}.
+    Raises VerityImportError for a line that is not a record of a known resource.
+    """
+    counts = {}
+    files = {}
+    try:
+        with _open(path) as fp:
+            for number, line in enumerate(fp, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    resource = record["resource"]
+                    name = record["name"]
+                    fields = [record["type"], name, record["object"], record.get("params")]
+                except (ValueError, TypeError, KeyError) as e:
+                    raise VerityImportError(f"{path} line {number} is not an export record: {str(e)}")
+                if resource not in RESOURCES:
+                    raise VerityImportError(f"{path} line {number} has an unknown resource {resource!r}")
+                if name is None or (resources and resource not in resources):
+                    continue
+                entry = _spool_entry(resource, *fields)
+                if resource not in files:
+                    files[resource] = open(os.path.join(spool, resource + ".jsonl"), "w", encoding="utf-8")
+                files[resource].write(json.dumps(entry) + "\n")
+                counts[resource] = counts.get(resource, 0) + 1
+    except (OSError, EOFError) as e:
+        raise VerityImportError(f"cannot read {path}: {str(e)}")
+    finally:
+        for fp in files.values():
+            fp.close()
+    return counts
+
+
+def _batches(path, batch_size):
+    # (params, document) of documents {type_key: {name: object}} of at most
+    # batch_size objects sharing their params, in the order of the spool file
+    params = {}
+    document = {}
+    size = 0
+    with open(path, encoding="utf-8") as fp:
+        for line in fp:
+            type_key, name, obj, entry_params = json.loads(line)
+            if document and (size == batch_size or entry_params != params):
+                yield params, document
+                document = {}
+                size = 0
+            params = entry_params
+            document.setdefault(type_key, {})[name] = obj
+            size += 1
+    if document:
+        yield params, document
+
+
+def import_levels(resources):
+    """
+    Return lists of resources such that the objects of each list only
+    reference resources of earlier lists (see type_levels), so that the
+    resources of one list can be imported in parallel.
+    """
+    levels = type_levels()
+    return [sorted(resource for resource in resources if levels[resource] == level)
+            for level in sorted(set(levels[resource] for resource in resources))]
+
+
+def import_records(client, spool, counts, batch_size=DEFAULT_IMPORT_BATCH,
+                   max_workers=DEFAULT_IMPORT_WORKERS, options=None):
+    """
+    Apply the objects spooled by spool_records with state present through
+    client and return one result per resource: changed, the number of
+    objects and batches, its level and elapsed seconds, or failed with msg.
+    options are keyword arguments of apply_resource: check_mode and
+    validate.
+    The resources of each import_levels list are imported on max_workers
+    threads, each in documents of at most batch_size objects sent one
+    after the other, with the params of their objects. A batch that fails for another reason than invalid
+    data is retried once after all others, as it may reference objects of
+    a later level, across a reference cycle of types or later in the file.
+    """
+    results = {}
+    # Failed batches wait on disk, as they can be a whole resource
+    deferred = os.path.join(spool, "deferred.jsonl")
+    deferred_lock = threading.Lock()
+
+    def apply(resource, params, document):
+        return apply_resource(client, resource, RESOURCES[resource]["path"], "create",
+                              data=document, params=params or None, state="present",
+                              **(options or {}))
+
+    def run_one(resource):
+        result = dict(changed=False, objects=counts[resource], batches=0)
+        started = time.monotonic()
+        for params, document in _batches(os.path.join(spool, resource + ".jsonl"), batch_size):
+            result["batches"] += 1
+            applied = apply(resource, params, document)
+            if applied.get("failed") and "errors" not in applied:
+                with deferred_lock, open(deferred, "a", encoding="utf-8") as fp:
+                    fp.write(json.dumps([resource, params, document]) + "\n")
+                continue
+            if applied.get("failed"):
+                result.update(failed=True, msg=applied["msg"])
+                break
+            result["changed"] = result["changed"] or applied["changed"]
+        result["elapsed"] = round(time.monotonic() - started, 3)
+        return result
+
+    for level, resources in enumerate(import_levels(counts)):
+        for resource, result in zip(resources, run_parallel(run_one, resources, max_workers)):
+            results[resource] = dict(result, level=level)
+
+    if not os.path.exists(deferred):
+        return results
+    with open(deferred, encoding="utf-8") as fp:
+        for line in fp:
+            resource, params, document = json.loads(line)
+            result = results[resource]
+            applied = apply(resource, params, document)
+            if applied.get("failed"):
+                result.setdefault("msg", applied["msg"])
+                result["failed"] = True
+            else:
+                result["changed"] = result["changed"] or applied["changed"]
+    return results
+
+
+def run_import(module):
+    """
+    Runner of the verity_import module.
+    """
+    started = time.monotonic()
+    if module.params["batch_size"] < 1:
+        module.fail_json(msg="batch_size must be at least 1")
+    try:
+        client = VerityClient(module)
+    except VerityApiError as e:
+        module.fail_json(msg=f"verity_import failed: {str(e)}")
+
+    spool = tempfile.mkdtemp(prefix="verity_import-")
+    try:
+        try:
+            counts = spool_records(module.params["src"], spool, module.params["resources"])
+        except VerityImportError as e:
+            module.fail_json(msg=f"verity_import failed: {str(e)}")
+        options = dict(check_mode=module.check_mode, validate=module.params["validate_data"])
+        results = import_records(client, spool, counts, module.params["batch_size"],
+                                 module.params["max_workers"], options)
+    finally:
+        shutil.rmtree(spool, ignore_errors=True)
+
+    result = dict(
+        changed=any(r["changed"] for r in results.values()),
+        resources=results,
+        elapsed=round(time.monotonic() - started, 3),
+    )
+    failures = [f"{resource}: {r['msg']}" for resource, r in results.items() if r.get("failed")]
+    if failures:
+        module.fail_json(msg=f"{len(failures)} of {len(results)} resources failed, first: {failures[0]}",
+                         **result)
+    module.exit_json(**result)
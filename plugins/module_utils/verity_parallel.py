@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# Concurrent API calls with a per-controller rate limit
+
+import threading
+import time
+
+DEFAULT_MAX_WORKERS = 1
+
+_BUCKETS = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+class TokenBucket(object):
+    """
+    Thread-safe token bucket: acquire() lets rate calls per second through
+    on average, with bursts of up to burst calls.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst or max(1.0, self.rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Take one token, sleeping until one is available.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def get_bucket(controller, rate, burst=None):
+    """
+    Return the token bucket shared by every call to controller (a base_url
+    or persistent connection socket) in this process.
+    """
+    key = (controller, float(rate), burst)
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(key)
+        if bucket is None:
+            bucket = _BUCKETS[key] = TokenBucket(rate, burst)
+        return bucket
+
+
+def run_parallel(func, items, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Call func(item) for every item on at most max_workers threads and
+    return the results in the order of items. func reports the status of
+    each item in its result; an exception it raises is re-raised here
+    once all started calls have finished.
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+    return [future.result() for future in futures]
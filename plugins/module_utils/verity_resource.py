@@ -1,75 +1,429 @@
-from ansible_collections.be_networks.verity.plugins.module_utils.verity_api import (
-    authenticate,
-    build_headers,
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_cache import (
+    DEFAULT_TOKEN_TTL,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_client import (
+    VerityApiError,
+    VerityClient,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_diff import (
+    apply_patch,
+    diff_objects,
+    kept_lists,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_retry import (
+    DEFAULT_BACKOFF,
+    DEFAULT_MAX_ATTEMPTS,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_snapshot import (
+    DEFAULT_SNAPSHOT_SIZE,
+    DEFAULT_SNAPSHOT_TTL,
+    SnapshotCache,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_transport import (
+    COMPRESSION_MODES,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_HTTP_BACKEND,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_READ_TIMEOUT,
+    HTTP_BACKENDS,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_validate import (
+    validate_data,
 )
-import requests
 
-MODULE_ARGS = dict(
-        base_url=dict(type="str", required=True),
+# API path and object type key (the top-level key of data) of every
+# resource module. refs lists the resources its objects can reference in
+# *_ref_type_ fields; types lists the object types that name it in those
+# fields when they differ from key. variants is the query parameter the
+# vNetC only lists the objects of the resource with, and per value of it,
+# the object type it answers with.
+RESOURCES = {
+    "acls": dict(path="/acls", key="ip_filter", types=("ipv4_filter", "ipv6_filter"), refs=(),
+                 variants=("ip_version", {"4": "ipv4_filter", "6": "ipv6_filter"})),
+    "aspathaccesslists": dict(path="/aspathaccesslists", key="as_path_access_list", refs=()),
+    "badges": dict(path="/badges", key="badge", refs=()),
+    "bundles": dict(path="/bundles", key="endpoint_bundle",
+                    refs=("devicesettings", "ethportprofiles", "ethportsettings",
+                          "gatewayprofiles", "lags", "packetbroker", "services")),
+    "communitylists": dict(path="/communitylists", key="community_list", refs=()),
+    "devicecontrollers": dict(path="/devicecontrollers", key="device_controller",
+                              refs=("switchpoints",)),
+    "devicesettings": dict(path="/devicesettings", key="eth_device_profiles", refs=()),
+    "ethportprofiles": dict(path="/ethportprofiles", key="eth_port_profile_", refs=("services",)),
+    "ethportsettings": dict(path="/ethportsettings", key="eth_port_settings",
+                            refs=("packetqueues",)),
+    "extendedcommunitylists": dict(path="/extendedcommunitylists", key="extended_community_list",
+                                   refs=()),
+    "gatewayprofiles": dict(path="/gatewayprofiles", key="gateway_profile", refs=("gateways",)),
+    "gateways": dict(path="/gateways", key="gateway", refs=("routemaps", "sites", "tenants")),
+    "imageupdatesets": dict(path="/imageupdatesets", key="image_update_sets", refs=()),
+    "ipv4lists": dict(path="/ipv4lists", key="ipv4_list_filter", refs=()),
+    "ipv4prefixlists": dict(path="/ipv4prefixlists", key="ipv4_prefix_list", refs=()),
+    "ipv6lists": dict(path="/ipv6lists", key="ipv6_list_filter", refs=()),
+    "ipv6prefixlists": dict(path="/ipv6prefixlists", key="ipv6_prefix_list", refs=()),
+    "lags": dict(path="/lags", key="lag",
+                 refs=("ethportprofiles", "gatewayprofiles", "packetbroker")),
+    "packetbroker": dict(path="/packetbroker", key="pb_egress_profile",
+                         refs=("acls", "ipv4lists", "ipv6lists")),
+    "packetqueues": dict(path="/packetqueues", key="packet_queue", refs=()),
+    "pods": dict(path="/pods", key="pod", refs=()),
+    "portacls": dict(path="/portacls", key="port_acl", refs=("acls",)),
+    "routemapclauses": dict(path="/routemapclauses", key="route_map_clause",
+                            refs=("aspathaccesslists", "communitylists", "extendedcommunitylists",
+                                  "ipv4prefixlists", "ipv6prefixlists", "tenants")),
+    "routemaps": dict(path="/routemaps", key="route_map", refs=("routemapclauses",)),
+    "services": dict(path="/services", key="service", refs=("tenants",)),
+    "sfpbreakouts": dict(path="/sfpbreakouts", key="sfp_breakouts", refs=()),
+    "sites": dict(path="/sites", key="site", refs=("lags", "services", "switchpoints")),
+    "switchpoints": dict(path="/switchpoints", key="switchpoint",
+                         refs=("badges", "bundles", "pods", "switchpoints")),
+    "tenants": dict(path="/tenants", key="tenant", refs=("routemaps",)),
+}
+
+ACTION_METHODS = {
+    "create": "PUT",
+    "update": "PATCH",
+    "delete": "DELETE",
+    "get": "GET",
+}
+
+# Options of every module talking to the vNetC
+CONNECTION_ARGS = dict(
+        base_url=dict(type="str", required=False),
         username=dict(type="str", required=False, no_log=True),
         password=dict(type="str", required=False, no_log=True),
+        token=dict(type="str", required=False),
+        changeset_name=dict(type="str", required=False),
+        validate_certs=dict(type="bool", default=True),
+        pool_maxsize=dict(type="int", default=DEFAULT_POOL_MAXSIZE),
+        keep_alive=dict(type="bool", default=True),
+        token_cache=dict(type="bool", default=True),
+        token_cache_ttl=dict(type="int", default=DEFAULT_TOKEN_TTL),
+        cache_dir=dict(type="path", required=False),
+        max_attempts=dict(type="int", default=DEFAULT_MAX_ATTEMPTS),
+        retry_backoff=dict(type="float", default=DEFAULT_BACKOFF),
+        deadline=dict(type="float", required=False),
+        connect_timeout=dict(type="float", default=DEFAULT_CONNECT_TIMEOUT),
+        read_timeout=dict(type="float", default=DEFAULT_READ_TIMEOUT),
+        compression=dict(type="str", choices=list(COMPRESSION_MODES), default="auto"),
+        http_backend=dict(type="str", choices=list(HTTP_BACKENDS), default=DEFAULT_HTTP_BACKEND),
+    )
+
+MODULE_ARGS = dict(
+        CONNECTION_ARGS,
         params=dict(type='dict', required=False, default=None),
         data=dict(type="dict", required=False),
-        token=dict(type="str", required=True),
-        action=dict(type='str', choices=['create', 'update', 'delete'], default='create'),
+        action=dict(type='str', choices=['create', 'update', 'delete', 'get'], default='create'),
+        state=dict(type="str", choices=["present", "absent"], required=False),
+        names=dict(type="list", elements="str", required=False),
+        fields=dict(type="list", elements="str", required=False),
+        snapshot_cache=dict(type="bool", default=False),
+        snapshot_cache_ttl=dict(type="int", default=DEFAULT_SNAPSHOT_TTL),
+        snapshot_cache_size=dict(type="int", default=DEFAULT_SNAPSHOT_SIZE),
+        validate_data=dict(type="bool", default=True),
     )
 
 
-def run_resource(module, resource_name, path):
+def _name_params(resource_name, params, names):
+    # <key>_name query parameter selecting names, repeated for several names
+    params = dict(params or {})
+    if names:
+        name_param = f"{RESOURCES[resource_name]['key']}_name"
+        params[name_param] = names[0] if len(names) == 1 else list(names)
+    return params
+
+
+def _api_error(resource_name, e):
+    result = dict(failed=True, msg=f"{resource_name} API call failed: {str(e)}")
+    if e.status is not None:
+        result.update(status=e.status, response=e.response)
+    return result
+
+
+def _writes_data(action, state):
+    return state == "present" or (not state and action in ("create", "update"))
+
+
+def data_errors(resource_name, action, state, data):
     """
-    Generic resource runner for Verity API modules.
+    Return what is wrong with the data an action or state of
+    resource_name would send, checked against the schema documented by
+    its module (see verity_validate), or an empty list.
+    """
+    if not data or not _writes_data(action, state):
+        return []
+    return validate_data(resource_name, data)[1]
+
+
+def _invalid_data(resource_name, errors):
+    return dict(failed=True, msg=f"{resource_name} data is invalid: {'; '.join(errors)}",
+                errors=errors)
+
+
+def _snapshot_key(client, resource_name, params):
+    # Snapshots hold the whole resource, whatever <key>_name selects, as
+    # seen from the changeset the client works in
+    name_param = f"{RESOURCES[resource_name]['key']}_name"
+    params = dict((name, value) for name, value in (params or {}).items() if name != name_param)
+    if getattr(client, "changeset_name", None):
+        params.setdefault("changeset_name", client.changeset_name)
+    return SnapshotCache.key(getattr(client, "controller", None) or "", resource_name, params)
+
+
+def read_variants(resource_name):
+    """
+    Return the query parameters to list every object of resource_name
+    with, one GET each: [{}] unless it has variants.
+    """
+    if "variants" not in RESOURCES[resource_name]:
+        return [{}]
+    name, values = RESOURCES[resource_name]["variants"]
+    return [{name: value} for value in values]
+
+
+def fold_types(resource_name, document):
+    """
+    Return document, {type_key: {name: object}} as answered by the vNetC,
+    with the objects of the other types of resource_name (the types of
+    RESOURCES, such as the ipv4_filter and ipv6_filter objects of acls)
+    moved under its key, under which they are written.
+    """
+    key = RESOURCES[resource_name]["key"]
+    types = [type_key for type_key in RESOURCES[resource_name].get("types", ()) if type_key in document]
+    if not types:
+        return document
+    document = dict(document)
+    objects = dict(document.get(key) or {})
+    for type_key in types:
+        value = document.pop(type_key)
+        if isinstance(value, dict):
+            objects.update(value)
+    document[key] = objects
+    return document
+
+
+def _project(obj, fields):
+    if fields and isinstance(obj, dict):
+        return dict((field, obj[field]) for field in fields if field in obj)
+    return obj
+
+
+def read_resource(client, resource_name, path, params=None, names=None, fields=None,
+                  snapshots=None):
+    """
+    GET the objects of resource_name and return them as the response of
+    the result, {type_key: {name: object}}, with changed false.
+    - names: only these objects; sent to the vNetC as <key>_name and
+      checked again here, in case the filter is ignored
+    - fields: only these attributes of each object; the others are dropped
+      object by object as the body is decoded, so that only the projected
+      collection is ever held in memory
+    - snapshots: SnapshotCache to read the objects from, reading the whole
+      resource into it first if it has no unexpired snapshot of it
+    """
+    if snapshots is not None:
+        # The snapshot holds every object; <key>_name only selects from it
+        params = dict(params or {})
+        selected = params.pop(f"{RESOURCES[resource_name]['key']}_name", None)
+        if selected and not names:
+            names = selected if isinstance(selected, list) else [selected]
+        try:
+            objects = snapshots.get_or_create(
+                _snapshot_key(client, resource_name, params),
+                lambda: client.iter_objects(path, params=params), names)
+        except VerityApiError as e:
+            return _api_error(resource_name, e)
+        response = dict((type_key, dict((name, _project(obj, fields)) for name, obj in value.items())
+                         if isinstance(value, dict) else value)
+                        for type_key, value in objects.items())
+        return dict(changed=False, response=response)
+
+    params = _name_params(resource_name, params, names)
+    wanted = set(names or ())
+    response = {}
+    try:
+        for type_key, name, obj in client.iter_objects(path, params=params):
+            if name is None:
+                response[type_key] = obj
+                continue
+            if wanted and name not in wanted:
+                continue
+            response.setdefault(type_key, {})[name] = _project(obj, fields)
+    except VerityApiError as e:
+        return _api_error(resource_name, e)
+    return dict(changed=False, response=response)
+
+
+def _read_current(client, resource_name, path, params, names, snapshots):
+    # Current objects named by names, from the vNetC or from a snapshot of
+    # the whole resource; a 404 means there are none
+    result = read_resource(client, resource_name, path, params=params, names=names,
+                           snapshots=snapshots)
+    if result.get("failed") and result.get("status") == 404:
+        return dict(response={})
+    return result
+
+
+def _diff_entry(type_key, name, before, after):
+    return dict(before_header=f"{type_key} {name}", after_header=f"{type_key} {name}",
+                before=before, after=after)
+
+
+def converge_resource(client, resource_name, path, state, data=None, params=None, names=None,
+                      check_mode=False, diff=False, snapshots=None, validate=False):
+    """
+    Bring objects of resource_name to state, comparing them with their
+    current definition on the vNetC, and return the result of
+    apply_resource, changed only if something was (or, in check_mode,
+    would be) sent, with one before/after diff per object if diff.
+    - present: objects of data that do not exist are PUT, and only the
+      changed fields and list entries of the others are PATCHed (see
+      diff_objects); list entries missing from data are left in place, and
+      the result warns about the lists data sets empty
+    - absent: the objects named by names, or else by data or by the
+      <key>_name of params, that exist are DELETEd
+    - snapshots: SnapshotCache to read the current objects from instead
+      of the vNetC
+    - validate: fill the documented defaults of the fields missing from
+      the objects created, data being already validated by apply_resource
+    """
+    key = RESOURCES[resource_name]["key"]
+    params = dict(params or {})
+    if state == "present":
+        desired = dict((type_key, objects) for type_key, objects in (data or {}).items()
+                       if isinstance(objects, dict))
+        names = sorted(set(name for objects in desired.values() for name in objects))
+    else:
+        names = names or sorted((data or {}).get(key) or ())
+        if not names and params.get(f"{key}_name"):
+            names = [params[f"{key}_name"]]
+        params.pop(f"{key}_name", None)
+    if not names:
+        return dict(changed=False, response={})
+
+    current = _read_current(client, resource_name, path, params, names, snapshots)
+    if current.get("failed"):
+        return current
+    current = fold_types(resource_name, current["response"])
+
+    result = dict(changed=False, response={})
+    kept = []
+    if state == "absent":
+        existing = [name for name in names if name in (current.get(key) or {})]
+        diffs = [_diff_entry(key, name, current[key][name], {}) for name in existing]
+        if existing and check_mode:
+            result["changed"] = True
+        elif existing:
+            result = apply_resource(client, resource_name, path, "delete", snapshots=snapshots,
+                                    params=_name_params(resource_name, params, existing))
+    else:
+        create, update = diff_objects(current, desired)
+        kept = list(kept_lists(current, desired))
+        if validate and create:
+            create = validate_data(resource_name, create, fill=True)[0]
+        diffs = [_diff_entry(type_key, name, {}, obj)
+                 for type_key, objects in create.items() for name, obj in objects.items()]
+        diffs.extend(_diff_entry(type_key, name, current[type_key][name],
+                                 apply_patch(current[type_key][name], patch))
+                     for type_key, patches in update.items() for name, patch in patches.items())
+        if check_mode:
+            result["changed"] = bool(create or update)
+        else:
+            for action, document in (("create", create), ("update", update)):
+                if document:
+                    result = apply_resource(client, resource_name, path, action, data=document,
+                                            params=params, snapshots=snapshots)
+                    if result.get("failed"):
+                        break
+    if diff and not result.get("failed"):
+        result["diff"] = sorted(diffs, key=lambda entry: entry["before_header"])
+    if kept:
+        result["warnings"] = [f"Empty lists do not remove existing entries; left as they are in "
+                              f"{', '.join(kept)}"]
+    return result
+
+
+def apply_resource(client, resource_name, path, action, data=None, params=None, names=None,
+                   fields=None, state=None, check_mode=False, diff=False,
+                   snapshots=None, validate=False):
+    """
+    Send one create/update/delete/get of resource_name through client and
+    return its result: changed and the decoded response, or failed with
+    msg (and status/response when the vNetC answered with an error).
     - resource_name: "acls", "badges", etc.
     - path: relative API path, e.g. "/acls"
-    - payload_key: optional wrapper key for payload
+    - names, fields: filters of a get, see read_resource
+    - state: present or absent, replaces action, see
+      converge_resource
+    - check_mode: send no write, but predict changed and the diff of a
+      create/update/delete as state present/absent would
+    - snapshots: SnapshotCache read by get, state and check_mode, and
+      from which the snapshot of resource_name is dropped after a write
+    - validate: check the data of a create/update/present against the
+      schema documented by the module, and fail without sending anything
+      if it does not match; values are converted to their documented type
+      and objects created get the documented defaults of missing fields
     """
+    if check_mode and not state and action != "get":
+        state = "absent" if action == "delete" else "present"
+    if validate and data and _writes_data(action, state):
+        data, errors = validate_data(resource_name, data, fill=not state and action == "create")
+        if errors:
+            return _invalid_data(resource_name, errors)
+    if state:
+        return converge_resource(client, resource_name, path, state, data=data, params=params,
+                                 names=names, check_mode=check_mode,
+                                 diff=diff, snapshots=snapshots, validate=validate)
+    if action == "get":
+        return read_resource(client, resource_name, path, params=params, names=names, fields=fields,
+                             snapshots=snapshots)
 
-    base_url = module.params["base_url"]
-    token = module.params["token"]
-    username = module.params["username"]
-    password = module.params["password"]
-    data = module.params.get("data")
-    params = module.params.get("params")
-    action = module.params["action"]
+    http_method = ACTION_METHODS[action]
+    try:
+        response = client.request(http_method, path, params=params,
+                                  data=None if http_method == "DELETE" else data)
+    except VerityApiError as e:
+        return dict(failed=True, msg=f"{resource_name} API call failed: {str(e)}")
+    finally:
+        if snapshots is not None:
+            snapshots.delete(_snapshot_key(client, resource_name, params))
 
-    if not token:
-        # Fallback: authenticate with username/password
-        if not username or not password:
-            module.fail_json(msg="Either token or username/password must be provided")
-        token = authenticate(module, base_url, username, password)
-    headers = build_headers(token)
+    if not response.ok:
+        return dict(failed=True, msg=f"{resource_name} API call failed with HTTP {response.status}",
+                    status=response.status, response=response.data())
+    return dict(changed=True, response=response.data())
 
-    url = f"{base_url}/api{path}"
 
-    result = dict(changed=False, response={})
+def resource_snapshots(module, memory=False):
+    """
+    Return the SnapshotCache of the snapshot_cache options of module, or
+    None when snapshots are not used. memory: see SnapshotCache.
+    """
+    if not module.params.get("snapshot_cache"):
+        return None
+    return SnapshotCache(module.params.get("cache_dir"),
+                         module.params.get("snapshot_cache_ttl") or DEFAULT_SNAPSHOT_TTL, memory,
+                         module.params.get("snapshot_cache_size", DEFAULT_SNAPSHOT_SIZE))
+
 
+def run_resource(module, resource_name, path):
+    """
+    Generic resource runner for Verity API modules.
+    - resource_name: "acls", "badges", etc.
+    - path: relative API path, e.g. "/acls"
+    """
     try:
-        if action in ['create', 'update']:
-            if module.params['action'] == 'create':
-                http_method = requests.put
-            else:
-                http_method = requests.patch
-            response = http_method(url,
-                                   headers=headers,
-                                   params=params,
-                                   json=data
-                                   )
-            result["changed"] = True
-            try:
-                result["response"] = response.json()
-            except requests.exceptions.JSONDecodeError:
-                result["response"] = response.text
-        elif action == "delete":
-            response = requests.delete(
-                url,
-                headers=headers,
-                params=params
-            )
-            result["changed"] = True
-            try:
-                result["response"] = response.json()
-            except requests.exceptions.JSONDecodeError:
-                result["response"] = response.text
-    except Exception as e:
+        client = VerityClient(module)
+    except VerityApiError as e:
         module.fail_json(msg=f"{resource_name} API call failed: {str(e)}")
 
+    result = apply_resource(client, resource_name, path, module.params["action"],
+                            data=module.params.get("data"), params=module.params.get("params"),
+                            names=module.params.get("names"), fields=module.params.get("fields"),
+                            state=module.params.get("state"),
+                            check_mode=module.check_mode, diff=module._diff,
+                            snapshots=resource_snapshots(module),
+                            validate=module.params.get("validate_data", True))
+    if result.pop("failed", False):
+        module.fail_json(**result)
     module.exit_json(**result)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Retry policy for Verity API calls
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+# Statuses worth retrying: throttling and a controller or proxy that is
+# restarting or overloaded. Anything else is returned to the caller.
+RETRY_STATUS_CODES = frozenset((429, 502, 503, 504))
+
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_BACKOFF = 0.5
+DEFAULT_MAX_BACKOFF = 30.0
+# Longest Retry-After honoured; longer requests are waited this long
+DEFAULT_MAX_RETRY_AFTER = 60.0
+
+
+def parse_retry_after(value):
+    """
+    Return the delay in seconds requested by a Retry-After header, which
+    holds either a number of seconds or an HTTP date, or None.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy(object):
+    """
+    Exponential backoff with full jitter, bounded by a number of attempts
+    and by an optional deadline counted from the creation of the policy.
+    Delays asked by the server are capped at max_retry_after.
+    """
+
+    def __init__(self, max_attempts=DEFAULT_MAX_ATTEMPTS, backoff=DEFAULT_BACKOFF,
+                 max_backoff=DEFAULT_MAX_BACKOFF, deadline=None, max_retry_after=DEFAULT_MAX_RETRY_AFTER):
+        self.max_attempts = max(1, max_attempts)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.max_retry_after = max_retry_after
+        self.started = time.monotonic()
+
+    @classmethod
+    def from_params(cls, params):
+        return cls(
+            max_attempts=params.get("max_attempts") or DEFAULT_MAX_ATTEMPTS,
+            backoff=params.get("retry_backoff", DEFAULT_BACKOFF),
+            deadline=params.get("deadline"),
+        )
+
+    def remaining(self):
+        """
+        Return the seconds left before the deadline, or None without one.
+        """
+        if not self.deadline:
+            return None
+        return self.deadline - (time.monotonic() - self.started)
+
+    def next_delay(self, attempt, retry_after=None):
+        """
+        Return how long to wait before the attempt following attempt
+        (counted from 1), or None if the attempts or the deadline are
+        exhausted. A server supplied Retry-After takes precedence over the
+        computed backoff, up to max_retry_after.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if retry_after is None:
+            ceiling = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+            delay = random.uniform(0, ceiling)
+        else:
+            delay = min(retry_after, self.max_retry_after)
+        remaining = self.remaining()
+        if remaining is not None and delay >= remaining:
+            return None
+        return delay
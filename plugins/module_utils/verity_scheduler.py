@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# Dependency-ordered waves of batch operations
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_resource import (
+    RESOURCES,
+)
+
+REF_SUFFIX = "_ref_type_"
+
+# Object type named in *_ref_type_ fields -> resource
+OBJECT_TYPES = dict(
+    (object_type, name)
+    for name, resource in RESOURCES.items()
+    for object_type in (resource["key"],) + resource.get("types", ())
+)
+
+
+def iter_refs(document):
+    """
+    Yield (resource, name) for every object referenced by document, an
+    object or list entry: each <field>_ref_type_ gives the type of the
+    object named by <field>. Entries of list fields are searched too.
+    """
+    for field, value in document.items():
+        if field.endswith(REF_SUFFIX):
+            target = document.get(field[:-len(REF_SUFFIX)])
+            if target and value in OBJECT_TYPES:
+                yield OBJECT_TYPES[value], target
+        elif isinstance(value, list):
+            for entry in value:
+                if isinstance(entry, dict):
+                    for ref in iter_refs(entry):
+                        yield ref
+
+
+def type_levels():
+    """
+    Return {resource: level} such that resources only reference resources
+    of lower levels, from the static refs of RESOURCES. Self references are
+    ignored, and cycles of types (tenants -> routemaps -> routemapclauses ->
+    tenants) are broken where the alphabetical walk first closes them.
+    """
+    levels = {}
+    visiting = set()
+
+    def level(name):
+        if name in levels:
+            return levels[name]
+        if name in visiting:
+            return -1
+        visiting.add(name)
+        value = 1 + max([level(ref) for ref in RESOURCES[name]["refs"] if ref != name] or [-1])
+        visiting.discard(name)
+        levels[name] = value
+        return value
+
+    for name in sorted(RESOURCES):
+        level(name)
+    return levels
+
+
+def _kind(operation, default_action, default_state):
+    state = operation.get("state") or default_state
+    if state:
+        return "delete" if state == "absent" else "write"
+    action = operation.get("action") or default_action
+    return {"delete": "delete", "get": "read"}.get(action, "write")
+
+
+def _documents(operation):
+    # ((resource, name), document) of the objects of the operation data
+    resource = operation["resource"]
+    for objects in (operation.get("data") or {}).values():
+        if isinstance(objects, dict):
+            for name, document in objects.items():
+                yield (resource, name), document or {}
+
+
+def _touched(operation):
+    # (resource, name) of the objects an operation reads or writes, named
+    # by its data, names or <key>_name param; (resource, None) stands for
+    # the whole resource when it names none
+    resource = operation["resource"]
+    names = set(operation.get("names") or ())
+    names.update(obj[1] for obj, _document in _documents(operation))
+    selected = (operation.get("params") or {}).get(f"{RESOURCES[resource]['key']}_name")
+    if selected:
+        names.update(selected if isinstance(selected, list) else [selected])
+    return set((resource, name) for name in names) or set([(resource, None)])
+
+
+def plan_waves(operations, default_action="create", default_state=None):
+    """
+    Split operations into waves, lists of operation indexes in which every
+    operation only depends on operations of earlier waves, so that each
+    wave can run in parallel. Return (waves, cyclic).
+
+    Operations on the same object keep their order, gets only among
+    writes and deletes. Operations on different objects are only ordered
+    by references:
+    - a create or update comes after the creates and updates of the
+      objects its data references, wherever they are in the batch
+    - a delete and an operation whose data references the deleted object
+      keep their order
+    - a delete comes after the earlier creates and updates of the
+      resources that can reference its resource (the refs of RESOURCES),
+      as they may be what drops the references to the deleted object
+    - a delete comes before the deletes of the resources its resource can
+      reference (the refs of RESOURCES), their order being kept when both
+      resources can reference each other
+    References to objects outside the batch are assumed to exist.
+    When a reference cycle leaves no operation ready, the first pending one
+    is given a wave of its own and listed in cyclic.
+    """
+    kinds = [_kind(operation, default_action, default_state) for operation in operations]
+    touched = [_touched(operation) for operation in operations]
+    depends = dict((index, set()) for index in range(len(operations)))
+
+    def order(first, second):
+        # Keep the input order of two operations
+        if first != second:
+            depends[max(first, second)].add(min(first, second))
+
+    # Operations on the same object, or on the whole of its resource
+    by_object = {}
+    by_resource = {}
+    for index, objects in enumerate(touched):
+        for obj in objects:
+            related = by_resource.get(obj[0], []) if obj[1] is None else (
+                by_object.get(obj, []) + by_object.get((obj[0], None), []))
+            for other in related:
+                if not kinds[index] == kinds[other] == "read":
+                    order(other, index)
+        for obj in objects:
+            by_object.setdefault(obj, []).append(index)
+            by_resource.setdefault(obj[0], []).append(index)
+
+    # References from the data of creates and updates
+    writers = {}
+    for index, operation in enumerate(operations):
+        if kinds[index] == "write":
+            for obj, _document in _documents(operation):
+                writers.setdefault(obj, []).append(index)
+    for index, operation in enumerate(operations):
+        if kinds[index] != "write":
+            continue
+        for _obj, document in _documents(operation):
+            for ref in iter_refs(document):
+                depends[index].update(writer for writer in writers.get(ref, ()) if writer != index)
+                for other in by_object.get(ref, []) + by_object.get((ref[0], None), []):
+                    if kinds[other] == "delete":
+                        order(other, index)
+
+    # Earlier writes of referencing resources, which may drop the references
+    for index, kind in enumerate(kinds):
+        if kind == "delete":
+            deleted = set(obj[0] for obj in touched[index])
+            depends[index].update(
+                other for other in range(index)
+                if kinds[other] == "write"
+                and deleted.intersection(RESOURCES[operations[other]["resource"]]["refs"]))
+
+    # Deletes of referencing resources first
+    deletes = {}
+    for index, kind in enumerate(kinds):
+        if kind == "delete":
+            for resource in set(obj[0] for obj in touched[index]):
+                deletes.setdefault(resource, []).append(index)
+    for resource, indexes in deletes.items():
+        for referenced in RESOURCES[resource]["refs"]:
+            mutual = referenced == resource or resource in RESOURCES[referenced]["refs"]
+            for index in indexes:
+                for other in deletes.get(referenced, ()):
+                    if mutual:
+                        order(index, other)
+                    elif other != index:
+                        depends[other].add(index)
+
+    waves = []
+    cyclic = []
+    done = set()
+    pending = list(range(len(operations)))
+    while pending:
+        wave = [index for index in pending if depends[index] <= done]
+        if not wave:
+            # Reference cycle: run its first operation alone and go on
+            wave = pending[:1]
+            cyclic.append(pending[0])
+        waves.append(wave)
+        done.update(wave)
+        pending = [index for index in pending if index not in done]
+    return waves, cyclic
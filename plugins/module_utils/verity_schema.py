@@ -0,0 +1,1263 @@
+# -*- coding: utf-8 -*-
+# Generated by tools/generate_schemas.py from the DOCUMENTATION of the
+# resource modules; run it again after changing them, do not edit.
+
+# Resource -> object type -> field -> spec (type, elements, choices,
+# default and the options of dict and list-of-dict fields)
+SCHEMAS = {
+    "acls": {
+        "ip_filter": {
+            "bidirectional": {"type": "bool", "default": False},
+            "destination_ip": {"type": "str", "default": ""},
+            "destination_port_1": {"type": "int"},
+            "destination_port_2": {"type": "int"},
+            "destination_port_operator": {
+                "type": "str",
+                "choices": ["", "equal", "greater", "less", "range"],
+                "default": "",
+            },
+            "enable": {"type": "bool", "default": False},
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {"notes": {"type": "str", "default": ""}},
+            },
+            "protocol": {"type": "str", "default": ""},
+            "source_ip": {"type": "str", "default": ""},
+            "source_port_1": {"type": "int"},
+            "source_port_2": {"type": "int"},
+            "source_port_operator": {
+                "type": "str",
+                "choices": ["", "equal", "greater", "less", "range"],
+                "default": "",
+            },
+        },
+    },
+    "aspathaccesslists": {
+        "as_path_access_list": {
+            "enable": {"type": "bool", "default": False},
+            "lists": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "enable": {"type": "bool", "default": False},
+                    "index": {"type": "int"},
+                    "regular_expression": {"type": "str", "default": ""},
+                },
+            },
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {"notes": {"type": "str", "default": ""}},
+            },
+            "permit_deny": {"type": "str", "choices": ["permit", "deny"], "default": "permit"},
+        },
+    },
+    "badges": {
+        "badge": {
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {"notes": {"type": "str", "default": ""}},
+            },
+        },
+    },
+    "bundles": {
+        "endpoint_bundle": {
+            "cli_commands": {"type": "str", "default": ""},
+            "device_settings": {"type": "str", "default": "eth_device_profile|(Device Settings)|"},
+            "device_settings_ref_type_": {"type": "str", "choices": ["eth_device_profiles"]},
+            "eth_port_paths": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "eth_port_num_eth_port_profile": {"type": "str", "default": ""},
+                    "eth_port_num_eth_port_profile_ref_type_": {
+                        "type": "str",
+                        "choices": ["eth_port_profile_", "lag", "pb_egress_profile"],
+                    },
+                    "eth_port_num_eth_port_settings": {"type": "str", "default": ""},
+                    "eth_port_num_eth_port_settings_ref_type_": {
+                        "type": "str",
+                        "choices": ["eth_port_settings"],
+                    },
+                    "eth_port_num_gateway_profile": {"type": "str", "default": ""},
+                    "eth_port_num_gateway_profile_ref_type_": {
+                        "type": "str",
+                        "choices": ["gateway_profile", "lag"],
+                    },
+                    "index": {"type": "int"},
+                    "port_name": {"type": "str"},
+                },
+            },
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {"is_for_switch": {"type": "bool", "default": False}},
+            },
+            "rg_services": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "index": {"type": "int"},
+                    "row_ip_mask": {"type": "str", "default": ""},
+                },
+            },
+            "user_services": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "index": {"type": "int"},
+                    "row_app_cli_commands": {"type": "str", "default": ""},
+                    "row_app_connected_service": {"type": "str", "default": ""},
+                    "row_app_connected_service_ref_type_": {"type": "str", "choices": ["service"]},
+                    "row_app_enable": {"type": "bool", "default": False},
+                    "row_ip_mask": {"type": "str", "default": ""},
+                },
+            },
+        },
+    },
+    "communitylists": {
+        "community_list": {
+            "any_all": {"type": "str", "choices": ["any", "all"], "default": "any"},
+            "enable": {"type": "bool", "default": False},
+            "lists": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "community_string_expanded_expression": {"type": "str", "default": ""},
+                    "enable": {"type": "bool", "default": False},
+                    "index": {"type": "int"},
+                    "mode": {
+                        "type": "str",
+                        "choices": [
+                            "no_advertise",
+                            "local_as",
+                            "no_peer_set",
+                            "community",
+                            "no_export_set",
+                        ],
+                        "default": "community",
+                    },
+                },
+            },
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {"notes": {"type": "str", "default": ""}},
+            },
+            "permit_deny": {"type": "str", "choices": ["permit", "deny"], "default": "permit"},
+            "standard_expanded": {
+                "type": "str",
+                "choices": ["standard", "expanded"],
+                "default": "standard",
+            },
+        },
+    },
+    "devicecontrollers": {
+        "device_controller": {
+            "authentication_protocol": {"type": "str", "choices": ["SHA", "MD5"], "default": "MD5"},
+            "cli_access_mode": {"type": "str", "choices": ["SSH", "Telnet"], "default": "SSH"},
+            "comm_type": {
+                "type": "str",
+                "choices": ["gnmi", "snmpv2", "snmpv3"],
+                "default": "gnmi",
+            },
+            "communication_mode": {
+                "type": "str",
+                "choices": [
+                    "sonic",
+                    "cisco_small_business_sgxxx",
+                    "generic_advanced_snmp",
+                    "arista_7050_series",
+                    "generic_snmp",
+                    "edgecore_ecs21000",
+                    "cisco_nexus_9xxx",
+                    "ruckus_icx7150",
+                    "tibit_xgs_olt_sfp",
+                    "cisco_catalyst_c3xxx",
+                    "juniper_acx5048",
+                    "adtran_netvanta_series",
+                    "eltex_ltp_gpon_olt",
+                    "hpe_aruba_2530_series",
+                    "netgear_prosafe_series",
+                    "microtik_routeros_telnet",
+                ],
+                "default": "sonic",
+            },
+            "controller_ip_and_mask": {"type": "str", "default": ""},
+            "enable": {"type": "bool", "default": False},
+            "enable_password": {"type": "str", "default": ""},
+            "enable_password_encrypted": {"type": "str", "default": ""},
+            "gateway": {"type": "str", "default": ""},
+            "ip_source": {"type": "str", "choices": ["dhcp", "static"], "default": "dhcp"},
+            "lldp_search_string": {"type": "str", "default": ""},
+            "located_by": {
+                "type": "str",
+                "choices": ["Static Port", "LLDP", "LAG_IDL", "LAG", "as_site"],
+                "default": "LLDP",
+            },
+            "managed_on_native_vlan": {"type": "bool", "default": True},
+            "name": {"type": "str", "default": ""},
+            "passphrase": {"type": "str", "default": ""},
+            "passphrase_encrypted": {"type": "str", "default": ""},
+            "password": {"type": "str", "default": ""},
+            "password_encrypted": {"type": "str", "default": ""},
+            "power_state": {"type": "str", "default": "on"},
+            "private_password": {"type": "str", "default": ""},
+            "private_password_encrypted": {"type": "str", "default": ""},
+            "private_protocol": {"type": "str", "choices": ["AES", "DES"], "default": "DES"},
+            "sdlc": {"type": "str", "default": ""},
+            "security_type": {
+                "type": "str",
+                "choices": ["authPriv", "noAuthNoPriv", "authNoPriv"],
+                "default": "noAuthNoPriv",
+            },
+            "snmp_community_string": {"type": "str", "default": "private"},
+            "snmpv3_username": {"type": "str", "default": ""},
+            "ssh_key_or_password": {"type": "str", "default": ""},
+            "ssh_key_or_password_encrypted": {"type": "str", "default": ""},
+            "switch_gateway": {"type": "str", "default": ""},
+            "switch_ip_and_mask": {"type": "str", "default": ""},
+            "switchpoint": {"type": "str", "default": ""},
+            "switchpoint_ref_type_": {"type": "str", "choices": ["switchpoint"]},
+            "uplink_port": {"type": "str", "default": ""},
+            "username": {"type": "str", "default": ""},
+            "ztp_identification": {"type": "str", "default": ""},
+        },
+    },
+    "devicesettings": {
+        "eth_device_profiles": {
+            "commit_to_flash_interval": {"type": "int", "default": 60},
+            "cut_through_switching": {"type": "bool", "default": False},
+            "disable_tcp_udp_learned_packet_acceleration": {"type": "bool", "default": False},
+            "enable": {"type": "bool", "default": False},
+            "external_battery_power_available": {"type": "int", "default": 40},
+            "external_power_available": {"type": "int", "default": 75},
+            "mode": {
+                "type": "str",
+                "choices": ["IEEE 802.3af", "Manual"],
+                "default": "IEEE 802.3af",
+            },
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {"group": {"type": "str", "default": ""}},
+            },
+            "rocev2": {"type": "bool", "default": False},
+            "security_audit_interval": {"type": "int", "default": 60},
+            "usage_threshold": {"type": "float", "default": "0.99"},
+        },
+    },
+    "ethportprofiles": {
+        "eth_port_profile_": {
+            "enable": {"type": "bool", "default": False},
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {
+                    "group": {"type": "str", "default": ""},
+                    "port_monitoring": {
+                        "type": "str",
+                        "choices": ["critical", "high", ""],
+                        "default": "high",
+                    },
+                },
+            },
+            "services": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "index": {"type": "int"},
+                    "row_num_enable": {"type": "bool", "default": False},
+                    "row_num_external_vlan": {"type": "int"},
+                    "row_num_service": {"type": "str", "default": ""},
+                    "row_num_service_ref_type_": {"type": "str", "choices": ["service"]},
+                },
+            },
+            "tenant_slice_managed": {"type": "bool", "default": False},
+        },
+    },
+    "ethportsettings": {
+        "eth_port_settings": {
+            "action": {
+                "type": "str",
+                "choices": ["Protect", "Restrict", "Shutdown"],
+                "default": "Protect",
+            },
+            "allocated_power": {"type": "str", "default": "0.0"},
+            "auto_negotiation": {"type": "bool", "default": True},
+            "bpdu_filter": {"type": "bool", "default": False},
+            "bpdu_guard": {"type": "bool", "default": False},
+            "broadcast": {"type": "bool", "default": True},
+            "bsp_enable": {"type": "bool", "default": False},
+            "duplex_mode": {"type": "str", "choices": ["Full", "Auto", "Half"], "default": "Auto"},
+            "enable": {"type": "bool", "default": False},
+            "enable_ecn": {"type": "bool", "default": True},
+            "enable_watchdog_tuning": {"type": "bool", "default": False},
+            "enable_wred_tuning": {"type": "bool", "default": False},
+            "fast_learning_mode": {"type": "bool", "default": True},
+            "fec": {
+                "type": "str",
+                "choices": ["none", "rs", "fc", "unaltered", "rs-custom", "auto"],
+                "default": "unaltered",
+            },
+            "guard_loop": {"type": "bool", "default": False},
+            "max_allowed_unit": {"type": "str", "choices": ["pps", "%", "Kpps"], "default": "pps"},
+            "max_allowed_value": {"type": "int", "default": 1000},
+            "max_bit_rate": {
+                "type": "str",
+                "choices": [
+                    "10000",
+                    "10",
+                    "5000",
+                    "25000",
+                    "2500",
+                    "50000",
+                    "-1",
+                    "400000",
+                    "100000",
+                    "1000",
+                    "100",
+                    "40000",
+                ],
+                "default": "-1",
+            },
+            "maximum_wred_threshold": {"type": "int", "default": 1},
+            "minimum_wred_threshold": {"type": "int", "default": 1},
+            "multicast": {"type": "bool", "default": True},
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {"group": {"type": "str", "default": ""}},
+            },
+            "packet_queue": {"type": "str", "default": ""},
+            "packet_queue_ref_type_": {"type": "str", "choices": ["packet_queue"]},
+            "poe_enable": {"type": "bool", "default": False},
+            "priority": {"type": "str", "choices": ["Critical", "High", "Low"], "default": "High"},
+            "priority_flow_control_watchdog_action": {
+                "type": "str",
+                "choices": ["DROP", "FORWARD"],
+                "default": "DROP",
+            },
+            "priority_flow_control_watchdog_detect_time": {"type": "int", "default": 100},
+            "priority_flow_control_watchdog_restore_time": {"type": "int", "default": 100},
+            "single_link": {"type": "bool", "default": False},
+            "stp_enable": {"type": "bool", "default": False},
+            "wred_drop_probability": {"type": "int", "default": 0},
+        },
+    },
+    "extendedcommunitylists": {
+        "extended_community_list": {
+            "any_all": {"type": "str", "choices": ["any", "all"], "default": "any"},
+            "enable": {"type": "bool", "default": False},
+            "lists": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "enable": {"type": "bool", "default": False},
+                    "index": {"type": "int"},
+                    "mode": {"type": "str", "choices": ["route", "soo"], "default": "route"},
+                    "route_target_expanded_expression": {"type": "str", "default": ""},
+                },
+            },
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {"notes": {"type": "str", "default": ""}},
+            },
+            "permit_deny": {"type": "str", "choices": ["permit", "deny"], "default": "permit"},
+            "standard_expanded": {
+                "type": "str",
+                "choices": ["standard", "expanded"],
+                "default": "standard",
+            },
+        },
+    },
+    "gatewayprofiles": {
+        "gateway_profile": {
+            "enable": {"type": "bool", "default": False},
+            "external_gateways": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "enable": {"type": "bool", "default": False},
+                    "gateway": {"type": "str", "default": ""},
+                    "gateway_ref_type_": {"type": "str", "choices": ["gateway"]},
+                    "index": {"type": "int"},
+                    "peer_gw": {"type": "bool", "default": False},
+                    "source_ip_mask": {"type": "str", "default": ""},
+                },
+            },
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {"group": {"type": "str", "default": ""}},
+            },
+            "tenant_slice_managed": {"type": "bool", "default": False},
+        },
+    },
+    "gateways": {
+        "gateway": {
+            "advertisement_interval": {"type": "int", "default": 30},
+            "anycast_ip_mask": {"type": "str", "default": ""},
+            "bfd_detect_multiplier": {"type": "int", "default": 3},
+            "bfd_multihop": {"type": "bool", "default": False},
+            "bfd_receive_interval": {"type": "int", "default": 300},
+            "bfd_transmission_interval": {"type": "int", "default": 300},
+            "connect_timer": {"type": "int", "default": 120},
+            "default_originate": {"type": "bool", "default": False},
+            "dynamic_bgp_limits": {"type": "int", "default": 0},
+            "dynamic_bgp_subnet": {"type": "str", "default": ""},
+            "ebgp_multihop": {"type": "int", "default": 255},
+            "egress_vlan": {"type": "int"},
+            "enable": {"type": "bool", "default": False},
+            "enable_bfd": {"type": "bool", "default": False},
+            "export_route_map": {"type": "str", "default": ""},
+            "export_route_map_ref_type_": {"type": "str", "choices": ["route_map"]},
+            "fabric_interconnect": {"type": "bool", "default": False},
+            "gateway_mode": {
+                "type": "str",
+                "choices": ["Dynamic BGP", "Static BGP", "Static", "Default"],
+                "default": "Static BGP",
+            },
+            "helper_hop_ip_address": {"type": "str", "default": ""},
+            "hold_timer": {"type": "int", "default": 180},
+            "import_route_map": {"type": "str", "default": ""},
+            "import_route_map_ref_type_": {"type": "str", "choices": ["route_map"]},
+            "keepalive_timer": {"type": "int", "default": 60},
+            "local_as_no_prepend": {"type": "bool", "default": False},
+            "local_as_number": {"type": "int"},
+            "max_local_as_occurrences": {"type": "int", "default": 0},
+            "md5_password": {"type": "str", "default": ""},
+            "name": {"type": "str", "default": ""},
+            "neighbor_as_number": {"type": "int"},
+            "neighbor_ip_address": {"type": "str", "default": ""},
+            "next_hop_self": {"type": "bool", "default": False},
+            "object_properties": {
+                "type": "dict",
+                "options": {"group": {"type": "str", "default": ""}},
+            },
+            "replace_as": {"type": "bool", "default": False},
+            "source_ip_address": {"type": "str", "default": ""},
+            "static_routes": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "ad_value": {"type": "int"},
+                    "enable": {"type": "bool", "default": False},
+                    "index": {"type": "int"},
+                    "ipv4_route_prefix": {"type": "str", "default": ""},
+                    "next_hop_ip_address": {"type": "str", "default": ""},
+                },
+            },
+            "tenant": {"type": "str", "default": ""},
+            "tenant_ref_type_": {"type": "str", "choices": ["tenant", "site"]},
+        },
+    },
+    "imageupdatesets": {
+        "image_update_sets": {
+            "comm_on_summary": {"type": "bool", "default": True},
+            "enable": {"type": "bool", "default": True},
+            "installation_on_summary": {"type": "bool", "default": True},
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {"firmware_count": {"type": "int", "default": 0}},
+            },
+            "provisioning_on_summary": {"type": "bool", "default": True},
+            "section": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "endpoint_set_num_name": {"type": "str", "default": ""},
+                    "endpoint_set_num_on_summary": {"type": "bool", "default": True},
+                    "endpoint_set_num_subrule_1_inverted": {"type": "bool", "default": False},
+                    "endpoint_set_num_subrule_1_reference_path": {"type": "str", "default": ""},
+                    "endpoint_set_num_subrule_1_reference_path_ref_type_": {"type": "str"},
+                    "endpoint_set_num_subrule_1_type": {
+                        "type": "str",
+                        "choices": [
+                            "",
+                            "productClass",
+                            "endpoint_type",
+                            "endpoint",
+                            "badge_color",
+                            "pod",
+                            "badge",
+                            "deviceSerialNumber",
+                        ],
+                        "default": "",
+                    },
+                    "endpoint_set_num_subrule_1_value": {"type": "str", "default": ""},
+                    "endpoint_set_num_subrule_2_inverted": {"type": "bool", "default": False},
+                    "endpoint_set_num_subrule_2_reference_path": {"type": "str", "default": ""},
+                    "endpoint_set_num_subrule_2_reference_path_ref_type_": {"type": "str"},
+                    "endpoint_set_num_subrule_2_type": {
+                        "type": "str",
+                        "choices": [
+                            "",
+                            "productClass",
+                            "endpoint_type",
+                            "endpoint",
+                            "badge_color",
+                            "pod",
+                            "badge",
+                            "deviceSerialNumber",
+                        ],
+                        "default": "",
+                    },
+                    "endpoint_set_num_subrule_2_value": {"type": "str", "default": ""},
+                    "endpoint_set_num_subrule_3_inverted": {"type": "bool", "default": False},
+                    "endpoint_set_num_subrule_3_reference_path": {"type": "str", "default": ""},
+                    "endpoint_set_num_subrule_3_reference_path_ref_type_": {"type": "str"},
+                    "endpoint_set_num_subrule_3_type": {
+                        "type": "str",
+                        "choices": [
+                            "",
+                            "productClass",
+                            "endpoint_type",
+                            "endpoint",
+                            "badge_color",
+                            "pod",
+                            "badge",
+                            "deviceSerialNumber",
+                        ],
+                        "default": "",
+                    },
+                    "endpoint_set_num_subrule_3_value": {"type": "str", "default": ""},
+                    "endpoint_set_num_target_upgrade_version": {
+                        "type": "str",
+                        "choices": ["1.8.1.5", "1.8.1.4", "unmanaged"],
+                        "default": "unmanaged",
+                    },
+                    "endpoint_set_num_target_upgrade_version_time": {"type": "str", "default": ""},
+                    "endpoint_set_num_unique_identifier": {
+                        "type": "str",
+                        "default": "17553442285981",
+                    },
+                },
+            },
+            "section_else": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "endpoint_set_for_all_others_target_upgrade_version": {
+                        "type": "str",
+                        "choices": ["1.8.1.5", "1.8.1.4", "unmanaged"],
+                        "default": "unmanaged",
+                    },
+                    "endpoint_set_for_all_others_target_upgrade_version_time": {
+                        "type": "str",
+                        "default": "",
+                    },
+                    "endpoint_set_for_all_others_unique_identifier": {
+                        "type": "str",
+                        "default": "else",
+                    },
+                    "endpoint_set_num_name": {"type": "str", "default": "All Others"},
+                    "endpoint_set_num_on_summary": {"type": "bool", "default": True},
+                },
+            },
+            "section_pointless": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "endpoint_set_for_endpointless_target_upgrade_version": {
+                        "type": "str",
+                        "choices": ["1.8.1.5", "1.8.1.4", "unmanaged"],
+                        "default": "unmanaged",
+                    },
+                    "endpoint_set_for_endpointless_target_upgrade_version_time": {
+                        "type": "str",
+                        "default": "",
+                    },
+                    "endpoint_set_for_endpointless_unique_identifier": {
+                        "type": "str",
+                        "default": "pointless",
+                    },
+                    "endpoint_set_num_name": {"type": "str", "default": "Unassigned Devices"},
+                    "endpoint_set_num_on_summary": {"type": "bool", "default": True},
+                },
+            },
+            "type": {"type": "str", "choices": ["whitebox", "blackbox"], "default": "blackbox"},
+            "upgrader_on_summary": {"type": "bool", "default": True},
+        },
+    },
+    "ipv4lists": {
+        "ipv4_list_filter": {
+            "enable": {"type": "bool", "default": False},
+            "ipv4_list": {"type": "str", "default": ""},
+            "name": {"type": "str", "default": ""},
+        },
+    },
+    "ipv4prefixlists": {
+        "ipv4_prefix_list": {
+            "enable": {"type": "bool", "default": False},
+            "lists": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "enable": {"type": "bool", "default": False},
+                    "greater_than_equal_value": {"type": "int"},
+                    "index": {"type": "int"},
+                    "ipv4_prefix": {"type": "str", "default": ""},
+                    "less_than_equal_value": {"type": "int"},
+                    "permit_deny": {
+                        "type": "str",
+                        "choices": ["permit", "deny"],
+                        "default": "permit",
+                    },
+                },
+            },
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {"notes": {"type": "str", "default": ""}},
+            },
+        },
+    },
+    "ipv6lists": {
+        "ipv6_list_filter": {
+            "enable": {"type": "bool", "default": False},
+            "ipv6_list": {"type": "str", "default": ""},
+            "name": {"type": "str", "default": ""},
+        },
+    },
+    "ipv6prefixlists": {
+        "ipv6_prefix_list": {
+            "enable": {"type": "bool", "default": False},
+            "lists": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "enable": {"type": "bool", "default": False},
+                    "greater_than_equal_value": {"type": "int"},
+                    "ipv6_prefix": {"type": "str", "default": ""},
+                    "less_than_equal_value": {"type": "int"},
+                    "permit_deny": {
+                        "type": "str",
+                        "choices": ["permit", "deny"],
+                        "default": "permit",
+                    },
+                },
+            },
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {"notes": {"type": "str", "default": ""}},
+            },
+        },
+    },
+    "lags": {
+        "lag": {
+            "color": {
+                "type": "str",
+                "choices": [
+                    "anakiwa",
+                    "chardonnay",
+                    "lavender",
+                    "cornflower",
+                    "emerald",
+                    "starship",
+                ],
+                "default": "anakiwa",
+            },
+            "enable": {"type": "bool", "default": False},
+            "eth_port_profile": {"type": "str", "default": ""},
+            "eth_port_profile_ref_type_": {
+                "type": "str",
+                "choices": ["eth_port_profile_", "gateway_profile", "pb_egress_profile"],
+            },
+            "fallback": {"type": "bool", "default": False},
+            "fast_rate": {"type": "bool", "default": False},
+            "is_peer_link": {"type": "bool", "choices": [True, False], "default": False},
+            "lacp": {"type": "bool", "default": True},
+            "name": {"type": "str", "default": ""},
+            "object_properties": {"type": "dict", "options": {}},
+            "peer_link_vlan": {"type": "int"},
+            "uplink": {"type": "bool", "default": False},
+        },
+    },
+    "packetbroker": {
+        "pb_egress_profile": {
+            "enable": {"type": "bool", "default": False},
+            "ipv4_deny": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "enable": {"type": "bool", "default": False},
+                    "filter": {"type": "str", "default": ""},
+                    "filter_ref_type_": {
+                        "type": "str",
+                        "choices": ["ipv4_filter", "ipv4_list_filter"],
+                    },
+                    "index": {"type": "int"},
+                },
+            },
+            "ipv4_permit": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "enable": {"type": "bool", "default": False},
+                    "filter": {"type": "str", "default": ""},
+                    "filter_ref_type_": {
+                        "type": "str",
+                        "choices": ["ipv4_filter", "ipv4_list_filter"],
+                    },
+                    "index": {"type": "int"},
+                },
+            },
+            "ipv6_deny": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "enable": {"type": "bool", "default": False},
+                    "filter": {"type": "str", "default": ""},
+                    "filter_ref_type_": {
+                        "type": "str",
+                        "choices": ["ipv6_filter", "ipv6_list_filter"],
+                    },
+                    "index": {"type": "int"},
+                },
+            },
+            "ipv6_permit": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "enable": {"type": "bool", "default": False},
+                    "filter": {"type": "str", "default": ""},
+                    "filter_ref_type_": {
+                        "type": "str",
+                        "choices": ["ipv6_filter", "ipv6_list_filter"],
+                    },
+                    "index": {"type": "int"},
+                },
+            },
+            "name": {"type": "str", "default": ""},
+        },
+    },
+    "packetqueues": {
+        "packet_queue": {
+            "enable": {"type": "bool", "default": False},
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {
+                    "group": {"type": "str", "default": ""},
+                    "isdefault": {"type": "bool", "default": False},
+                },
+            },
+            "pbit": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "index": {"type": "int"},
+                    "packet_queue_for_p_bit": {"type": "int", "default": 0},
+                },
+            },
+            "queue": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "bandwidth_for_queue": {"type": "int", "default": 0},
+                    "index": {"type": "int"},
+                    "scheduler_type": {
+                        "type": "str",
+                        "choices": ["", "WRR", "SP", "DWRR"],
+                        "default": "SP",
+                    },
+                    "scheduler_weight": {"type": "int", "default": 0},
+                },
+            },
+        },
+    },
+    "pods": {
+        "pod": {
+            "enable": {"type": "bool", "default": True},
+            "name": {"type": "str", "default": ""},
+        },
+    },
+    "portacls": {
+        "port_acl": {
+            "enable": {"type": "bool", "default": False},
+            "ipv4_deny": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "enable": {"type": "bool", "default": False},
+                    "filter": {"type": "str", "default": ""},
+                    "filter_ref_type_": {"type": "str", "choices": ["ipv4_filter"]},
+                },
+            },
+            "ipv4_permit": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "enable": {"type": "bool", "default": False},
+                    "filter": {"type": "str", "default": ""},
+                    "filter_ref_type_": {"type": "str", "choices": ["ipv4_filter"]},
+                },
+            },
+            "ipv6_deny": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "enable": {"type": "bool", "default": False},
+                    "filter": {"type": "str", "default": ""},
+                    "filter_ref_type_": {"type": "str", "choices": ["ipv6_filter"]},
+                },
+            },
+            "ipv6_permit": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "enable": {"type": "bool", "default": False},
+                    "filter": {"type": "str", "default": ""},
+                    "filter_ref_type_": {"type": "str", "choices": ["ipv6_filter"]},
+                },
+            },
+            "name": {"type": "str", "default": ""},
+        },
+    },
+    "routemapclauses": {
+        "route_map_clause": {
+            "enable": {"type": "bool", "default": False},
+            "match_as_path_access_list": {"type": "str", "default": ""},
+            "match_as_path_access_list_ref_type_": {
+                "type": "str",
+                "choices": ["as_path_access_list"],
+            },
+            "match_community_list": {"type": "str", "default": ""},
+            "match_community_list_ref_type_": {"type": "str", "choices": ["community_list"]},
+            "match_evpn_route_type": {
+                "type": "str",
+                "choices": ["", "macip", "multicast", "prefix"],
+                "default": "",
+            },
+            "match_evpn_route_type_default": {"type": "bool"},
+            "match_extended_community_list": {"type": "str", "default": ""},
+            "match_extended_community_list_ref_type_": {
+                "type": "str",
+                "choices": ["extended_community_list"],
+            },
+            "match_interface_number": {"type": "int"},
+            "match_interface_vlan": {"type": "int"},
+            "match_ipv4_address_ip_prefix_list": {"type": "str", "default": ""},
+            "match_ipv4_address_ip_prefix_list_ref_type_": {
+                "type": "str",
+                "choices": ["ipv4_prefix_list"],
+            },
+            "match_ipv4_next_hop_ip_prefix_list": {"type": "str", "default": ""},
+            "match_ipv4_next_hop_ip_prefix_list_ref_type_": {
+                "type": "str",
+                "choices": ["ipv4_prefix_list"],
+            },
+            "match_ipv6_address_ipv6_prefix_list": {"type": "str", "default": ""},
+            "match_ipv6_address_ipv6_prefix_list_ref_type_": {
+                "type": "str",
+                "choices": ["ipv6_prefix_list"],
+            },
+            "match_ipv6_next_hop_ipv6_prefix_list": {"type": "str", "default": ""},
+            "match_ipv6_next_hop_ipv6_prefix_list_ref_type_": {
+                "type": "str",
+                "choices": ["ipv6_prefix_list"],
+            },
+            "match_local_preference": {"type": "int"},
+            "match_metric": {"type": "int"},
+            "match_origin": {
+                "type": "str",
+                "choices": ["", "egp", "igp", "incomplete"],
+                "default": "",
+            },
+            "match_peer_interface": {"type": "int"},
+            "match_peer_ip_address": {"type": "str", "default": ""},
+            "match_peer_vlan": {"type": "int"},
+            "match_source_protocol": {
+                "type": "str",
+                "choices": ["", "bgp", "connected", "ospf", "static"],
+                "default": "",
+            },
+            "match_tag": {"type": "int"},
+            "match_vni": {"type": "int"},
+            "match_vrf": {"type": "str", "default": ""},
+            "match_vrf_ref_type_": {"type": "str", "choices": ["tenant"]},
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {
+                    "match_fields_shown": {"type": "str", "default": ""},
+                    "notes": {"type": "str", "default": ""},
+                },
+            },
+            "permit_deny": {"type": "str", "choices": ["permit", "deny"], "default": "permit"},
+        },
+    },
+    "routemaps": {
+        "route_map": {
+            "enable": {"type": "bool", "default": False},
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {"notes": {"type": "str", "default": ""}},
+            },
+            "route_map_clauses": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "enable": {"type": "bool", "default": False},
+                    "index": {"type": "int"},
+                    "route_map_clause": {"type": "str", "default": ""},
+                    "route_map_clause_ref_type_": {"type": "str", "choices": ["route_map_clause"]},
+                },
+            },
+        },
+    },
+    "services": {
+        "service": {
+            "anycast_ipv4_mask": {"type": "str", "default": ""},
+            "anycast_ipv6_mask": {"type": "str", "default": ""},
+            "dhcp_server_ipv4": {"type": "str", "default": ""},
+            "dhcp_server_ipv6": {"type": "str", "default": ""},
+            "enable": {"type": "bool", "default": False},
+            "mtu": {"type": "int", "default": 1500},
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {"group": {"type": "str", "default": ""}},
+            },
+            "tenant": {"type": "str", "default": ""},
+            "tenant_ref_type_": {"type": "str", "choices": ["tenant"]},
+            "vlan": {"type": "int"},
+            "vni": {"type": "int"},
+            "vni_auto_assigned_": {"type": "bool"},
+        },
+    },
+    "sfpbreakouts": {
+        "sfp_breakouts": {
+            "breakout": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "breakout": {
+                        "type": "str",
+                        "choices": [
+                            "8x1G",
+                            "2x10G",
+                            "pg200G",
+                            "1x50G",
+                            "pg100G",
+                            "2x400G",
+                            "8x400G",
+                            "4x100G",
+                            "1x40G",
+                            "1x1G",
+                            "2x25G",
+                            "pg1G",
+                            "8x10G",
+                            "2x40G",
+                            "1x200G",
+                            "2x50G",
+                            "4x40G",
+                            "pg800G",
+                            "pg10G",
+                            "4x50G",
+                            "8x40G",
+                            "8x200G",
+                            "8x100G",
+                            "8x50G",
+                            "pg40G",
+                            "1x25G",
+                            "2x800G",
+                            "4x400G",
+                            "1x10G",
+                            "4x25G",
+                            "4x1G",
+                            "2x100G",
+                            "8x800G",
+                            "8x25G",
+                            "pg400G",
+                            "1x800G",
+                            "2x200G",
+                            "4x200G",
+                            "pg25G",
+                            "1x100G",
+                            "2x1G",
+                            "1x400G",
+                            "4x10G",
+                            "4x800G",
+                            "pg50G",
+                        ],
+                        "default": "1x100G",
+                    },
+                    "enable": {"type": "bool", "default": False},
+                    "part_number": {"type": "str", "default": ""},
+                    "vendor": {"type": "str", "default": ""},
+                },
+            },
+            "enable": {"type": "bool", "default": False},
+            "name": {"type": "str", "default": ""},
+            "object_properties": {"type": "dict", "options": {}},
+        },
+    },
+    "sites": {
+        "site": {
+            "aggressive_reporting": {"type": "bool", "default": True},
+            "anycast_mac_address": {"type": "str", "default": "(auto)"},
+            "anycast_mac_address_auto_assigned_": {"type": "bool"},
+            "bgp_hold_down_timer": {"type": "int", "default": 180},
+            "bgp_keepalive_timer": {"type": "int", "default": 60},
+            "crc_failure_threshold": {"type": "int", "default": 5},
+            "dscp_to_p_bit_map": {
+                "type": "str",
+                "default": "0000000011111111222222223333333344444444555555556666666677777777",
+            },
+            "enable": {"type": "bool", "default": True},
+            "evpn_mac_holdtime": {"type": "int", "default": 1080},
+            "evpn_multihoming_startup_delay": {"type": "int", "default": 300},
+            "force_spanning_tree_on_fabric_ports": {"type": "bool", "default": False},
+            "islands": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "index": {"type": "int"},
+                    "toi_switchpoint": {"type": "str", "default": ""},
+                    "toi_switchpoint_ref_type_": {"type": "str", "choices": ["switchpoint"]},
+                },
+            },
+            "leaf_bgp_advertisement_interval": {"type": "int", "default": 1},
+            "leaf_bgp_connect_timer": {"type": "int", "default": 120},
+            "leaf_bgp_hold_down_timer": {"type": "int", "default": 180},
+            "leaf_bgp_keep_alive_timer": {"type": "int", "default": 60},
+            "link_state_timeout_value": {"type": "int", "default": 60},
+            "mac_address_aging_time": {"type": "int", "default": 600},
+            "mlag_delay_restore_timer": {"type": "int", "default": 300},
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {
+                    "system_graphs": {
+                        "type": "list",
+                        "elements": "dict",
+                        "options": {
+                            "graph_num_data": {"type": "str", "default": ""},
+                            "index": {"type": "int"},
+                        },
+                    },
+                },
+            },
+            "pairs": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "index": {"type": "int"},
+                    "is_whitebox_pair": {"type": "bool", "default": False},
+                    "lag_group": {"type": "str", "default": ""},
+                    "lag_group_ref_type_": {"type": "str", "choices": ["lag"]},
+                    "name": {"type": "str", "default": ""},
+                    "switchpoint_1": {"type": "str", "default": ""},
+                    "switchpoint_1_ref_type_": {"type": "str", "choices": ["switchpoint"]},
+                    "switchpoint_2": {"type": "str", "default": ""},
+                    "switchpoint_2_ref_type_": {"type": "str", "choices": ["switchpoint"]},
+                },
+            },
+            "read_only_mode": {"type": "bool", "default": False},
+            "region_name": {"type": "str", "default": ""},
+            "revision": {"type": "int", "default": 0},
+            "service_for_site": {"type": "str", "default": "service|Management|"},
+            "service_for_site_ref_type_": {"type": "str", "choices": ["service"]},
+            "spanning_tree_type": {
+                "type": "str",
+                "choices": ["", "pvst", "mstp", "port"],
+                "default": "pvst",
+            },
+            "spine_bgp_advertisement_interval": {"type": "int", "default": 1},
+            "spine_bgp_connect_timer": {"type": "int", "default": 120},
+        },
+    },
+    "switchpoints": {
+        "switchpoint": {
+            "badges": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "badge": {"type": "str", "default": ""},
+                    "badge_ref_type_": {"type": "str", "choices": ["badge"]},
+                    "index": {"type": "int"},
+                },
+            },
+            "bgp_as_number": {"type": "int"},
+            "bgp_as_number_auto_assigned_": {"type": "bool"},
+            "children": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "child_num_device": {"type": "str", "default": ""},
+                    "child_num_endpoint": {"type": "str", "default": ""},
+                    "child_num_endpoint_ref_type_": {"type": "str", "choices": ["switchpoint"]},
+                    "index": {"type": "int"},
+                },
+            },
+            "connected_bundle": {"type": "str", "default": ""},
+            "connected_bundle_ref_type_": {"type": "str", "choices": ["endpoint_bundle"]},
+            "device_serial_number": {"type": "str", "default": ""},
+            "disabled_ports": {"type": "str", "default": ""},
+            "eths": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "breakout": {
+                        "type": "str",
+                        "choices": [
+                            "8x1G",
+                            "2x10G",
+                            "pg200G",
+                            "1x50G",
+                            "pg100G",
+                            "2x400G",
+                            "8x400G",
+                            "4x100G",
+                            "1x40G",
+                            "1x1G",
+                            "2x25G",
+                            "pg1G",
+                            "8x10G",
+                            "2x40G",
+                            "1x200G",
+                            "2x50G",
+                            "4x40G",
+                            "pg800G",
+                            "pg10G",
+                            "4x50G",
+                            "8x40G",
+                            "8x200G",
+                            "8x100G",
+                            "8x50G",
+                            "pg40G",
+                            "",
+                            "1x25G",
+                            "2x800G",
+                            "4x400G",
+                            "1x10G",
+                            "4x25G",
+                            "4x1G",
+                            "2x100G",
+                            "8x800G",
+                            "8x25G",
+                            "pg400G",
+                            "1x800G",
+                            "2x200G",
+                            "4x200G",
+                            "pg25G",
+                            "1x100G",
+                            "2x1G",
+                            "1x400G",
+                            "4x10G",
+                            "4x800G",
+                            "pg50G",
+                        ],
+                        "default": "",
+                    },
+                    "index": {"type": "int"},
+                },
+            },
+            "locked": {"type": "bool", "default": False},
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {
+                    "aggregate": {"type": "bool", "default": False},
+                    "eths": {
+                        "type": "list",
+                        "elements": "dict",
+                        "options": {
+                            "eth_num_icon": {"type": "str", "default": "empty"},
+                            "eth_num_label": {"type": "str", "default": ""},
+                            "index": {"type": "int"},
+                        },
+                    },
+                    "expected_parent_endpoint": {"type": "str", "default": ""},
+                    "expected_parent_endpoint_ref_type_": {
+                        "type": "str",
+                        "choices": ["switchpoint"],
+                    },
+                    "is_host": {"type": "bool", "default": False},
+                    "number_of_multipoints": {"type": "int", "default": 0},
+                    "user_notes": {"type": "str", "default": ""},
+                },
+            },
+            "out_of_band_management": {"type": "bool", "default": False},
+            "pod": {"type": "str", "default": ""},
+            "pod_ref_type_": {"type": "str", "choices": ["pod"]},
+            "rack": {"type": "str", "default": ""},
+            "read_only_mode": {"type": "bool", "default": False},
+            "super_pod": {"type": "str", "default": ""},
+            "switch_router_id_ip_mask": {"type": "str", "default": "(auto)"},
+            "switch_router_id_ip_mask_auto_assigned_": {"type": "bool"},
+            "switch_vtep_id_ip_mask": {"type": "str", "default": "(auto)"},
+            "switch_vtep_id_ip_mask_auto_assigned_": {"type": "bool"},
+            "traffic_mirrors": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "index": {"type": "int"},
+                    "traffic_mirror_num_destination_port": {"type": "str", "default": ""},
+                    "traffic_mirror_num_enable": {"type": "bool", "default": False},
+                    "traffic_mirror_num_inbound_traffic": {"type": "bool", "default": False},
+                    "traffic_mirror_num_outbound_traffic": {"type": "bool", "default": False},
+                    "traffic_mirror_num_source_lag_indicator": {"type": "bool", "default": False},
+                    "traffic_mirror_num_source_port": {"type": "str", "default": ""},
+                },
+            },
+            "type": {
+                "type": "str",
+                "choices": [
+                    "",
+                    "packet_broker",
+                    "management",
+                    "leaf",
+                    "spine",
+                    "packet_broker_tor",
+                    "superspine",
+                    "enterprise",
+                ],
+                "default": "leaf",
+            },
+        },
+    },
+    "tenants": {
+        "tenant": {
+            "default_originate": {"type": "bool", "default": False},
+            "dhcp_relay_source_ipv4s_subnet": {"type": "str", "default": ""},
+            "dhcp_relay_source_ipv6s_subnet": {"type": "str", "default": ""},
+            "enable": {"type": "bool", "default": True},
+            "export_route_map": {"type": "str", "default": ""},
+            "export_route_map_ref_type_": {"type": "str", "choices": ["route_map"]},
+            "import_route_map": {"type": "str", "default": ""},
+            "import_route_map_ref_type_": {"type": "str", "choices": ["route_map"]},
+            "layer_3_vlan": {"type": "int"},
+            "layer_3_vlan_auto_assigned_": {"type": "bool"},
+            "layer_3_vni": {"type": "int"},
+            "layer_3_vni_auto_assigned_": {"type": "bool"},
+            "name": {"type": "str", "default": ""},
+            "object_properties": {
+                "type": "dict",
+                "options": {"group": {"type": "str", "default": ""}},
+            },
+            "route_distinguisher": {"type": "str", "default": ""},
+            "route_target_export": {"type": "str", "default": ""},
+            "route_target_import": {"type": "str", "default": ""},
+            "route_tenants": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "enable": {"type": "bool", "default": False},
+                    "index": {"type": "int"},
+                    "tenant": {"type": "str", "default": ""},
+                },
+            },
+            "vrf_name": {"type": "str", "default": "(auto)"},
+            "vrf_name_auto_assigned_": {"type": "bool"},
+        },
+    },
+}
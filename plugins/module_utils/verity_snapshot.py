@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+# Cached snapshots of the objects of Verity resources
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_cache import (
+    DEFAULT_LOCK_TIMEOUT,
+    cache_root,
+    file_lock,
+)
+
+DEFAULT_SNAPSHOT_TTL = 300
+DEFAULT_SNAPSHOT_SIZE = 256  # MiB
+
+
+def _select(objects, names, type_key, name, obj):
+    # Add one triple to objects if names (or no names) select it
+    if name is None:
+        objects[type_key] = obj
+    elif not names or name in names:
+        objects.setdefault(type_key, {})[name] = obj
+
+
+def _line(type_key, name, obj):
+    # JSON never holds a raw tab, so the object can be split off unparsed
+    return f"{json.dumps([type_key, name])}\t{json.dumps(obj)}\n".encode("utf-8")
+
+
+def _filter(objects, names):
+    if not names:
+        return objects
+    selected = {}
+    for type_key, value in objects.items():
+        if isinstance(value, dict):
+            value = dict((name, value[name]) for name in names if name in value)
+            if not value:
+                continue
+        selected[type_key] = value
+    return selected
+
+
+class SnapshotCache(object):
+    """
+    File-backed snapshots of every object of a resource on a vNetC, keyed
+    by controller, resource and query parameters.
+
+    Each snapshot is a gzip file of lines under <cache_dir>/snapshots: a
+    JSON header with its key and expiry, then one [type_key, name] <tab>
+    object line per object, so that snapshots are written as the GET
+    streams in and read back decoding only the objects asked for.
+    Snapshots expire after ttl seconds and are deleted by the writes that
+    make them stale. Once the snapshots take more than max_size MiB, the
+    least recently used ones are evicted; the access time of each file
+    records its last use.
+
+    With memory, a snapshot read once is kept whole in memory, for the
+    many reads of a batch, until its file changes. store names the
+    directory under cache_dir, for stores other than the snapshots of the
+    resource modules.
+    """
+
+    def __init__(self, cache_dir=None, ttl=DEFAULT_SNAPSHOT_TTL, memory=False,
+                 max_size=DEFAULT_SNAPSHOT_SIZE, store="snapshots"):
+        self.path = os.path.join(cache_root(cache_dir), store)
+        self.ttl = ttl
+        self.memory = {} if memory else None
+        self.max_size = max_size
+
+    @staticmethod
+    def key(controller, resource, params=None):
+        return json.dumps([controller.rstrip("/"), resource, sorted((params or {}).items())])
+
+    def _file(self, key):
+        return os.path.join(self.path, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".jsonl.gz")
+
+    def get(self, key, names=None):
+        """
+        Return the snapshot for key as {type_key: {name: object}}, only
+        with the objects in names if given, or None if missing or expired.
+        """
+        names = set(names) if names else None
+        path = self._file(key)
+        try:
+            if self.memory is not None:
+                stat = os.stat(path)
+                version, expires, objects = self.memory.get(key, (None, 0, None))
+                if version == (stat.st_mtime_ns, stat.st_size):
+                    return _filter(objects, names) if expires > time.time() else None
+            with gzip.open(path, "rt", encoding="utf-8") as fp:
+                header = json.loads(fp.readline())
+                if header.get("key") != key or header.get("expires", 0) <= time.time():
+                    return None
+                objects = {}
+                for line in fp:
+                    head, _tab, obj = line.partition("\t")
+                    type_key, name = json.loads(head)
+                    if self.memory is not None or name is None or not names or name in names:
+                        _select(objects, None, type_key, name, json.loads(obj))
+            self._touch(path)
+            if self.memory is not None:
+                self.memory[key] = ((stat.st_mtime_ns, stat.st_size), header["expires"], objects)
+                return _filter(objects, names)
+            return objects
+        except (OSError, EOFError, ValueError):
+            return None
+
+    def set(self, key, items, names=None):
+        """
+        Store the (type_key, name, object) triples of items, an iterable
+        consumed as it is written, as the snapshot for key, and return the
+        objects in names (all if not given) like get().
+        """
+        names = set(names) if names else None
+        objects = {}
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=5) as gz:
+                header = dict(key=key, expires=time.time() + self.ttl)
+                gz.write(json.dumps(header).encode("utf-8") + b"\n")
+                for type_key, name, obj in items:
+                    gz.write(_line(type_key, name, obj))
+                    _select(objects, names, type_key, name, obj)
+            os.replace(tmp_path, self._file(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._evict(self._file(key))
+        return objects
+
+    def _touch(self, path):
+        # Record a use in the access time, leaving the modification time
+        # that versions the snapshots held in memory as it is
+        try:
+            os.utime(path, ns=(time.time_ns(), os.stat(path).st_mtime_ns))
+        except OSError:
+            pass
+
+    def _evict(self, keep):
+        # Delete the least recently used snapshots, but keep, until the
+        # others fit in max_size
+        if not self.max_size:
+            return
+        entries = []
+        total = 0
+        for name in os.listdir(self.path):
+            path = os.path.join(self.path, name)
+            if not name.endswith(".jsonl.gz"):
+                continue
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            total += stat.st_size
+            if path != keep:
+                entries.append((stat.st_atime_ns, stat.st_size, path))
+        for _atime, size, path in sorted(entries):
+            if total <= self.max_size * 1024 * 1024:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def get_or_create(self, key, factory, names=None, timeout=DEFAULT_LOCK_TIMEOUT):
+        """
+        Return the snapshot for key like get(), storing the items of
+        factory() first if there is none.
+
+        Callers racing for the same key are serialised on a lock file, so
+        only the first one reads the whole resource from the vNetC.
+        """
+        objects = self.get(key, names)
+        if objects is not None:
+            return objects
+        with file_lock(self._file(key)[:-len(".jsonl.gz")] + ".lock", timeout):
+            objects = self.get(key, names)
+            if objects is None:
+                objects = self.set(key, factory(), names)
+        return objects
+
+    def delete(self, key):
+        if self.memory is not None:
+            self.memory.pop(key, None)
+        try:
+            os.unlink(self._file(key))
+        except FileNotFoundError:
+            pass
+
+    def keys(self):
+        """
+        Return the keys of all unexpired snapshots.
+        """
+        try:
+            names = os.listdir(self.path)
+        except FileNotFoundError:
+            return []
+        keys = []
+        for name in names:
+            if not name.endswith(".jsonl.gz"):
+                continue
+            try:
+                with gzip.open(os.path.join(self.path, name), "rt", encoding="utf-8") as fp:
+                    header = json.loads(fp.readline())
+            except (OSError, EOFError, ValueError):
+                continue
+            if header.get("expires", 0) > time.time():
+                keys.append(header.get("key"))
+        return keys
+
+    def flush(self):
+        try:
+            names = os.listdir(self.path)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name.endswith(".jsonl.gz"):
+                os.unlink(os.path.join(self.path, name))
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# Incremental decoding of large Verity API documents
+
+import codecs
+import json
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def iter_objects(fp, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield (type_key, name, object) for every object of a Verity document
+    read from the file object fp (bytes or text), such as:
+
+        {"switchpoint": {"leaf1": {...}, "leaf2": {...}}}
+
+    Only the object being yielded is held in memory, whatever the size of
+    the document. A top-level value that is not an object is yielded as
+    (type_key, None, value), and a document that is not an object as
+    (None, None, document).
+
+    ijson is used when it is installed; otherwise a pure Python decoder
+    parses the outer structure and hands each object to json.
+    """
+    if HAS_IJSON and _is_binary(fp):
+        return _iter_ijson(fp)
+    return _iter_fallback(_Reader(fp, chunk_size))
+
+
+def _is_binary(fp):
+    return isinstance(fp.read(0), bytes)
+
+
+def _iter_ijson(fp):
+    depth = builder_depth = 0
+    type_key = name = None
+    builder = None
+    for event, value in ijson.basic_parse(fp, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            if depth == builder_depth:
+                yield type_key, name, builder.value
+                builder = None
+            continue
+
+        if event == "map_key":
+            if depth == 1:
+                # A new top-level key: nothing of the previous one carries over
+                type_key, name, builder_depth = value, None, 0
+            else:
+                name = value
+            continue
+        if event == "start_map" and depth < 2:
+            depth += 1
+            continue
+        if event == "end_map":
+            depth -= 1
+            continue
+
+        # A value starts below the collection level: build it whole
+        builder_depth = depth
+        if event in ("start_map", "start_array"):
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            depth += 1
+        elif depth == 2:
+            yield type_key, name, value
+        elif depth == 1:
+            yield type_key, None, value
+        else:
+            yield None, None, value
+
+
+class _Reader(object):
+    """
+    Buffered cursor over a file object, dropping text once consumed.
+    """
+
+    def __init__(self, fp, chunk_size):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+
+    def _fill(self, size):
+        if self.eof:
+            return False
+        chunk = self.fp.read(size)
+        if isinstance(chunk, bytes):
+            text = self._utf8.decode(chunk, final=not chunk)
+        else:
+            text = chunk
+        if not chunk:
+            self.eof = True
+        self.buf = self.buf[self.pos:] + text
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """
+        Skip whitespace and return the next character, or "" at the end.
+        """
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill(self.chunk_size):
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos} of the response")
+        self.pos += 1
+
+    def value(self):
+        """
+        Decode the next JSON value, reading more of the file as needed.
+        """
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self._json.raw_decode(self.buf, self.pos)
+            except ValueError:
+                if not self._fill(size):
+                    raise
+                # Values larger than a chunk: read geometrically more
+                size *= 2
+                continue
+            if end == len(self.buf) and not self.eof:
+                # A number may continue in the next chunk
+                self._fill(size)
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_fallback(reader):
+    if reader.peek() != "{":
+        if reader.peek():
+            yield None, None, reader.value()
+        return
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        type_key = reader.value()
+        reader.expect(":")
+        if reader.peek() == "{":
+            reader.expect("{")
+            if reader.peek() == "}":
+                reader.expect("}")
+            else:
+                while True:
+                    name = reader.value()
+                    reader.expect(":")
+                    yield type_key, name, reader.value()
+                    if reader.peek() == ",":
+                        reader.expect(",")
+                        continue
+                    reader.expect("}")
+                    break
+        else:
+            yield type_key, None, reader.value()
+        if reader.peek() == ",":
+            reader.expect(",")
+            continue
+        reader.expect("}")
+        return
@@ -0,0 +1,468 @@
+# -*- coding: utf-8 -*-
+# HTTP transports shared by the Verity API modules
+
+import gzip
+import http.client
+import io
+import json
+import select
+import threading
+import zlib
+
+from urllib.parse import urlencode, urlsplit
+
+from ansible.module_utils.connection import Connection
+from ansible.module_utils.connection import ConnectionError as PersistentConnectionError
+
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 60.0
+
+# builtin: http.client from the standard library, nothing extra to import.
+# requests: imported only when selected, honours the *_PROXY variables.
+HTTP_BACKENDS = ("builtin", "requests")
+DEFAULT_HTTP_BACKEND = "builtin"
+
+COMPRESSION_MODES = ("auto", "gzip", "none")
+# Bodies smaller than this gain less from gzip than it costs to compress
+GZIP_MIN_SIZE = 16 * 1024
+
+_SESSIONS = {}
+# Controllers that rejected a gzip-encoded request body in this process
+# and accepted it uncompressed
+_GZIP_REJECTED = set()
+# Words of a HTTP 400 body telling that the Content-Encoding was rejected
+ENCODING_ERRORS = ("content-encoding", "gzip", "compress")
+
+
+class TransportError(Exception):
+    """
+    The request did not produce an HTTP response (connection refused or
+    reset, timeout, TLS failure, persistent connection gone), or the
+    response body could not be read.
+    """
+
+
+class VerityResponse(object):
+    """
+    Transport-independent view of an API response.
+
+    A streamed response has no body; its content is read incrementally
+    from the file object raw, and must be closed once consumed.
+    """
+
+    def __init__(self, status, headers=None, body="", raw=None):
+        self.status = status
+        self.headers = headers or {}
+        self.body = body
+        self.raw = raw
+
+    @property
+    def ok(self):
+        return 200 <= self.status < 300
+
+    def header(self, name):
+        """
+        Return a response header, looked up case-insensitively.
+        """
+        name = name.lower()
+        for key, value in self.headers.items():
+            if key.lower() == name:
+                return value
+        return None
+
+    def data(self):
+        """
+        Return the decoded JSON body, or the raw text if it is not JSON.
+        """
+        if self.body is None:
+            try:
+                self.body = self.stream().read().decode("utf-8", "replace")
+            finally:
+                self.close()
+        try:
+            return json.loads(self.body)
+        except ValueError:
+            return self.body
+
+    def stream(self):
+        """
+        Return a binary file object over the body, for verity_stream.
+        """
+        if self.raw is None:
+            self.raw = io.BytesIO((self.body or "").encode("utf-8"))
+        return self.raw
+
+    def close(self):
+        if self.raw is not None:
+            self.raw.close()
+
+
+def _split_timeout(timeout):
+    if isinstance(timeout, (tuple, list)):
+        return timeout[0], timeout[1]
+    return timeout, timeout
+
+
+class _PooledBody(object):
+    """
+    Body of a builtin backend response, gunzipped while it is read. The
+    connection returns to the pool once the body is read to the end and
+    closed, and is discarded otherwise.
+    """
+
+    def __init__(self, session, conn, response):
+        self.session = session
+        self.conn = conn
+        self.response = response
+        self._inflate = None
+        if (response.getheader("Content-Encoding") or "").lower() == "gzip":
+            self._inflate = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self._buffer = b""
+        self._eof = False
+
+    def _read(self, size):
+        try:
+            return self.response.read(size if size >= 0 else None)
+        except (OSError, http.client.HTTPException) as e:
+            raise TransportError(f"Reading the response failed: {str(e)}")
+
+    def read(self, size=-1):
+        if size is None:
+            size = -1
+        if self._inflate is None or size == 0:
+            return self._read(size)
+        try:
+            if size < 0:
+                data = self._buffer + self._inflate.decompress(self._read(-1)) + self._inflate.flush()
+                self._buffer = b""
+                self._eof = True
+                return data
+            while not self._buffer and not self._eof:
+                chunk = self._read(size)
+                if chunk:
+                    self._buffer = self._inflate.decompress(chunk)
+                else:
+                    self._buffer = self._inflate.flush()
+                    self._eof = True
+        except zlib.error as e:
+            raise TransportError(f"Invalid gzip response: {str(e)}")
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def close(self):
+        if self.conn is None:
+            return
+        reusable = self.response.isclosed() and not self.response.will_close
+        self.response.close()
+        self.session.release(self.conn, reusable)
+        self.conn = None
+
+
+class BuiltinSession(object):
+    """
+    Keep-alive connection pool to one vNetC built on http.client.
+
+    It is safe to share between threads: each request takes an idle
+    connection, or opens a new one, and gives it back once its response
+    has been read. At most pool_maxsize idle connections are kept.
+    """
+
+    def __init__(self, base_url, validate_certs=True, pool_maxsize=DEFAULT_POOL_MAXSIZE, keep_alive=True):
+        parts = urlsplit(base_url)
+        self.https = parts.scheme != "http"
+        self.host = parts.hostname
+        self.port = parts.port
+        self.validate_certs = validate_certs
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self._idle = []
+        self._lock = threading.Lock()
+        self._context = None
+
+    def _ssl_context(self):
+        if self._context is None:
+            import ssl
+
+            context = ssl.create_default_context()
+            if not self.validate_certs:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            self._context = context
+        return self._context
+
+    def _acquire(self):
+        """
+        Return (connection, reused), preferring an idle connection that the
+        vNetC has not closed in the meantime.
+        """
+        with self._lock:
+            while self._idle:
+                conn = self._idle.pop()
+                if conn.sock is not None and not select.select([conn.sock], [], [], 0)[0]:
+                    return conn, True
+                # Readable while idle: closed by the server
+                conn.close()
+        if self.https:
+            return http.client.HTTPSConnection(self.host, self.port, context=self._ssl_context()), False
+        return http.client.HTTPConnection(self.host, self.port), False
+
+    def release(self, conn, reusable=True):
+        if reusable and self.keep_alive:
+            with self._lock:
+                if len(self._idle) < self.pool_maxsize:
+                    self._idle.append(conn)
+                    return
+        conn.close()
+
+    def request(self, method, url, headers=None, data=None, params=None, timeout=None, stream=False):
+        """
+        Send one request and return its VerityResponse, read in full unless
+        stream is set. Raises TransportError if no response is obtained.
+        """
+        parts = urlsplit(url)
+        target = parts.path or "/"
+        query = "&".join(q for q in (parts.query, urlencode(params or {}, doseq=True)) if q)
+        if query:
+            target = f"{target}?{query}"
+        headers = dict(headers or {})
+        if not self.keep_alive:
+            headers["Connection"] = "close"
+        connect_timeout, read_timeout = _split_timeout(timeout)
+
+        while True:
+            conn, reused = self._acquire()
+            try:
+                if conn.sock is None:
+                    conn.timeout = connect_timeout
+                    conn.connect()
+                conn.sock.settimeout(read_timeout)
+                conn.request(method, target, body=data, headers=headers)
+                response = conn.getresponse()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                conn.close()
+                if not reused:
+                    raise TransportError(str(e))
+                # The vNetC dropped the idle connection as we reused it
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise TransportError(str(e) or type(e).__name__)
+
+        body = _PooledBody(self, conn, response)
+        headers = dict(response.getheaders())
+        if stream:
+            return VerityResponse(response.status, headers, None, body)
+        try:
+            content = body.read()
+        finally:
+            body.close()
+        return VerityResponse(response.status, headers, content.decode("utf-8", "replace"))
+
+
+class _RequestsBody(object):
+    """
+    Streamed body of a requests backend response.
+    """
+
+    def __init__(self, response, errors):
+        self.response = response
+        self.errors = errors
+        response.raw.decode_content = True
+
+    def read(self, size=-1):
+        try:
+            return self.response.raw.read(None if size is None or size < 0 else size)
+        except self.errors as e:
+            raise TransportError(f"Reading the response failed: {str(e)}")
+
+    def close(self):
+        self.response.close()
+
+
+class RequestsSession(object):
+    """
+    Same interface as BuiltinSession on top of requests, which is imported
+    only when this backend is selected.
+    """
+
+    def __init__(self, base_url, validate_certs=True, pool_maxsize=DEFAULT_POOL_MAXSIZE, keep_alive=True):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.exceptions import HTTPError as Urllib3Error
+
+        self.errors = (requests.exceptions.RequestException, Urllib3Error, OSError)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.verify = bool(validate_certs)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def request(self, method, url, headers=None, data=None, params=None, timeout=None, stream=False):
+        try:
+            response = self.session.request(method, url, params=params, data=data, headers=headers,
+                                            timeout=timeout, stream=stream)
+            if stream:
+                return VerityResponse(response.status_code, dict(response.headers), None,
+                                      _RequestsBody(response, self.errors))
+            return VerityResponse(response.status_code, dict(response.headers), response.text)
+        except self.errors as e:
+            raise TransportError(str(e))
+
+
+def get_session(base_url, validate_certs=True, pool_maxsize=DEFAULT_POOL_MAXSIZE, keep_alive=True,
+                backend=DEFAULT_HTTP_BACKEND):
+    """
+    Return the pooled session for a vNetC, creating it on first use.
+
+    Sessions are cached for the lifetime of the process, so authentication,
+    reads and writes made during one module run share the same TCP/TLS
+    connections instead of handshaking for every call.
+    """
+    key = (base_url, bool(validate_certs), pool_maxsize, bool(keep_alive), backend)
+    session = _SESSIONS.get(key)
+    if session is None:
+        factory = RequestsSession if backend == "requests" else BuiltinSession
+        session = factory(base_url, bool(validate_certs), pool_maxsize, bool(keep_alive))
+        _SESSIONS[key] = session
+    return session
+
+
+def module_session(module, base_url=None):
+    """
+    Return the pooled session matching the connection options of a module.
+    """
+    return get_session(
+        base_url or module.params["base_url"],
+        validate_certs=module.params.get("validate_certs", True),
+        pool_maxsize=module.params.get("pool_maxsize") or DEFAULT_POOL_MAXSIZE,
+        keep_alive=module.params.get("keep_alive", True),
+        backend=module.params.get("http_backend") or DEFAULT_HTTP_BACKEND,
+    )
+
+
+def module_timeouts(module):
+    """
+    Return the (connect, read) timeouts configured on a module.
+    """
+    return (
+        module.params.get("connect_timeout") or DEFAULT_CONNECT_TIMEOUT,
+        module.params.get("read_timeout") or DEFAULT_READ_TIMEOUT,
+    )
+
+
+def _rejects_encoding(response):
+    """
+    Return (rejected, response): whether response rejects the gzip
+    encoding of the request body, HTTP 415 or a HTTP 400 whose body says
+    so, and response, read in full when its body had to be looked at.
+    """
+    if response.status == 415:
+        return True, response
+    if response.status != 400:
+        return False, response
+    if response.body is None:
+        try:
+            text = response.stream().read().decode("utf-8", "replace")
+        finally:
+            response.close()
+        response = VerityResponse(response.status, response.headers, text)
+    return any(word in response.body.lower() for word in ENCODING_ERRORS), response
+
+
+def send_json(session, method, url, headers, params=None, data=None, timeout=None, compression="auto",
+              stream=False):
+    """
+    Send a JSON API call through session and return its VerityResponse.
+    Raises TransportError if no response is obtained.
+
+    Responses are always requested gzip-encoded unless compression is
+    "none", and decoded transparently. Request bodies of at least
+    GZIP_MIN_SIZE bytes are gzip-encoded when compression is "gzip", and
+    also with "auto" unless the controller rejects them: on HTTP 415, or
+    HTTP 400 with a body naming the encoding (ENCODING_ERRORS), the call is
+    resent uncompressed. Only once such a resend is accepted are later
+    bodies for that controller sent as is. With stream, the response body
+    is left unread for the caller to consume from response.stream().
+    """
+    headers = dict(headers)
+    if compression == "none":
+        headers["Accept-Encoding"] = "identity"
+    else:
+        headers["Accept-Encoding"] = "gzip"
+    body = None
+    if data is not None:
+        body = json.dumps(data).encode("utf-8")
+        headers.setdefault("Content-Type", "application/json")
+
+    controller = url.split("/api/", 1)[0]
+    compress = (
+        body is not None and len(body) >= GZIP_MIN_SIZE
+        and (compression == "gzip" or (compression == "auto" and controller not in _GZIP_REJECTED))
+    )
+    if not compress:
+        return session.request(method, url, params=params, timeout=timeout, data=body, headers=headers,
+                               stream=stream)
+    response = session.request(
+        method, url, params=params, timeout=timeout, data=gzip.compress(body, compresslevel=5), stream=stream,
+        headers=dict(headers, **{"Content-Encoding": "gzip"}),
+    )
+    if compression == "gzip":
+        return response
+    rejected, response = _rejects_encoding(response)
+    if not rejected:
+        return response
+    response.close()
+    response = session.request(method, url, params=params, timeout=timeout, data=body, headers=headers,
+                               stream=stream)
+    if response.status < 400:
+        _GZIP_REJECTED.add(controller)
+    return response
+
+
+class SessionTransport(object):
+    """
+    Sends API calls straight to the vNetC through a pooled session.
+    """
+
+    def __init__(self, session, base_url, headers, compression="auto"):
+        self.session = session
+        self.base_url = base_url
+        self.headers = headers
+        self.compression = compression
+
+    def request(self, method, path, params=None, data=None, timeout=None, stream=False):
+        return send_json(
+            self.session,
+            method,
+            f"{self.base_url}/api{path}",
+            self.headers,
+            params=params,
+            data=data,
+            timeout=timeout,
+            compression=self.compression,
+            stream=stream,
+        )
+
+
+class ConnectionTransport(object):
+    """
+    Relays API calls through the persistent be_networks.verity.verity
+    httpapi connection, which owns authentication and the socket.
+    """
+
+    def __init__(self, socket_path, compression="auto"):
+        self.connection = Connection(socket_path)
+        self.compression = compression
+
+    def request(self, method, path, params=None, data=None, timeout=None, stream=False):
+        # The persistent connection returns whole bodies; stream() then
+        # reads them from memory, which keeps the interface identical
+        try:
+            response = self.connection.send_request(method, path, params=params, data=data,
+                                                    timeout=timeout, compression=self.compression)
+        except PersistentConnectionError as e:
+            raise TransportError(str(e))
+        return VerityResponse(**response)
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# Client-side validation of resource data against the documented schemas
+
+from ansible.module_utils.common.validation import (
+    check_type_bool,
+    check_type_float,
+    check_type_int,
+    check_type_str,
+)
+
+_TYPES = {
+    "str": (str, check_type_str),
+    "int": (int, check_type_int),
+    "bool": (bool, check_type_bool),
+    "float": ((float, int), check_type_float),
+}
+
+# Resource -> compiled validator of its data, see data_validator
+_VALIDATORS = {}
+
+
+def _path(path):
+    # (parent, key) pairs, built as the data is walked, to a.b[0].c
+    parts = []
+    while isinstance(path, tuple):
+        path, key = path
+        parts.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+    return str(path) + "".join(reversed(parts))
+
+
+def _compile_scalar(spec):
+    expected, convert = _TYPES[spec.get("type", "str")]
+    choices = frozenset(spec["choices"]) if spec.get("choices") else None
+    strict_number = expected is not bool
+
+    def check(value, path, errors, fill):
+        if not isinstance(value, expected) or (strict_number and value.__class__ is bool):
+            try:
+                if isinstance(value, bool):
+                    raise TypeError()
+                value = convert(value, True) if convert is check_type_str else convert(value)
+            except (TypeError, ValueError):
+                errors.append(f"{_path(path)}: {value!r} is not a valid {spec.get('type', 'str')}")
+                return value
+        if choices is not None and value not in choices:
+            errors.append(f"{_path(path)}: {value!r} is not one of "
+                          f"{', '.join(repr(choice) for choice in spec['choices'])}")
+        return value
+    return check
+
+
+def _compile_options(options):
+    fields = dict((name, compile_spec(spec)) for name, spec in options.items())
+    defaults = [(name, spec["default"]) for name, spec in options.items() if "default" in spec]
+
+    def check(value, path, errors, fill):
+        if not isinstance(value, dict):
+            errors.append(f"{_path(path)}: expected an object, got {type(value).__name__}")
+            return value
+        result = {}
+        for name, item in value.items():
+            field = fields.get(name)
+            if field is None:
+                errors.append(f"{_path((path, name))}: unknown field")
+                result[name] = item
+            else:
+                result[name] = item if item is None else field(item, (path, name), errors, fill)
+        if fill:
+            for name, default in defaults:
+                result.setdefault(name, default)
+        return result
+    return check
+
+
+def _compile_list(spec):
+    element = compile_spec(dict(spec.get("options") and {"type": "dict", "options": spec["options"]}
+                                or {"type": spec.get("elements", "str")}))
+
+    def check(value, path, errors, fill):
+        if not isinstance(value, list):
+            errors.append(f"{_path(path)}: expected a list, got {type(value).__name__}")
+            return value
+        return [item if item is None else element(item, (path, index), errors, fill)
+                for index, item in enumerate(value)]
+    return check
+
+
+def compile_spec(spec):
+    """
+    Compile one documented field spec of verity_schema.SCHEMAS into a
+    check(value, path, errors, fill) function, path being the (parent,
+    key) pairs leading to value, returning value converted
+    to the documented type, appending what is wrong with it to errors and,
+    if fill, adding the documented defaults of missing fields.
+    """
+    type_name = spec.get("type", "str")
+    if type_name == "list":
+        return _compile_list(spec)
+    if type_name == "dict":
+        if "options" in spec:
+            return _compile_options(spec["options"])
+
+        def check_dict(value, path, errors, fill):
+            if not isinstance(value, dict):
+                errors.append(f"{_path(path)}: expected an object, got {type(value).__name__}")
+            return value
+        return check_dict
+    if type_name in _TYPES:
+        return _compile_scalar(spec)
+    return lambda value, path, errors, fill: value
+
+
+def data_validator(resource_name):
+    """
+    Return the compiled validator of the data of resource_name, compiling
+    it on first use, or None if the resource has no schema.
+    """
+    if resource_name not in _VALIDATORS:
+        # Imported here, so that modules not validating skip the schemas
+        from ansible_collections.be_networks.verity.plugins.module_utils.verity_schema import (
+            SCHEMAS,
+        )
+        schema = SCHEMAS.get(resource_name)
+        _VALIDATORS[resource_name] = schema and dict(
+            (object_type, _compile_options(fields)) for object_type, fields in schema.items())
+    return _VALIDATORS[resource_name]
+
+
+def validate_data(resource_name, data, fill=False):
+    """
+    Check data, {type_key: {name: object}}, against the documented schema
+    of resource_name. Return (data, errors): data with its values
+    converted to their documented types and, if fill, the documented
+    defaults of missing fields added (for objects about to be created),
+    and the list of problems found, empty if there are none.
+    """
+    validators = data_validator(resource_name)
+    if not validators or not data:
+        return data, []
+    errors = []
+    result = {}
+    for object_type, objects in data.items():
+        validator = validators.get(object_type)
+        if validator is None:
+            errors.append(f"{object_type}: unknown object type, expected "
+                          f"{', '.join(sorted(validators))}")
+            result[object_type] = objects
+        elif not isinstance(objects, dict):
+            errors.append(f"{object_type}: expected an object of {object_type} objects by name")
+            result[object_type] = objects
+        else:
+            result[object_type] = dict(
+                (name, obj if obj is None else validator(obj, (object_type, name), errors, fill))
+                for name, obj in objects.items())
+    return result, errors
@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get ACL objects from the Verity API.
 - This module interacts with the `/acls` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: acls
 options:
   data:
@@ -217,6 +221,16 @@ EXAMPLES = r'''- name: Create ACL
       ip_filter_name: TestACL
       ip_version: ip_version
     token: '{{ auth_result.token }}'
+- name: Get ACL
+  be_networks.verity.acls:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestACL
+    params:
+      ip_version: ip_version
+    token: '{{ auth_result.token }}'
+  register: acl_result
 '''
 
 RETURN = r'''
@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get AS Path Access List objects from the Verity API.
 - This module interacts with the `/aspathaccesslists` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: aspathaccesslists
 options:
   data:
@@ -148,6 +152,14 @@ EXAMPLES = r'''- name: Create AS Path Access List
       as_path_access_list_name: TestAS Path Access List
       changeset_name: changeset_name
     token: '{{ auth_result.token }}'
+- name: Get AS Path Access List
+  be_networks.verity.aspathaccesslists:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestAS Path Access List
+    token: '{{ auth_result.token }}'
+  register: as_path_access_list_result
 '''
 
 RETURN = r'''
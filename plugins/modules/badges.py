@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Badge objects from the Verity API.
 - This module interacts with the `/badges` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: badges
 options:
   data:
@@ -98,6 +102,14 @@ EXAMPLES = r'''- name: Create Badge
       badge_name: TestBadge
       changeset_name: changeset_name
     token: '{{ auth_result.token }}'
+- name: Get Badge
+  be_networks.verity.badges:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestBadge
+    token: '{{ auth_result.token }}'
+  register: badge_result
 '''
 
 RETURN = r'''
@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Bundle objects from the Verity API.
 - This module interacts with the `/bundles` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: bundles
 options:
   data:
@@ -285,6 +289,14 @@ EXAMPLES = r'''- name: Create Bundle
       changeset_name: changeset_name
       endpoint_bundle_name: TestBundle
     token: '{{ auth_result.token }}'
+- name: Get Bundle
+  be_networks.verity.bundles:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestBundle
+    token: '{{ auth_result.token }}'
+  register: bundle_result
 '''
 
 RETURN = r'''
@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Community List objects from the Verity API.
 - This module interacts with the `/communitylists` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: communitylists
 options:
   data:
@@ -186,6 +190,14 @@ EXAMPLES = r'''- name: Create Community List
       changeset_name: changeset_name
       community_list_name: TestCommunity List
     token: '{{ auth_result.token }}'
+- name: Get Community List
+  be_networks.verity.communitylists:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestCommunity List
+    token: '{{ auth_result.token }}'
+  register: community_list_result
 '''
 
 RETURN = r'''
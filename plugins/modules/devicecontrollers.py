@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Device Controller objects from the Verity API.
 - This module interacts with the `/devicecontrollers` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: devicecontrollers
 options:
   data:
@@ -402,6 +406,14 @@ EXAMPLES = r'''- name: Create Device Controller
       changeset_name: changeset_name
       device_controller_name: TestDevice Controller
     token: '{{ auth_result.token }}'
+- name: Get Device Controller
+  be_networks.verity.devicecontrollers:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestDevice Controller
+    token: '{{ auth_result.token }}'
+  register: device_controller_result
 '''
 
 RETURN = r'''
@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Device Setting objects from the Verity API.
 - This module interacts with the `/devicesettings` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: devicesettings
 options:
   data:
@@ -192,6 +196,14 @@ EXAMPLES = r'''- name: Create Device Setting
       changeset_name: changeset_name
       eth_device_profiles_name: TestDevice Setting
     token: '{{ auth_result.token }}'
+- name: Get Device Setting
+  be_networks.verity.devicesettings:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestDevice Setting
+    token: '{{ auth_result.token }}'
+  register: device_setting_result
 '''
 
 RETURN = r'''
@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Eth-Port Profile objects from the Verity API.
 - This module interacts with the `/ethportprofiles` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: ethportprofiles
 options:
   data:
@@ -181,6 +185,14 @@ EXAMPLES = r'''- name: Create Eth-Port Profile
       changeset_name: changeset_name
       eth_port_profile__name: TestEth-Port Profile
     token: '{{ auth_result.token }}'
+- name: Get Eth-Port Profile
+  be_networks.verity.ethportprofiles:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestEth-Port Profile
+    token: '{{ auth_result.token }}'
+  register: eth_port_profile_result
 '''
 
 RETURN = r'''
@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Eth-Port Setting objects from the Verity API.
 - This module interacts with the `/ethportsettings` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: ethportsettings
 options:
   data:
@@ -436,6 +440,14 @@ EXAMPLES = r'''- name: Create Eth-Port Setting
       changeset_name: changeset_name
       eth_port_settings_name: TestEth-Port Setting
     token: '{{ auth_result.token }}'
+- name: Get Eth-Port Setting
+  be_networks.verity.ethportsettings:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestEth-Port Setting
+    token: '{{ auth_result.token }}'
+  register: eth_port_setting_result
 '''
 
 RETURN = r'''
@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Extended Community List objects from the Verity API.
 - This module interacts with the `/extendedcommunitylists` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: extendedcommunitylists
 options:
   data:
@@ -182,6 +186,14 @@ EXAMPLES = r'''- name: Create Extended Community List
       changeset_name: changeset_name
       extended_community_list_name: TestExtended Community List
     token: '{{ auth_result.token }}'
+- name: Get Extended Community List
+  be_networks.verity.extendedcommunitylists:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestExtended Community List
+    token: '{{ auth_result.token }}'
+  register: extended_community_list_result
 '''
 
 RETURN = r'''
@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Gateway Profile objects from the Verity API.
 - This module interacts with the `/gatewayprofiles` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: gatewayprofiles
 options:
   data:
@@ -179,6 +183,14 @@ EXAMPLES = r'''- name: Create Gateway Profile
       changeset_name: changeset_name
       gateway_profile_name: TestGateway Profile
     token: '{{ auth_result.token }}'
+- name: Get Gateway Profile
+  be_networks.verity.gatewayprofiles:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestGateway Profile
+    token: '{{ auth_result.token }}'
+  register: gateway_profile_result
 '''
 
 RETURN = r'''
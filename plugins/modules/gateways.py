@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Gateway objects from the Verity API.
 - This module interacts with the `/gateways` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: gateways
 options:
   data:
@@ -454,6 +458,14 @@ EXAMPLES = r'''- name: Create Gateway
       changeset_name: changeset_name
       gateway_name: TestGateway
     token: '{{ auth_result.token }}'
+- name: Get Gateway
+  be_networks.verity.gateways:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestGateway
+    token: '{{ auth_result.token }}'
+  register: gateway_result
 '''
 
 RETURN = r'''
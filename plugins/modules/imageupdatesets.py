@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Image Update Set objects from the Verity API.
 - This module interacts with the `/imageupdatesets` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: imageupdatesets
 options:
   data:
@@ -446,6 +450,14 @@ EXAMPLES = r'''- name: Create Image Update Set
       changeset_name: changeset_name
       image_update_sets_name: TestImage Update Set
     token: '{{ auth_result.token }}'
+- name: Get Image Update Set
+  be_networks.verity.imageupdatesets:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestImage Update Set
+    token: '{{ auth_result.token }}'
+  register: image_update_set_result
 '''
 
 RETURN = r'''
@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get IPv4 List Filter objects from the Verity API.
 - This module interacts with the `/ipv4lists` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: ipv4lists
 options:
   data:
@@ -101,6 +105,14 @@ EXAMPLES = r'''- name: Create IPv4 List Filter
       changeset_name: changeset_name
       ipv4_list_filter_name: TestIPv4 List Filter
     token: '{{ auth_result.token }}'
+- name: Get IPv4 List Filter
+  be_networks.verity.ipv4lists:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestIPv4 List Filter
+    token: '{{ auth_result.token }}'
+  register: ipv4_list_filter_result
 '''
 
 RETURN = r'''
@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get IPv4 Prefix List objects from the Verity API.
 - This module interacts with the `/ipv4prefixlists` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: ipv4prefixlists
 options:
   data:
@@ -166,6 +170,14 @@ EXAMPLES = r'''- name: Create IPv4 Prefix List
       changeset_name: changeset_name
       ipv4_prefix_list_name: TestIPv4 Prefix List
     token: '{{ auth_result.token }}'
+- name: Get IPv4 Prefix List
+  be_networks.verity.ipv4prefixlists:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestIPv4 Prefix List
+    token: '{{ auth_result.token }}'
+  register: ipv4_prefix_list_result
 '''
 
 RETURN = r'''
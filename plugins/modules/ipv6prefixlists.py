@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get IPv6 Prefix List objects from the Verity API.
 - This module interacts with the `/ipv6prefixlists` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: ipv6prefixlists
 options:
   data:
@@ -157,6 +161,14 @@ EXAMPLES = r'''- name: Create IPv6 Prefix List
       changeset_name: changeset_name
       ipv6_prefix_list_name: TestIPv6 Prefix List
     token: '{{ auth_result.token }}'
+- name: Get IPv6 Prefix List
+  be_networks.verity.ipv6prefixlists:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestIPv6 Prefix List
+    token: '{{ auth_result.token }}'
+  register: ipv6_prefix_list_result
 '''
 
 RETURN = r'''
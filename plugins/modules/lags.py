@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get LAG objects from the Verity API.
 - This module interacts with the `/lags` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: lags
 options:
   data:
@@ -192,6 +196,14 @@ EXAMPLES = r'''- name: Create LAG
       changeset_name: changeset_name
       lag_name: TestLAG
     token: '{{ auth_result.token }}'
+- name: Get LAG
+  be_networks.verity.lags:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestLAG
+    token: '{{ auth_result.token }}'
+  register: lag_result
 '''
 
 RETURN = r'''
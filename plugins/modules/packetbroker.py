@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get PacketBroker objects from the Verity API.
 - This module interacts with the `/packetbroker` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: packetbroker
 options:
   data:
@@ -261,6 +265,14 @@ EXAMPLES = r'''- name: Create PacketBroker
       changeset_name: changeset_name
       pb_egress_profile_name: TestPacketBroker
     token: '{{ auth_result.token }}'
+- name: Get PacketBroker
+  be_networks.verity.packetbroker:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestPacketBroker
+    token: '{{ auth_result.token }}'
+  register: packetbroker_result
 '''
 
 RETURN = r'''
@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Packet Queue objects from the Verity API.
 - This module interacts with the `/packetqueues` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: packetqueues
 options:
   data:
@@ -181,6 +185,14 @@ EXAMPLES = r'''- name: Create Packet Queue
       changeset_name: changeset_name
       packet_queue_name: TestPacket Queue
     token: '{{ auth_result.token }}'
+- name: Get Packet Queue
+  be_networks.verity.packetqueues:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestPacket Queue
+    token: '{{ auth_result.token }}'
+  register: packet_queue_result
 '''
 
 RETURN = r'''
@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Pod objects from the Verity API.
 - This module interacts with the `/pods` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: pods
 options:
   data:
@@ -93,6 +97,14 @@ EXAMPLES = r'''- name: Create Pod
       changeset_name: changeset_name
       pod_name: TestPod
     token: '{{ auth_result.token }}'
+- name: Get Pod
+  be_networks.verity.pods:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestPod
+    token: '{{ auth_result.token }}'
+  register: pod_result
 '''
 
 RETURN = r'''
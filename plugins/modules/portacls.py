@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Port ACL objects from the Verity API.
 - This module interacts with the `/portacls` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: portacls
 options:
   data:
@@ -221,6 +225,14 @@ EXAMPLES = r'''- name: Create Port ACL
       changeset_name: changeset_name
       port_acl_name: TestPort ACL
     token: '{{ auth_result.token }}'
+- name: Get Port ACL
+  be_networks.verity.portacls:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestPort ACL
+    token: '{{ auth_result.token }}'
+  register: port_acl_result
 '''
 
 RETURN = r'''
@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Route Map Clause objects from the Verity API.
 - This module interacts with the `/routemapclauses` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: routemapclauses
 options:
   data:
@@ -389,6 +393,14 @@ EXAMPLES = r'''- name: Create Route Map Clause
       changeset_name: changeset_name
       route_map_clause_name: TestRoute Map Clause
     token: '{{ auth_result.token }}'
+- name: Get Route Map Clause
+  be_networks.verity.routemapclauses:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestRoute Map Clause
+    token: '{{ auth_result.token }}'
+  register: route_map_clause_result
 '''
 
 RETURN = r'''
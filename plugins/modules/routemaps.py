@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Route Map objects from the Verity API.
 - This module interacts with the `/routemaps` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: routemaps
 options:
   data:
@@ -147,6 +151,14 @@ EXAMPLES = r'''- name: Create Route Map
       changeset_name: changeset_name
       route_map_name: TestRoute Map
     token: '{{ auth_result.token }}'
+- name: Get Route Map
+  be_networks.verity.routemaps:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestRoute Map
+    token: '{{ auth_result.token }}'
+  register: route_map_result
 '''
 
 RETURN = r'''
@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Service objects from the Verity API.
 - This module interacts with the `/services` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: services
 options:
   data:
@@ -198,6 +202,14 @@ EXAMPLES = r'''- name: Create Service
       changeset_name: changeset_name
       service_name: TestService
     token: '{{ auth_result.token }}'
+- name: Get Service
+  be_networks.verity.services:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestService
+    token: '{{ auth_result.token }}'
+  register: service_result
 '''
 
 RETURN = r'''
@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get SFP Breakout objects from the Verity API.
 - This module interacts with the `/sfpbreakouts` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: sfpbreakouts
 options:
   data:
@@ -183,6 +187,14 @@ EXAMPLES = r'''- name: Create SFP Breakout
       changeset_name: changeset_name
       sfp_breakouts_name: TestSFP Breakout
     token: '{{ auth_result.token }}'
+- name: Get SFP Breakout
+  be_networks.verity.sfpbreakouts:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestSFP Breakout
+    token: '{{ auth_result.token }}'
+  register: sfp_breakout_result
 '''
 
 RETURN = r'''
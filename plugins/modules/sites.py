@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Site objects from the Verity API.
 - This module interacts with the `/sites` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: sites
 options:
   data:
@@ -456,6 +460,14 @@ EXAMPLES = r'''- name: Create Site
       changeset_name: changeset_name
       site_name: TestSite
     token: '{{ auth_result.token }}'
+- name: Get Site
+  be_networks.verity.sites:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestSite
+    token: '{{ auth_result.token }}'
+  register: site_result
 '''
 
 RETURN = r'''
@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Switchpoint objects from the Verity API.
 - This module interacts with the `/switchpoints` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: switchpoints
 options:
   data:
@@ -547,6 +551,15 @@ EXAMPLES = r'''- name: Create Switchpoint
       changeset_name: changeset_name
       switchpoint_name: TestSwitchpoint
     token: '{{ auth_result.token }}'
+- name: Get the pod and rack of every Switchpoint
+  be_networks.verity.switchpoints:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    fields:
+    - pod
+    - rack
+    token: '{{ auth_result.token }}'
+  register: switchpoint_result
 '''
 
 RETURN = r'''
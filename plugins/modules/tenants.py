@@ -15,6 +15,10 @@ DOCUMENTATION = r'''author:
 description:
 - Create, update, delete, or get Tenant objects from the Verity API.
 - This module interacts with the `/tenants` endpoints.
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+- be_networks.verity.verity.read
 module: tenants
 options:
   data:
@@ -291,6 +295,14 @@ EXAMPLES = r'''- name: Create Tenant
       changeset_name: changeset_name
       tenant_name: TestTenant
     token: '{{ auth_result.token }}'
+- name: Get Tenant
+  be_networks.verity.tenants:
+    action: get
+    base_url: '{{ auth_result.base_url }}'
+    names:
+    - TestTenant
+    token: '{{ auth_result.token }}'
+  register: tenant_result
 '''
 
 RETURN = r'''
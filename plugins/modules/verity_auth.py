@@ -14,16 +14,44 @@ options:
     - vNetC base URL.
     required: true
     type: str
+  connect_timeout:
+    default: 10
+    description:
+    - Seconds to wait for a connection to the vNetC to be established.
+    required: false
+    type: float
+  http_backend:
+    choices:
+    - builtin
+    - requests
+    default: builtin
+    description:
+    - HTTP client used to talk to the vNetC; C(requests) must be installed
+      to use it.
+    required: false
+    type: str
   password:
     description:
     - Password.
     required: true
     type: str
+  read_timeout:
+    default: 60
+    description:
+    - Seconds to wait for the vNetC to answer once connected.
+    required: false
+    type: float
   username:
     description:
     - Username.
     required: true
     type: str
+  validate_certs:
+    default: true
+    description:
+    - Validate the vNetC TLS certificate.
+    required: false
+    type: bool
 short_description: Authenticate with the Verity API
 '''
 
@@ -48,6 +76,10 @@ def main():
         base_url=dict(type="str", required=True),
         username=dict(type="str", required=True, no_log=True),
         password=dict(type="str", required=True, no_log=True),
+        validate_certs=dict(type="bool", default=True),
+        connect_timeout=dict(type="float", default=10.0),
+        read_timeout=dict(type="float", default=60.0),
+        http_backend=dict(type="str", choices=["builtin", "requests"], default="builtin"),
     )
     module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
 
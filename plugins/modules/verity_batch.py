@@ -0,0 +1,250 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2025, BeyondEdge Networks <you@example.com>
+# GNU General Public License v3.0+
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_batch import run_batch, BATCH_ARGS
+
+
+DOCUMENTATION = r'''author:
+- BeyondEdge Networks (@yourhandle)
+description:
+- Run an ordered list of create, update and delete operations, on any of the
+  Verity resources, in one module execution.
+- All operations share one authenticated session with the vNetC, which saves
+  the task and connection overhead of one task per object.
+- Each operation behaves like the task of the corresponding resource module,
+  for example M(be_networks.verity.tenants) for C(resource=tenants).
+extends_documentation_fragment:
+- be_networks.verity.verity
+- be_networks.verity.verity.resource
+module: verity_batch
+notes:
+- The top-level O(action) is the action of the operations that do not set one.
+options:
+  max_workers:
+    default: 1
+    description:
+    - Number of operations sent to the vNetC at the same time.
+    - With more than one worker the operations run concurrently, in no
+      particular order, so only use it for operations that do not depend on
+      each other, such as many C(ethportsettings) updates. Results are still
+      returned in the order of O(operations).
+    - Keep it at or below O(pool_maxsize) so that every worker keeps its
+      connection open.
+    required: false
+    type: int
+  operations:
+    description:
+    - Operations to run, in order.
+    elements: dict
+    required: true
+    suboptions:
+      action:
+        choices:
+        - create
+        - update
+        - delete
+        - get
+        description:
+        - Action of this operation, defaults to the top-level O(action).
+        required: false
+        type: str
+      data:
+        description:
+        - Object definitions, as the O(data) option of the resource module.
+        required: false
+        type: dict
+      fields:
+        description:
+        - With C(get), only return these attributes of each object, as the
+          O(fields) option of the resource module.
+        elements: str
+        required: false
+        type: list
+      names:
+        description:
+        - With C(get), only return the objects with these names, as the
+          O(names) option of the resource module.
+        elements: str
+        required: false
+        type: list
+      params:
+        description:
+        - Query parameters, as the O(params) option of the resource module,
+          for example the C(<object>_name) to delete.
+        required: false
+        type: dict
+      resource:
+        choices:
+        - acls
+        - aspathaccesslists
+        - badges
+        - bundles
+        - communitylists
+        - devicecontrollers
+        - devicesettings
+        - ethportprofiles
+        - ethportsettings
+        - extendedcommunitylists
+        - gatewayprofiles
+        - gateways
+        - imageupdatesets
+        - ipv4lists
+        - ipv4prefixlists
+        - ipv6lists
+        - ipv6prefixlists
+        - lags
+        - packetbroker
+        - packetqueues
+        - pods
+        - portacls
+        - routemapclauses
+        - routemaps
+        - services
+        - sfpbreakouts
+        - sites
+        - switchpoints
+        - tenants
+        description:
+        - Resource the operation applies to, named like its module.
+        required: true
+        type: str
+      state:
+        choices:
+        - present
+        - absent
+        description:
+        - Desired state of the objects of this operation, defaults to the
+          top-level O(state). Replaces O(operations[].action) when set.
+        required: false
+        type: str
+    type: list
+  order:
+    choices:
+    - input
+    - dependency
+    default: input
+    description:
+    - Order in which the operations are sent.
+    - With C(input), in the order of O(operations), concurrently when
+      O(max_workers) is above 1.
+    - With C(dependency), in waves computed from the C(*_ref_type_) references
+      between the objects of the batch, each wave running on up to
+      O(max_workers) workers. Operations on the same object, or on the
+      whole of its resource, keep their order, so that an object deleted
+      then created again is created last. An object is created or updated
+      after the objects of the batch it references; deletes, like
+      operations with state C(absent), keep their order with the
+      operations whose data references the deleted object, come after the
+      earlier creates and updates of the resources that can reference
+      theirs, which may drop those references, and come before the deletes
+      of the resources they can reference. References to objects outside
+      the batch are assumed to exist on the vNetC.
+    required: false
+    type: str
+  rate_limit:
+    description:
+    - Maximum number of API calls per second sent to the vNetC, retries
+      included, shared by all workers.
+    - Unlimited when not set or V(0).
+    required: false
+    type: float
+  stop_on_error:
+    default: true
+    description:
+    - Skip the operations not started yet once one has failed.
+    - Set to C(false) to attempt every operation regardless.
+    required: false
+    type: bool
+short_description: Run many Verity API operations in one task
+version_added: "1.1.0"
+'''
+
+EXAMPLES = r'''- name: Provision a tenant and its service in one task
+  be_networks.verity.verity_batch:
+    base_url: '{{ auth_result.base_url }}'
+    token: '{{ auth_result.token }}'
+    operations:
+    - resource: tenants
+      data:
+        tenant:
+          TestTenant:
+            enable: true
+    - resource: services
+      data:
+        service:
+          TestService:
+            enable: true
+            tenant: TestTenant
+            tenant_ref_type_: tenant
+    - resource: gateways
+      action: delete
+      params:
+        gateway_name: OldGateway
+
+- name: Create switchpoints and the pods they reference, pods first
+  be_networks.verity.verity_batch:
+    base_url: '{{ auth_result.base_url }}'
+    token: '{{ auth_result.token }}'
+    order: dependency
+    max_workers: 8
+    operations: "{{ switchpoint_operations + pod_operations }}"
+'''
+
+RETURN = r'''
+elapsed:
+  description: Seconds spent on the whole batch.
+  returned: always
+  type: float
+results:
+  description:
+  - One result per operation, in the order of O(operations).
+  - Besides the keys below, a failed operation has C(failed) and C(msg), and
+    C(status) when the vNetC answered with an error.
+  returned: always
+  type: list
+  elements: dict
+  contains:
+    action:
+      description: Action of the operation.
+      type: str
+    changed:
+      description: Whether the operation changed the vNetC.
+      type: bool
+    elapsed:
+      description: Seconds spent on the operation.
+      type: float
+    resource:
+      description: Resource of the operation.
+      type: str
+    response:
+      description: API response of the operation.
+      type: dict
+    skipped:
+      description: Set when the operation was not sent because an earlier one failed.
+      type: bool
+    state:
+      description: State of the operation, when it has one.
+      type: str
+    wave:
+      description: With O(order=dependency), the wave the operation ran in, from 0.
+      type: int
+'''
+
+
+def run_module():
+    module = AnsibleModule(argument_spec=BATCH_ARGS, supports_check_mode=True)
+    run_batch(module)
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
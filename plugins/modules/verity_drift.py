@@ -0,0 +1,176 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2025, BeyondEdge Networks <you@example.com>
+# GNU General Public License v3.0+
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_drift import (
+    DRIFT_ARGS,
+    run_drift,
+)
+
+
+DOCUMENTATION = r'''author:
+- BeyondEdge Networks (@yourhandle)
+description:
+- Report the objects of a vNetC added, removed or modified since a
+  baseline recorded by an earlier run.
+- Every resource, or those of O(resources), is read in parallel, and each
+  object is hashed as it arrives from the canonical JSON of its document.
+  The hashes are rolled up into one per object type, one per resource and
+  one for the vNetC.
+- The baseline is that tree of hashes, kept with the objects it was taken
+  from in O(cache_dir) on the host running the task. Trees are compared from
+  the root down, and only the resources and object types whose hashes
+  differ are walked object by object. With C(--diff), only the objects
+  that drifted are read back from the baseline to show their changes.
+- Resources not in the baseline yet are added to it, and are not reported
+  as drift.
+extends_documentation_fragment:
+- be_networks.verity.verity
+module: verity_drift
+notes:
+- The task reports a change when objects drifted, so that
+  C(changed_when) is not needed to act on drift.
+- Supports check mode, in which the baseline is compared but not updated.
+options:
+  baseline:
+    default: default
+    description:
+    - Name of the baseline, so that one vNetC can be compared with several
+      baselines, such as a nightly one and one taken before a change.
+    - Each vNetC and O(changeset_name) has its own baselines.
+    required: false
+    type: str
+  max_workers:
+    default: 8
+    description:
+    - Number of resources read at the same time.
+    - Keep it at or below O(pool_maxsize), so that every worker keeps its
+      connection.
+    required: false
+    type: int
+  resources:
+    choices:
+    - acls
+    - aspathaccesslists
+    - badges
+    - bundles
+    - communitylists
+    - devicecontrollers
+    - devicesettings
+    - ethportprofiles
+    - ethportsettings
+    - extendedcommunitylists
+    - gatewayprofiles
+    - gateways
+    - imageupdatesets
+    - ipv4lists
+    - ipv4prefixlists
+    - ipv6lists
+    - ipv6prefixlists
+    - lags
+    - packetbroker
+    - packetqueues
+    - pods
+    - portacls
+    - routemapclauses
+    - routemaps
+    - services
+    - sfpbreakouts
+    - sites
+    - switchpoints
+    - tenants
+    description:
+    - Resources to compare, named like their modules, such as C(tenants).
+    - All resources are compared when not set.
+    elements: str
+    required: false
+    type: list
+  update_baseline:
+    default: true
+    description:
+    - Make the objects read the new baseline once compared, so that the
+      next run reports the drift since this one.
+    - Set to V(false) to keep comparing with the same reference state.
+    required: false
+    type: bool
+short_description: Detect drift of Verity resources
+version_added: "1.1.0"
+'''
+
+EXAMPLES = r'''- name: Nightly drift check
+  be_networks.verity.verity_drift:
+    base_url: '{{ vnetc_url }}'
+    token: '{{ auth_result.token }}'
+  register: drift
+
+- name: Show what drifted
+  ansible.builtin.debug:
+    var: drift.resources
+  when: drift.drifted
+
+- name: Compare with the state approved before the change window
+  be_networks.verity.verity_drift:
+    base_url: '{{ vnetc_url }}'
+    token: '{{ auth_result.token }}'
+    baseline: approved
+    update_baseline: false
+    resources:
+    - tenants
+    - services
+  diff: true
+'''
+
+RETURN = r'''
+baseline_root:
+  description:
+  - Root hash of the baseline over the resources compared.
+  - V(null) when none of them was in the baseline.
+  returned: success
+  type: str
+baselined:
+  description: Resources that were not in the baseline yet.
+  returned: success
+  type: list
+  elements: str
+drifted:
+  description: Whether objects were added, removed or modified since the baseline.
+  returned: success
+  type: bool
+objects:
+  description: Number of objects read.
+  returned: success
+  type: int
+resources:
+  description:
+  - Per resource that drifted, the names of its objects C(added),
+    C(removed) and C(modified) since the baseline.
+  returned: success
+  type: dict
+  sample:
+    services:
+      added: [svc9]
+      removed: []
+      modified: [svc1, svc4]
+root:
+  description: Root hash of the resources read.
+  returned: success
+  type: str
+'''
+
+
+def run_module():
+    module = AnsibleModule(argument_spec=DRIFT_ARGS, supports_check_mode=True)
+    run_drift(module)
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2025, BeyondEdge Networks <you@example.com>
+# GNU General Public License v3.0+
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_export import (
+    EXPORT_ARGS,
+    run_export,
+)
+
+
+DOCUMENTATION = r'''author:
+- BeyondEdge Networks (@yourhandle)
+description:
+- Export the objects of every resource of a vNetC, or of O(resources), to a
+  gzip compressed JSON Lines file, for backups or for
+  M(be_networks.verity.verity_import).
+- The resources are read in parallel over the pooled connections of the
+  task, and each object is written as it is decoded from the response, so
+  memory stays flat however large the fabric.
+- Each resource is first written to its own file under C(<dest>.parts). If
+  some resources fail, the others are kept there and, with O(resume), the
+  next export of the same vNetC only reads the missing ones.
+- The task only reports a change when the content of O(dest) changes.
+extends_documentation_fragment:
+- be_networks.verity.verity
+module: verity_export
+notes:
+- 'Each line of O(dest) is one object, as
+  C({"resource": "services", "type": "service", "name": "svc1", "object": {...}}).'
+- Resources the vNetC only lists per value of a query parameter are read
+  once per value, and their lines keep it in C(params). ACLs are read with
+  C(ip_version) 4 and 6.
+- Resources the vNetC answers with HTTP 404 are exported empty.
+- In check mode nothing is read or written and the task reports a change.
+options:
+  dest:
+    description:
+    - Path of the C(.jsonl.gz) file to write.
+    required: true
+    type: path
+  max_workers:
+    default: 8
+    description:
+    - Number of resources read at the same time.
+    - Keep it at or below O(pool_maxsize), so that every worker keeps its
+      connection.
+    required: false
+    type: int
+  resources:
+    choices:
+    - acls
+    - aspathaccesslists
+    - badges
+    - bundles
+    - communitylists
+    - devicecontrollers
+    - devicesettings
+    - ethportprofiles
+    - ethportsettings
+    - extendedcommunitylists
+    - gatewayprofiles
+    - gateways
+    - imageupdatesets
+    - ipv4lists
+    - ipv4prefixlists
+    - ipv6lists
+    - ipv6prefixlists
+    - lags
+    - packetbroker
+    - packetqueues
+    - pods
+    - portacls
+    - routemapclauses
+    - routemaps
+    - services
+    - sfpbreakouts
+    - sites
+    - switchpoints
+    - tenants
+    description:
+    - Resources to export, named like their modules, such as C(tenants).
+    - All resources are exported when not set.
+    elements: str
+    required: false
+    type: list
+  resume:
+    default: true
+    description:
+    - Keep the resources exported by an earlier, failed run of the same
+      export instead of reading them again.
+    required: false
+    type: bool
+short_description: Export Verity resources to JSON Lines
+version_added: "1.1.0"
+'''
+
+EXAMPLES = r'''- name: Back up the fabric
+  be_networks.verity.verity_export:
+    base_url: '{{ vnetc_url }}'
+    token: '{{ auth_result.token }}'
+    dest: /backups/vnetc-{{ ansible_date_time.date }}.jsonl.gz
+  delegate_to: localhost
+
+- name: Export the tenants and services only
+  be_networks.verity.verity_export:
+    base_url: '{{ vnetc_url }}'
+    token: '{{ auth_result.token }}'
+    dest: /tmp/services.jsonl.gz
+    resources:
+    - tenants
+    - services
+'''
+
+RETURN = r'''
+checksum:
+  description: SHA-256 of O(dest).
+  returned: success
+  type: str
+dest:
+  description: Path of the export.
+  returned: always
+  type: str
+resources:
+  description:
+  - Per resource, the number of C(objects) exported, the C(elapsed) seconds
+    of its read and whether it was C(resumed) from an earlier run.
+  - Failed resources have C(failed) and C(msg) instead.
+  returned: always
+  type: dict
+  sample:
+    tenants:
+      objects: 12
+      elapsed: 0.412
+      resumed: false
+'''
+
+
+def run_module():
+    module = AnsibleModule(argument_spec=EXPORT_ARGS, supports_check_mode=True)
+    run_export(module)
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
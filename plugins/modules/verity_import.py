@@ -0,0 +1,170 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2025, BeyondEdge Networks <you@example.com>
+# GNU General Public License v3.0+
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_import import (
+    IMPORT_ARGS,
+    run_import,
+)
+
+
+DOCUMENTATION = r'''author:
+- BeyondEdge Networks (@yourhandle)
+description:
+- Import the objects of a JSON Lines file written by
+  M(be_networks.verity.verity_export), for example to rebuild a lab vNetC
+  from the state of production.
+- The file is read one line at a time and each object is set aside in a
+  temporary file of its resource, so memory stays flat however large the
+  file; only O(batch_size) objects per worker are held at once.
+- Objects are brought to state present, as by the resource modules;
+  those missing are created and only the changed fields of the others are
+  updated, so importing the same file again changes nothing.
+- Resources are imported in the order of their references, each after
+  the resources its objects can reference. Resources that do not depend
+  on each other are imported in parallel, each in batches of
+  O(batch_size) objects sent one after the other.
+- A batch that fails, except for invalid data, is retried once after all
+  other batches, as it can reference objects imported later, across a
+  reference cycle of resources (tenants, route maps and route map clauses)
+  or later in the file.
+extends_documentation_fragment:
+- be_networks.verity.verity
+module: verity_import
+notes:
+- Only the objects of the file are written; objects of the vNetC that the
+  file does not have are left alone.
+- ACLs are written as C(ip_filter) objects, with the C(ip_version) of their
+  line, or else of their C(ipv4_filter) or C(ipv6_filter) type.
+- Supports check mode, in which the current objects are read to report
+  whether anything would change.
+options:
+  batch_size:
+    default: 100
+    description:
+    - Number of objects of a resource sent in one request.
+    required: false
+    type: int
+  max_workers:
+    default: 4
+    description:
+    - Number of resources imported at the same time.
+    - Keep it at or below O(pool_maxsize), so that every worker keeps its
+      connection.
+    required: false
+    type: int
+  resources:
+    choices:
+    - acls
+    - aspathaccesslists
+    - badges
+    - bundles
+    - communitylists
+    - devicecontrollers
+    - devicesettings
+    - ethportprofiles
+    - ethportsettings
+    - extendedcommunitylists
+    - gatewayprofiles
+    - gateways
+    - imageupdatesets
+    - ipv4lists
+    - ipv4prefixlists
+    - ipv6lists
+    - ipv6prefixlists
+    - lags
+    - packetbroker
+    - packetqueues
+    - pods
+    - portacls
+    - routemapclauses
+    - routemaps
+    - services
+    - sfpbreakouts
+    - sites
+    - switchpoints
+    - tenants
+    description:
+    - Resources to import, named like their modules, such as C(tenants).
+    - All the resources of the file are imported when not set.
+    elements: str
+    required: false
+    type: list
+  src:
+    description:
+    - Path of the C(.jsonl.gz) file to import, or of an uncompressed
+      C(.jsonl) file.
+    required: true
+    type: path
+  validate_data:
+    default: true
+    description:
+    - Check each object against the fields documented by the module of its
+      resource before it is sent. Unknown fields, values of the wrong type
+      and values outside of the documented choices fail the resource,
+      listing every problem found, and its batch is not retried.
+    - Values are converted to their documented type, and objects created
+      get the documented default of the fields they do not set.
+    - Set to V(false) to send the objects as exported, for example for
+      fields this version of the collection does not know yet.
+    required: false
+    type: bool
+short_description: Import Verity resources from JSON Lines
+version_added: "1.1.0"
+'''
+
+EXAMPLES = r'''- name: Export production
+  be_networks.verity.verity_export:
+    base_url: '{{ production_url }}'
+    token: '{{ production_token }}'
+    dest: /tmp/production.jsonl.gz
+
+- name: Rebuild the lab from it
+  be_networks.verity.verity_import:
+    base_url: '{{ lab_url }}'
+    token: '{{ lab_token }}'
+    src: /tmp/production.jsonl.gz
+    max_workers: 8
+    pool_maxsize: 8
+'''
+
+RETURN = r'''
+elapsed:
+  description: Seconds the import took.
+  returned: always
+  type: float
+resources:
+  description:
+  - Per resource, whether it C(changed), the number of C(objects) and
+    C(batches), its C(level) in the order of the import, from 0, and the
+    C(elapsed) seconds of its first pass.
+  - Failed resources have C(failed) and the C(msg) of their first failed
+    batch.
+  returned: always
+  type: dict
+  sample:
+    services:
+      changed: true
+      objects: 240
+      batches: 3
+      level: 2
+      elapsed: 1.204
+'''
+
+
+def run_module():
+    module = AnsibleModule(argument_spec=IMPORT_ARGS, supports_check_mode=True)
+    run_import(module)
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
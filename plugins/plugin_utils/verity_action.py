@@ -0,0 +1,209 @@
+# verity_action.py - Shared base of the Verity resource action plugins.
+# Copyright: (c) 2025, BeyondEdge Networks <you@example.com>
+# GNU General Public License v3.0+
+
+from __future__ import absolute_import, annotations, division, print_function
+
+__metaclass__ = type  # pylint: disable=C0103
+
+from typing import Any, Dict, List, NoReturn, Optional, Set
+
+from ansible.errors import AnsibleError  # type: ignore
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator  # type: ignore
+from ansible.module_utils.common.parameters import remove_values  # type: ignore
+from ansible.module_utils.errors import UnsupportedError  # type: ignore
+from ansible.plugins.action import ActionBase  # type: ignore
+from ansible.utils.vars import merge_hash  # type: ignore
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_client import (
+    VerityApiError,
+    VerityClient,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_resource import (
+    CONNECTION_ARGS,
+    MODULE_ARGS,
+    run_resource,
+)
+
+
+class ModuleExit(Exception):
+    """Raised by :class:`InProcessModule` to end the run with a result."""
+
+    def __init__(self, result: Dict[str, Any]) -> None:
+        super(ModuleExit, self).__init__(result.get("msg", ""))
+        self.result = result
+
+
+class InProcessModule:
+    """
+    Stand-in for AnsibleModule when a resource module runs in the worker.
+
+    It provides what the Verity module_utils use from AnsibleModule;
+    exit_json() and fail_json() raise :class:`ModuleExit` instead of
+    printing the result and exiting the process.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        params: Dict[str, Any],
+        check_mode: bool = False,
+        diff: bool = False,
+        socket_path: Optional[str] = None,
+        no_log_values: Optional[Set[str]] = None,
+    ) -> None:
+        self._name = name
+        self.params = params
+        self.check_mode = check_mode
+        self._diff = diff
+        self._socket_path = socket_path
+        self.no_log_values = no_log_values or set()
+        self.warnings: List[str] = []
+
+    def warn(self, warning: str) -> None:
+        self.warnings.append(warning)
+
+    def exit_json(self, **kwargs: Any) -> NoReturn:
+        raise ModuleExit(kwargs)
+
+    def fail_json(self, msg: str, **kwargs: Any) -> NoReturn:
+        kwargs["failed"] = True
+        kwargs["msg"] = msg
+        raise ModuleExit(kwargs)
+
+    def format_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Finish a result the way AnsibleModule does before returning it.
+
+        Args:
+            result: Keyword arguments given to exit_json() or fail_json().
+
+        Returns:
+            dict: The result with ``invocation`` and ``warnings`` added and
+            no_log values masked.
+        """
+        result = dict(result)
+        result.setdefault("invocation", {"module_args": self.params})
+        if self.warnings:
+            result["warnings"] = result.get("warnings", []) + self.warnings
+        preserved = {k: v for k, v in result.items() if v is None or isinstance(v, bool)}
+        result = remove_values(result, self.no_log_values)
+        result.update(preserved)
+        return result
+
+
+def plugin_client(name: str, params: Dict[str, Any]) -> VerityClient:
+    """
+    Build the API client of a controller-side plugin, such as an
+    inventory or lookup, from its connection options.
+
+    Args:
+        name: Plugin name, used in messages.
+        params: Options named like the module connection options; those
+            not given take the module defaults.
+
+    Returns:
+        VerityClient: The client.
+
+    Raises:
+        AnsibleError: If the options are invalid or no client can be built.
+    """
+    validation = ArgumentSpecValidator(CONNECTION_ARGS).validate(params)
+    if validation.error_messages:
+        raise AnsibleError(f"Invalid options for {name}: {validation.errors.msg}")
+    try:
+        return VerityClient(InProcessModule(name, validation.validated_parameters))
+    except (ModuleExit, VerityApiError) as e:
+        raise AnsibleError(f"{name} cannot connect to the vNetC: {str(e)}")
+
+
+class VerityResourceAction(ActionBase):  # type: ignore[misc]
+    """
+    Base of the action plugins of the resource modules.
+
+    The Verity modules only talk to the vNetC API, so when the task would
+    run them on the controller anyway, that is with a local connection
+    (such as ``delegate_to: localhost``) or the persistent httpapi
+    connection, :func:`run_resource` is called right here in the worker.
+    That skips building the AnsiballZ payload, starting an interpreter
+    and importing everything again for every task. The arguments are
+    validated against the same spec and the result is the module's.
+
+    Other connections and async tasks run the module as usual.
+
+    Subclasses set ``RESOURCE``, the module name, and ``PATH``, its API
+    path, as passed to :func:`run_resource` by the module. Modules with
+    another runner override ``ARGUMENT_SPEC`` and :meth:`run_module`.
+    """
+
+    _supports_check_mode = True
+    _supports_async = True
+
+    ARGUMENT_SPEC: Dict[str, Any] = MODULE_ARGS
+    RESOURCE = ""
+    PATH = ""
+
+    def run_module(self, module: InProcessModule) -> None:
+        """
+        Call the module runner, which ends with exit_json() or fail_json().
+
+        Args:
+            module: The in-process module.
+        """
+        run_resource(module, self.RESOURCE, self.PATH)
+
+    def _runs_in_process(self) -> bool:
+        if self._task.async_val:
+            return False
+        if getattr(self._connection, "socket_path", None):
+            return True
+        return getattr(self._connection, "transport", None) == "local"
+
+    def run(
+        self,
+        tmp: Optional[str] = None,
+        task_vars: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the resource module in-process when possible.
+
+        Args:
+            tmp: Unused, kept for the ActionBase signature.
+            task_vars: Task variables.
+
+        Returns:
+            dict: The module result.
+        """
+        result = super(VerityResourceAction, self).run(tmp, task_vars)
+        del tmp  # tmp no longer has any effect
+
+        if not self._runs_in_process():
+            wrap_async = self._task.async_val and not self._connection.has_native_async
+            result = merge_hash(result, self._execute_module(task_vars=task_vars, wrap_async=wrap_async))
+            if not wrap_async:
+                self._remove_tmp_path(self._connection._shell.tmpdir)
+            return result
+
+        result.update(self._run_in_process())
+        return result
+
+    def _run_in_process(self) -> Dict[str, Any]:
+        validation = ArgumentSpecValidator(self.ARGUMENT_SPEC).validate(dict(self._task.args))
+        module = InProcessModule(
+            self._task.action,
+            validation.validated_parameters,
+            check_mode=bool(self._task.check_mode),
+            diff=bool(self._task.diff),
+            socket_path=getattr(self._connection, "socket_path", None),
+            no_log_values=validation._no_log_values,
+        )
+        if validation.error_messages:
+            msg = validation.errors.msg
+            if isinstance(validation.errors[0], UnsupportedError):
+                msg = f"Unsupported parameters for ({self._task.action}) module: {msg}"
+            return module.format_result(dict(failed=True, msg=msg))
+
+        try:
+            self.run_module(module)
+        except ModuleExit as e:
+            return module.format_result(e.result)
+        return module.format_result(dict(failed=True, msg=f"{self._task.action} returned no result"))
@@ -0,0 +1,70 @@
+"""Benchmark: /api/auth requests made by parallel forks.
+
+Starts N copies of the ``pods`` module at once, all authenticating with
+username/password against a mock vNetC whose auth endpoint is slow, and
+counts the ``/api/auth`` requests it receives with and without the token
+cache. With single-flight authentication the count drops from N to 1.
+
+Usage: python tests/benchmarks/bench_auth_single_flight.py [--forks 50]
+"""
+
+import argparse
+import json
+import tempfile
+import time
+
+from mock_controller import MockController, run_module
+
+
+def run_play(forks: int, token_cache: bool, auth_delay: float) -> dict:
+    """Run one simulated play.
+
+    Args:
+        forks: Number of module processes started at once.
+        token_cache: Value of the ``token_cache`` module option.
+        auth_delay: Seconds the mock spends on each authentication.
+
+    Returns:
+        dict: Auth requests seen by the controller, failures and wall time.
+    """
+    with MockController(auth_delay=auth_delay) as controller, tempfile.TemporaryDirectory() as cache_dir:
+        started = time.monotonic()
+        procs = [
+            run_module(
+                "pods",
+                dict(
+                    base_url=controller.base_url,
+                    username="admin",
+                    password="benchmark",
+                    cache_dir=cache_dir,
+                    token_cache=token_cache,
+                    data={"pod": {f"pod{index}": {"enable": True}}},
+                ),
+            )
+            for index in range(forks)
+        ]
+        failed = 0
+        for proc in procs:
+            out, _err = proc.communicate()
+            failed += bool(json.loads(out or "{}").get("failed", not out))
+        return dict(
+            auth_requests=controller.counters["auth"],
+            failed=failed,
+            seconds=round(time.monotonic() - started, 2),
+        )
+
+
+def main() -> None:
+    """Print auth requests per play with and without the token cache."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--forks", type=int, default=50)
+    parser.add_argument("--auth-delay", type=float, default=0.5)
+    args = parser.parse_args()
+
+    for token_cache in (False, True):
+        stats = run_play(args.forks, token_cache, args.auth_delay)
+        print(f"token_cache={str(token_cache).lower():5} forks={args.forks} {json.dumps(stats)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark: bytes on the wire and latency for large switchpoint payloads.
+
+Writes and reads back switchpoints with 64 ``eths``, ``badges`` and
+``traffic_mirrors`` entries through the module transport, once per
+``compression`` mode, against a mock vNetC behind a simulated link.
+
+Usage: python tests/benchmarks/bench_compression.py [--switchpoints 20] [--mbps 100]
+"""
+
+import argparse
+import sys
+import time
+
+from mock_controller import MockController, collections_path
+
+
+sys.path.insert(0, collections_path())
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_transport import (  # noqa: E402
+    SessionTransport,
+    get_session,
+)
+
+
+def switchpoint(index: int) -> dict:
+    """Build a switchpoint document the size of a 64-port leaf.
+
+    Args:
+        index: Switchpoint number, used to vary the content.
+
+    Returns:
+        dict: The switchpoint object.
+    """
+    return {
+        "enable": True,
+        "type": "leaf",
+        "pod": "pod1",
+        "pod_ref_type_": "pod",
+        "device_serial_number": f"SN{index:08d}",
+        "eths": [
+            {"index": port, "breakout": "4x25G", "eth_num_icon": "empty", "eth_name": f"Ethernet{port}"}
+            for port in range(1, 65)
+        ],
+        "badges": [{"index": badge, "badge": f"badge{badge}", "badge_ref_type_": "badge"} for badge in range(1, 9)],
+        "traffic_mirrors": [
+            {"index": mirror, "traffic_mirror_num_enable": False, "traffic_mirror_num_source_port": f"Ethernet{mirror}"}
+            for mirror in range(1, 5)
+        ],
+    }
+
+
+def run(mode: str, count: int, mbps: float) -> dict:
+    """Write then read ``count`` switchpoints with one compression mode.
+
+    Args:
+        mode: Value of the ``compression`` module option.
+        count: Number of switchpoints in the single PUT and GET.
+        mbps: Simulated link speed.
+
+    Returns:
+        dict: Bytes sent and received by the controller and call latencies.
+    """
+    with MockController(mbps=mbps) as controller:
+        transport = SessionTransport(
+            get_session(controller.base_url),
+            controller.base_url,
+            {"Cookie": f"ivn_api={controller.token}"},
+            compression=mode,
+        )
+        data = {"switchpoint": {f"leaf{index}": switchpoint(index) for index in range(count)}}
+
+        started = time.monotonic()
+        assert transport.request("PUT", "/switchpoints", data=data).ok
+        put_ms = (time.monotonic() - started) * 1000
+        started = time.monotonic()
+        assert len(transport.request("GET", "/switchpoints").data()["switchpoint"]) == count
+        get_ms = (time.monotonic() - started) * 1000
+        return dict(
+            request_bytes=controller.counters["bytes_in"],
+            response_bytes=controller.counters["bytes_out"],
+            put_ms=round(put_ms, 1),
+            get_ms=round(get_ms, 1),
+        )
+
+
+def main() -> None:
+    """Print wire bytes and latency per compression mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--switchpoints", type=int, default=20)
+    parser.add_argument("--mbps", type=float, default=100.0)
+    args = parser.parse_args()
+
+    for mode in ("none", "auto"):
+        stats = run(mode, args.switchpoints, args.mbps)
+        print(f"compression={mode:4} switchpoints={args.switchpoints} mbps={args.mbps:g} {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark: import time of every module, as paid by each task.
+
+Imports each module of the collection in a fresh interpreter with
+``python -X importtime`` and reports the cumulative import time, the best
+of ``--runs`` runs, together with whether ``requests`` was pulled in. The
+cost of importing ``requests`` alone is printed for reference.
+
+Usage: python tests/benchmarks/bench_import_time.py [--runs 5] [--modules pods,switchpoints]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+from mock_controller import collections_path
+
+PACKAGE = "ansible_collections.be_networks.verity.plugins.modules"
+
+
+def import_time(statement: str, target: str) -> tuple:
+    """Run one import in a fresh interpreter.
+
+    Args:
+        statement: Python code performing the import.
+        target: Name of the imported module whose cumulative time is reported.
+
+    Returns:
+        tuple: Cumulative microseconds for ``target`` and the set of imported names.
+    """
+    env = dict(os.environ, PYTHONPATH=collections_path())
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = 0
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self, total, name = (field.strip() for field in line.split(":", 1)[1].split("|"))
+        if not total.isdigit():
+            continue
+        imported.add(name)
+        if name == target:
+            cumulative = int(total)
+    return cumulative, imported
+
+
+def best_of(runs: int, statement: str, target: str) -> tuple:
+    """Return the fastest of several runs of :func:`import_time`.
+
+    Args:
+        runs: Number of fresh interpreters to start.
+        statement: Python code performing the import.
+        target: Name of the imported module.
+
+    Returns:
+        tuple: Best cumulative microseconds and the imported names of that run.
+    """
+    return min((import_time(statement, target) for _run in range(runs)), key=lambda result: result[0])
+
+
+def main() -> None:
+    """Print the import time of each module."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--modules", help="comma separated module names, default all")
+    args = parser.parse_args()
+
+    modules_dir = os.path.join(os.path.dirname(__file__), "..", "..", "plugins", "modules")
+    names = sorted(
+        name[:-3] for name in os.listdir(modules_dir) if name.endswith(".py") and not name.startswith("_")
+    )
+    if args.modules:
+        names = [name for name in names if name in args.modules.split(",")]
+
+    try:
+        requests_us, _imported = best_of(args.runs, "import requests", "requests")
+        print(f"{'requests (reference)':24} {requests_us / 1000:7.1f} ms")
+    except subprocess.CalledProcessError:
+        print(f"{'requests (reference)':24} not installed")
+
+    for name in names:
+        target = f"{PACKAGE}.{name}"
+        total_us, imported = best_of(args.runs, f"import {target}", target)
+        print(f"{name:24} {total_us / 1000:7.1f} ms  requests imported: {'requests' in imported}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark: many independent ethportsettings updates in one verity_batch run.
+
+Sends ``--operations`` PATCHes through the verity_batch runner, in process,
+to a mock vNetC that spends ``--latency`` seconds on every call, once per
+``max_workers`` value, optionally under a ``rate_limit``.
+
+Usage: python tests/benchmarks/bench_parallel.py [--operations 500] [--latency 0.02] [--rate-limit 0]
+"""
+
+import argparse
+import sys
+import time
+
+from mock_controller import MockController, collections_path
+
+
+sys.path.insert(0, collections_path())
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_batch import (  # noqa: E402
+    run_operations,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_client import (  # noqa: E402
+    VerityClient,
+)
+
+
+class BenchModule:
+    """Just enough of AnsibleModule for :class:`VerityClient`."""
+
+    def __init__(self, params: dict) -> None:
+        self.params = params
+
+    def fail_json(self, msg: str, **kwargs) -> None:
+        raise SystemExit(msg)
+
+    def warn(self, warning: str) -> None:
+        print(f"warning: {warning}")
+
+
+def run(workers: int, count: int, latency: float, rate_limit: float) -> dict:
+    """Run one batch of ``count`` updates.
+
+    Args:
+        workers: Value of the ``max_workers`` option.
+        count: Number of ethportsettings operations.
+        latency: Seconds the mock spends on each call.
+        rate_limit: Value of the ``rate_limit`` option, unlimited if 0.
+
+    Returns:
+        dict: Wall time, failures and connections opened to the controller.
+    """
+    with MockController(latency=latency) as controller:
+        module = BenchModule(dict(
+            base_url=controller.base_url, token=controller.token, pool_maxsize=max(10, workers),
+            rate_limit=rate_limit or None,
+        ))
+        client = VerityClient(module)
+        operations = [
+            dict(resource="ethportsettings", action="update",
+                 data={"eth_port_settings": {f"port{index}": {"enable": True, "mtu": 9000}}})
+            for index in range(count)
+        ]
+        started = time.monotonic()
+        results = run_operations(client, operations, max_workers=workers)
+        return dict(
+            seconds=round(time.monotonic() - started, 2),
+            failed=sum(1 for result in results if result.get("failed")),
+            connections=controller.counters["connections"],
+        )
+
+
+def main() -> None:
+    """Print batch wall time per number of workers."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--rate-limit", type=float, default=0)
+    args = parser.parse_args()
+
+    for workers in (1, 4, 16, 32):
+        stats = run(workers, args.operations, args.latency, args.rate_limit)
+        print(f"max_workers={workers:<3} operations={args.operations} {stats}")
+
+
+if __name__ == "__main__":
+    main()
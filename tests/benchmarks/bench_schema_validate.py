@@ -0,0 +1,125 @@
+"""Benchmark: client-side validation of switchpoint payloads.
+
+Validates ``--switchpoints`` objects the size of a 64-port leaf with the
+compiled validator of ``verity_validate``, and, for reference, with
+Ansible's ``ArgumentSpecValidator`` fed the same documented options, as
+``AnsibleModule`` would if ``data`` were declared with them. Also reports
+what compiling the validator costs on first use.
+
+Usage: python tests/benchmarks/bench_schema_validate.py [--switchpoints 10000] [--runs 3]
+"""
+
+import argparse
+import copy
+import sys
+import time
+
+from mock_controller import collections_path
+
+
+sys.path.insert(0, collections_path())
+
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator  # noqa: E402
+
+from ansible_collections.be_networks.verity.plugins.module_utils import verity_validate  # noqa: E402
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_schema import SCHEMAS  # noqa: E402
+
+
+def switchpoint(index: int) -> dict:
+    """Build a switchpoint document the size of a 64-port leaf.
+
+    Args:
+        index: Switchpoint number, used to vary the content.
+
+    Returns:
+        dict: The switchpoint object, with some values needing conversion.
+    """
+    return {
+        "type": "leaf",
+        "pod": "pod1",
+        "pod_ref_type_": "pod",
+        "rack": f"rack{index % 40}",
+        "bgp_as_number": str(65000 + index),
+        "device_serial_number": f"SN{index:08d}",
+        "locked": False,
+        "eths": [{"index": port, "breakout": "4x25G"} for port in range(1, 65)],
+        "badges": [{"index": badge, "badge": f"badge{badge}", "badge_ref_type_": "badge"} for badge in range(1, 9)],
+        "traffic_mirrors": [
+            {"index": mirror, "traffic_mirror_num_enable": False, "traffic_mirror_num_source_port": f"Ethernet{mirror}"}
+            for mirror in range(1, 5)
+        ],
+    }
+
+
+def argument_spec(fields: dict) -> dict:
+    """Convert documented fields to an Ansible argument spec.
+
+    Args:
+        fields: Field name to spec, as in ``SCHEMAS``.
+
+    Returns:
+        dict: The argument spec.
+    """
+    spec = {}
+    for name, field in fields.items():
+        spec[name] = {key: value for key, value in field.items() if key != "options"}
+        if "options" in field:
+            spec[name]["options"] = argument_spec(field["options"])
+    return spec
+
+
+def best_of(runs: int, function, *args) -> tuple:
+    """Return the fastest time of ``runs`` calls and the last result.
+
+    Args:
+        runs: Number of calls.
+        function: Callable to time.
+        *args: Arguments of each call.
+
+    Returns:
+        tuple: Best seconds and the result of the last call.
+    """
+    best, result = None, None
+    for _run in range(runs):
+        started = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main() -> None:
+    """Print the time taken by each validator."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--switchpoints", type=int, default=10000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    data = {"switchpoint": {f"leaf{index}": switchpoint(index) for index in range(args.switchpoints)}}
+
+    verity_validate._VALIDATORS.clear()
+    started = time.perf_counter()
+    verity_validate.data_validator("switchpoints")
+    print(f"{'compile (first use)':28} {(time.perf_counter() - started) * 1000:9.1f} ms")
+
+    for fill in (False, True):
+        seconds, (_data, errors) = best_of(args.runs, verity_validate.validate_data, "switchpoints", data, fill)
+        assert not errors, errors[:3]
+        label = f"verity_validate fill={fill}"
+        print(f"{label:28} {seconds * 1000:9.1f} ms  {seconds * 1e6 / args.switchpoints:6.1f} us/object")
+
+    # ArgumentSpecValidator fills in every missing option and modifies its input
+    validator = ArgumentSpecValidator(argument_spec(SCHEMAS["switchpoints"]["switchpoint"]))
+    objects = [copy.deepcopy(obj) for obj in data["switchpoint"].values()]
+
+    def validate_all(objects: list) -> list:
+        return [validator.validate(obj) for obj in objects]
+
+    seconds, results = best_of(1, validate_all, objects)
+    assert not any(result.error_messages for result in results)
+    label = "ArgumentSpecValidator"
+    print(f"{label:28} {seconds * 1000:9.1f} ms  {seconds * 1e6 / args.switchpoints:6.1f} us/object")
+
+
+if __name__ == "__main__":
+    main()
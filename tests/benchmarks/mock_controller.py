@@ -0,0 +1,246 @@
+"""Minimal in-memory vNetC used by the benchmarks."""
+
+import gzip
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class MockController(ThreadingHTTPServer):
+    """Threaded HTTP server speaking enough of the Verity API for benchmarks.
+
+    Args:
+        auth_delay: Seconds spent answering each ``/api/auth`` request.
+        token: Token handed out by ``/api/auth``.
+        mbps: Simulated link speed in megabits per second, unlimited if None.
+        gzip_requests: Accept gzip-encoded request bodies; answer 415 if False.
+        latency: Seconds spent by the controller on each API call.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        auth_delay: float = 0.0,
+        token: str = "mock-token",
+        mbps: float = None,
+        gzip_requests: bool = True,
+        latency: float = 0.0,
+    ) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.auth_delay = auth_delay
+        self.token = token
+        self.mbps = mbps
+        self.gzip_requests = gzip_requests
+        self.latency = latency
+        self.store: dict = {}
+        self.lock = threading.Lock()
+        self.counters = dict(auth=0, requests=0, connections=0, bytes_in=0, bytes_out=0)
+        self.sockets: set = set()
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """URL to pass as ``base_url`` to the modules."""
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increment a counter."""
+        with self.lock:
+            self.counters[name] += amount
+
+    def transfer(self, direction: str, size: int) -> None:
+        """Account for bytes on the wire, taking as long as the simulated link would."""
+        self.count(direction, size)
+        if self.mbps:
+            time.sleep(size * 8 / (self.mbps * 1e6))
+
+    def drop_connections(self) -> None:
+        """Close every open client connection, like a controller ending idle keep-alives."""
+        with self.lock:
+            sockets = list(self.sockets)
+        for sock in sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def __enter__(self) -> "MockController":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class _Rejected(Exception):
+    """Raised while reading a request body the mock refuses to decode."""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.count("connections")
+        with self.server.lock:
+            self.server.sockets.add(self.connection)
+
+    def finish(self) -> None:
+        with self.server.lock:
+            self.server.sockets.discard(self.connection)
+        super().finish()
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length)
+        self.server.transfer("bytes_in", length)
+        if self.headers.get("Content-Encoding") == "gzip":
+            if not self.server.gzip_requests:
+                raise _Rejected()
+            raw = gzip.decompress(raw)
+        return json.loads(raw) if raw else None
+
+    def _send(self, status: int, payload) -> None:
+        body = json.dumps(payload).encode()
+        headers = {"Content-Type": "application/json"}
+        if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.server.transfer("bytes_out", len(body))
+        self.wfile.write(body)
+
+    def handle_one_request(self) -> None:
+        try:
+            super().handle_one_request()
+        except _Rejected:
+            self._send(415, {"error": "unsupported content encoding"})
+
+    def _route(self):
+        self.server.count("requests")
+        url = urlsplit(self.path)
+        resource = url.path[len("/api/"):].strip("/")
+        names = [v for k, vals in parse_qs(url.query).items() if k.endswith("_name")
+                 and k != "changeset_name" for v in vals]
+        if resource != "auth":
+            time.sleep(self.server.latency)
+        return resource, names
+
+    def do_POST(self) -> None:
+        resource, _names = self._route()
+        self._body()
+        if resource != "auth":
+            self._send(404, {"error": "not found"})
+            return
+        self.server.count("auth")
+        time.sleep(self.server.auth_delay)
+        self._send(200, {"token": self.server.token})
+
+    def _authorized(self) -> bool:
+        if f"ivn_api={self.server.token}" in (self.headers.get("Cookie") or ""):
+            return True
+        self._send(401, {"error": "unauthorized"})
+        return False
+
+    def do_GET(self) -> None:
+        resource, names = self._route()
+        if not self._authorized():
+            return
+        with self.server.lock:
+            objects = self.server.store.get(resource, {})
+            payload = {
+                key: {n: o for n, o in objs.items() if not names or n in names}
+                for key, objs in objects.items()
+            }
+        self._send(200, payload)
+
+    def _write(self, merge: bool) -> None:
+        resource, _names = self._route()
+        body = self._body() or {}
+        if not self._authorized():
+            return
+        with self.server.lock:
+            objects = self.server.store.setdefault(resource, {})
+            for key, objs in body.items():
+                for name, obj in objs.items():
+                    bucket = objects.setdefault(key, {})
+                    current = bucket.get(name) if merge else None
+                    bucket[name] = dict(current or {}, **obj)
+        self._send(200, {})
+
+    def do_PUT(self) -> None:
+        self._write(merge=False)
+
+    def do_PATCH(self) -> None:
+        self._write(merge=True)
+
+    def do_DELETE(self) -> None:
+        resource, names = self._route()
+        if not self._authorized():
+            return
+        with self.server.lock:
+            for objs in self.server.store.get(resource, {}).values():
+                for name in names:
+                    objs.pop(name, None)
+        self._send(200, {})
+
+
+def collections_path() -> str:
+    """Return the collections root that makes this checkout importable.
+
+    Uses ``ANSIBLE_COLLECTIONS_PATH`` when set, otherwise the checkout itself
+    when it lives at ``<root>/ansible_collections/be_networks/verity``, or
+    the ``collections`` directory pytest-ansible creates in the checkout.
+
+    Raises:
+        SystemExit: If the collection cannot be located.
+    """
+    if os.environ.get("ANSIBLE_COLLECTIONS_PATH"):
+        return os.environ["ANSIBLE_COLLECTIONS_PATH"].split(os.pathsep)[0]
+    checkout = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    root, namespace_dir = os.path.split(os.path.dirname(checkout))
+    if os.path.basename(root) == "ansible_collections" and namespace_dir == "be_networks":
+        return os.path.dirname(root)
+    if os.path.isdir(os.path.join(checkout, "collections", "ansible_collections", "be_networks")):
+        return os.path.join(checkout, "collections")
+    raise SystemExit(
+        "Run from <root>/ansible_collections/be_networks/verity or set ANSIBLE_COLLECTIONS_PATH",
+    )
+
+
+def run_module(name: str, args: dict) -> subprocess.Popen:
+    """Start a collection module in its own interpreter, like an Ansible fork.
+
+    Args:
+        name: Module name, e.g. ``pods``.
+        args: Module arguments.
+
+    Returns:
+        subprocess.Popen: The running module; its stdout is the JSON result.
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as fp:
+        json.dump({"ANSIBLE_MODULE_ARGS": args}, fp)
+    env = dict(os.environ, PYTHONPATH=collections_path())
+    return subprocess.Popen(
+        [sys.executable, "-m", f"ansible_collections.be_networks.verity.plugins.modules.{name}", fp.name],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+    )
@@ -0,0 +1,121 @@
+"""Unit tests for the in-process module shim of the Verity action plugins."""
+
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from ansible_collections.be_networks.verity.plugins.action.pods import ActionModule
+from ansible_collections.be_networks.verity.plugins.plugin_utils.verity_action import (
+    InProcessModule,
+    ModuleExit,
+)
+from ansible_collections.be_networks.verity.tests.benchmarks.mock_controller import MockController
+
+
+class RecordingAction(ActionModule):
+    """pods action recording how it ran instead of calling the vNetC."""
+
+    def __init__(self, args: Dict[str, Any], transport: str = "local", socket_path: Optional[str] = None,
+                 async_val: int = 0, has_native_async: bool = False) -> None:
+        task = SimpleNamespace(args=args, action="be_networks.verity.pods", async_val=async_val,
+                               check_mode=False, diff=False)
+        connection = SimpleNamespace(transport=transport, socket_path=socket_path,
+                                     has_native_async=has_native_async,
+                                     _shell=SimpleNamespace(tmpdir=None))
+        super().__init__(task, connection, None, None, None)
+        self.modules: List[InProcessModule] = []
+        self.executed: List[bool] = []
+        self.removed: List[Any] = []
+
+    def run_module(self, module: InProcessModule) -> None:
+        self.modules.append(module)
+        module.exit_json(changed=False, response={})
+
+    def _execute_module(self, task_vars: Any = None, wrap_async: bool = False, **kwargs: Any) -> Dict[str, Any]:
+        self.executed.append(wrap_async)
+        return {"changed": True, "remote": True}
+
+    def _remove_tmp_path(self, tmp_path: Any, force: bool = False) -> None:
+        self.removed.append(tmp_path)
+
+
+def test_fail_json_raises_with_result() -> None:
+    """fail_json ends the run with a failed result instead of exiting."""
+    module = InProcessModule("be_networks.verity.pods", {"action": "create"})
+    with pytest.raises(ModuleExit) as exc:
+        module.fail_json(msg="pods API call failed with HTTP 500", status=500)
+    assert exc.value.result == {"failed": True, "msg": "pods API call failed with HTTP 500", "status": 500}
+
+
+def test_format_result_masks_no_log_values() -> None:
+    """Secrets are masked everywhere while booleans and warnings survive."""
+    params = {"username": "admin", "password": "s3cret-pw", "validate_certs": True}
+    module = InProcessModule("be_networks.verity.pods", params, no_log_values={"s3cret-pw"})
+    module.warn("Could not use the token cache")
+    result = module.format_result({"changed": True, "response": {"echo": "s3cret-pw"}})
+    assert result["changed"] is True
+    assert result["response"] == {"echo": "VALUE_SPECIFIED_IN_NO_LOG_PARAMETER"}
+    assert result["invocation"]["module_args"]["password"] == "VALUE_SPECIFIED_IN_NO_LOG_PARAMETER"
+    assert result["invocation"]["module_args"]["validate_certs"] is True
+    assert result["warnings"] == ["Could not use the token cache"]
+
+
+@pytest.mark.parametrize("transport, socket_path, in_process", [
+    ("local", None, True),
+    ("ansible.netcommon.httpapi", "/tmp/verity-socket", True),
+    ("ssh", None, False),
+])
+def test_runs_in_process_on_local_and_httpapi_connections(
+    transport: str, socket_path: Optional[str], in_process: bool,
+) -> None:
+    """Local and httpapi tasks run the module in the worker; others run it on the host."""
+    action = RecordingAction({"action": "get"}, transport, socket_path)
+    assert action._runs_in_process() is in_process
+    result = action.run(task_vars={})
+    if in_process:
+        assert result["changed"] is False and "remote" not in result
+        assert action.modules[0]._socket_path == socket_path
+        assert action.executed == [] and action.removed == []
+    else:
+        assert result == {"changed": True, "remote": True}
+        assert action.modules == [] and action.executed == [False] and action.removed == [None]
+
+
+@pytest.mark.parametrize("has_native_async, wrapped", [(False, True), (True, False)])
+def test_async_tasks_run_the_module_as_usual(has_native_async: bool, wrapped: bool) -> None:
+    """Async tasks run the module normally, even on a local connection."""
+    action = RecordingAction({"action": "get"}, async_val=30, has_native_async=has_native_async)
+    assert not action._runs_in_process()
+    assert action.run(task_vars={})["remote"] is True
+    assert action.modules == [] and action.executed == [wrapped]
+    # The async wrapper removes the temporary files itself
+    assert action.removed == ([] if wrapped else [None])
+
+
+def test_unsupported_parameters_fail_like_the_module() -> None:
+    """Unknown options fail the task with the module's message, before anything runs."""
+    action = RecordingAction({"action": "get", "password": "s3cret-pw", "colour": "blue"})
+    result = action._run_in_process()
+    assert result["failed"] is True
+    assert result["msg"].startswith("Unsupported parameters for (be_networks.verity.pods) module: colour")
+    assert result["invocation"]["module_args"]["password"] == "VALUE_SPECIFIED_IN_NO_LOG_PARAMETER"
+    assert action.modules == []
+
+
+def test_run_in_process_returns_the_masked_result(tmp_path) -> None:
+    """The result of run_resource comes back with the no_log values masked."""
+    with MockController() as controller:
+        controller.store["pods"] = {"pod": {"p1": {"description": "s3cret-pw"}}}
+        args = {"base_url": controller.base_url, "username": "admin", "password": "s3cret-pw",
+                "validate_certs": False, "cache_dir": str(tmp_path), "action": "get"}
+        action = ActionModule(
+            SimpleNamespace(args=args, action="be_networks.verity.pods", async_val=0,
+                            check_mode=False, diff=False),
+            SimpleNamespace(transport="local", _shell=SimpleNamespace(tmpdir=None)),
+            None, None, None)
+        result = action.run(task_vars={})
+    assert result["changed"] is False and "failed" not in result
+    assert result["response"] == {"pod": {"p1": {"description": "VALUE_SPECIFIED_IN_NO_LOG_PARAMETER"}}}
+    assert result["invocation"]["module_args"]["password"] == "VALUE_SPECIFIED_IN_NO_LOG_PARAMETER"
+    assert result["invocation"]["module_args"]["validate_certs"] is False
@@ -0,0 +1,64 @@
+"""Unit tests for the verity_batch operation runner."""
+
+from typing import Any, List, Tuple
+
+import pytest
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_batch import run_batch, run_operations
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_transport import VerityResponse
+
+
+class FakeClient:
+    """Records calls and answers HTTP 500 for the paths listed in ``failing``."""
+
+    def __init__(self, failing: Tuple[str, ...] = ()) -> None:
+        self.failing = failing
+        self.calls: List[Tuple[str, str, Any, Any]] = []
+
+    def request(self, method: str, path: str, params: Any = None, data: Any = None) -> VerityResponse:
+        self.calls.append((method, path, params, data))
+        if path in self.failing:
+            return VerityResponse(500, body='{"error": "boom"}')
+        return VerityResponse(200, body="{}")
+
+
+OPERATIONS = [
+    {"resource": "tenants", "data": {"tenant": {"T1": {}}}},
+    {"resource": "services", "action": "update", "data": {"service": {"S1": {}}}},
+    {"resource": "gateways", "action": "delete", "params": {"gateway_name": "G1"}},
+]
+
+
+def test_operations_run_in_order_with_their_methods() -> None:
+    """Actions map to PUT/PATCH/DELETE and default to the module action."""
+    client = FakeClient()
+    results = run_operations(client, OPERATIONS, default_action="create")
+    assert [call[:2] for call in client.calls] == [
+        ("PUT", "/tenants"), ("PATCH", "/services"), ("DELETE", "/gateways"),
+    ]
+    assert client.calls[2][3] is None
+    assert all(result["changed"] and "elapsed" in result for result in results)
+
+
+def test_stop_on_error_skips_the_rest() -> None:
+    """Operations after a failure are skipped unless stop_on_error is off."""
+    results = run_operations(FakeClient(failing=("/services",)), OPERATIONS)
+    assert [r.get("failed", False) for r in results] == [False, True, False]
+    assert results[1]["status"] == 500 and results[1]["response"] == {"error": "boom"}
+    assert results[2]["skipped"] is True
+
+    client = FakeClient(failing=("/services",))
+    results = run_operations(client, OPERATIONS, stop_on_error=False)
+    assert len(client.calls) == 3 and results[2]["changed"] is True
+
+
+def test_negative_rate_limit_is_rejected() -> None:
+    """A rate below 0 fails before anything is sent; 0 means no limit."""
+    class BatchModule:
+        params = dict(rate_limit=-1.0)
+
+        def fail_json(self, msg: str, **kwargs: Any) -> None:
+            raise AssertionError(msg)
+
+    with pytest.raises(AssertionError, match="rate_limit must be 0 or more"):
+        run_batch(BatchModule())
@@ -0,0 +1,94 @@
+"""Unit tests for the on-disk token cache and its lock."""
+
+import os
+import threading
+import time
+from typing import Any, Dict, List
+
+from ansible_collections.be_networks.verity.plugins.module_utils import verity_api
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_cache import TokenCache, file_lock
+
+
+class CacheModule:
+    """The module attributes get_token reads."""
+
+    def __init__(self, cache_dir: str) -> None:
+        self.params: Dict[str, Any] = {"token_cache": True, "token_cache_ttl": 60, "cache_dir": cache_dir}
+        self.warnings: List[str] = []
+
+    def warn(self, msg: str) -> None:
+        self.warnings.append(msg)
+
+
+def test_entries_expire_and_are_private(tmp_path) -> None:
+    """Tokens are read back until they expire, from files only the owner can read."""
+    cache = TokenCache(str(tmp_path), ttl=60)
+    key = TokenCache.key("https://vnc/", "admin")
+    assert key == "admin@https://vnc"
+    cache.set(key, "t1")
+    assert cache.get(key) == "t1" and cache.keys() == [key]
+    assert os.stat(cache._file(key)).st_mode & 0o077 == 0
+
+    cache.discard(key, "other")
+    assert cache.get(key) == "t1"
+    cache.discard(key, "t1")
+    assert cache.get(key) is None
+
+    TokenCache(str(tmp_path), ttl=-1).set(key, "t2")
+    assert cache.get(key) is None and not os.path.exists(cache._file(key))
+
+
+def test_keys_fingerprint_the_password() -> None:
+    """Different passwords give different keys, which do not contain them."""
+    good = TokenCache.key("https://vnc", "admin", "s3cret")
+    assert good == TokenCache.key("https://vnc/", "admin", "s3cret")
+    assert good != TokenCache.key("https://vnc", "admin", "WRONG")
+    assert good.startswith("admin@https://vnc#") and "s3cret" not in good
+
+
+def test_wrong_password_is_not_given_a_cached_token(tmp_path, monkeypatch) -> None:
+    """Only the password a token was obtained with reuses it."""
+    sent: List[str] = []
+
+    def authenticate(module: Any, base_url: str, username: str, password: str, timeout: Any = None) -> str:
+        sent.append(password)
+        return f"token-{len(sent)}"
+
+    monkeypatch.setattr(verity_api, "authenticate", authenticate)
+    module = CacheModule(str(tmp_path))
+    assert verity_api.get_token(module, "https://vnc", "admin", "s3cret") == "token-1"
+    assert verity_api.get_token(module, "https://vnc", "admin", "s3cret") == "token-1"
+    assert verity_api.get_token(module, "https://vnc", "admin", "WRONG") == "token-2"
+    assert sent == ["s3cret", "WRONG"]
+
+
+def test_get_or_create_is_single_flight(tmp_path) -> None:
+    """Concurrent callers missing the same token wait for the one fetching it."""
+    calls: List[int] = []
+
+    def fetch() -> str:
+        calls.append(1)
+        time.sleep(0.2)
+        return "t1"
+
+    tokens: List[str] = []
+    threads = [threading.Thread(target=lambda: tokens.append(TokenCache(str(tmp_path)).get_or_create("k", fetch)))
+               for _thread in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert tokens == ["t1"] * 4 and len(calls) == 1
+
+
+def test_file_lock_times_out_unlocked(tmp_path) -> None:
+    """A lock held elsewhere is waited for up to the timeout, then given up."""
+    path = str(tmp_path / "locks" / "k.lock")
+    with file_lock(path) as held:
+        assert held is True
+        started = time.monotonic()
+        with file_lock(path, timeout=0.2) as other:
+            assert other is False
+        assert time.monotonic() - started >= 0.2
+    with file_lock(path, timeout=0) as again:
+        assert again is True
@@ -0,0 +1,50 @@
+"""Unit tests for the Verity changeset support."""
+
+from typing import Any, List, Tuple
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_client import VerityClient
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_transport import VerityResponse
+
+
+class FakeModule:
+    """Just enough of AnsibleModule for :class:`VerityClient`."""
+
+    def __init__(self, **params: Any) -> None:
+        self.params = dict(base_url="https://vnc", token="t", **params)
+
+    def fail_json(self, msg: str, **kwargs: Any) -> None:
+        raise AssertionError(msg)
+
+
+class FakeTransport:
+    """Records every call and answers HTTP 200."""
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, str, Any]] = []
+
+    def request(self, method: str, path: str, params: Any = None, data: Any = None, timeout: Any = None,
+                stream: bool = False) -> VerityResponse:
+        self.calls.append((method, path, params))
+        return VerityResponse(200, body="{}")
+
+
+def client_for(**params: Any) -> VerityClient:
+    client = VerityClient(FakeModule(**params))
+    client.transport = FakeTransport()
+    return client
+
+
+def test_changeset_name_joins_every_call() -> None:
+    """The option is added to the query of each call that has no changeset of its own."""
+    client = client_for(changeset_name="run1")
+    client.request("PATCH", "/tenants", params={"tenant_name": "t"})
+    client.request("GET", "/tenants", params={"changeset_name": "other"})
+    client.request("DELETE", "/tenants")
+    assert [call[2] for call in client.transport.calls] == [
+        {"tenant_name": "t", "changeset_name": "run1"}, {"changeset_name": "other"}, {"changeset_name": "run1"},
+    ]
+
+    client = client_for()
+    client.request("GET", "/tenants")
+    assert client.transport.calls == [("GET", "/tenants", None)]
+
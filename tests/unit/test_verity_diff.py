@@ -0,0 +1,78 @@
+"""Unit tests for the Verity object diff."""
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_diff import (
+    apply_patch,
+    diff_list,
+    diff_objects,
+    diff_value,
+    kept_lists,
+    same_value,
+)
+
+
+def test_same_value_tells_booleans_from_numbers() -> None:
+    """True and 1 are different JSON values, nested or not."""
+    assert not same_value(True, 1)
+    assert not same_value({"mtu": 1}, {"mtu": True})
+    assert same_value({"a": [1, {"b": False}]}, {"a": [1, {"b": False}]})
+
+
+def test_diff_value_keeps_only_changed_fields() -> None:
+    """Nested objects are diffed field by field, plain lists are replaced whole."""
+    current = {"enable": True, "mtu": 1500, "object_properties": {"group": "a", "notes": "x"},
+               "eths": [{"index": 1}], "vlans": [1, 2], "untouched": 1}
+    desired = {"enable": True, "mtu": 9000, "object_properties": {"group": "a", "notes": "y"},
+               "eths": [{"index": 1}, {"index": 2}], "vlans": [1, 3], "new": None}
+    assert diff_value(current, desired) == (True, {
+        "mtu": 9000, "object_properties": {"notes": "y"}, "eths": [{"index": 2}], "vlans": [1, 3], "new": None,
+    })
+    assert diff_value(current, {"enable": True, "eths": [{"index": 1}]}) == (False, {})
+
+
+def test_diff_objects_splits_creates_and_updates() -> None:
+    """Missing objects are created whole, unchanged ones are left out."""
+    current = {"tenant": {"t1": {"enable": True}, "t2": {"enable": True}}}
+    desired = {"tenant": {"t1": {"enable": True}, "t2": {"enable": False}, "t3": {"enable": True}}}
+    assert diff_objects(current, desired) == (
+        {"tenant": {"t3": {"enable": True}}},
+        {"tenant": {"t2": {"enable": False}}},
+    )
+    assert diff_objects(desired, desired) == ({}, {})
+
+
+def test_diff_list_sends_only_changed_entries() -> None:
+    """One changed port out of 64 gives a one entry patch, with its index."""
+    current = [{"index": index, "enable": True, "port_name": f"Ethernet{index}"} for index in range(1, 65)]
+    desired = [dict(entry) for entry in current]
+    desired[9]["enable"] = False
+    assert diff_list(current, desired) == (True, [{"enable": False, "index": 10}])
+    assert diff_list(current, desired[:3]) == (False, [])
+
+
+def test_diff_list_matches_added_entries_by_content() -> None:
+    """Index 0 entries already present are not added again; others are left in place."""
+    current = [{"index": 1, "badge": "a"}, {"index": 2, "badge": "b"}, {"index": 3, "badge": "c"}]
+    desired = [{"index": 0, "badge": "b"}, {"index": 0, "badge": "d"}, {"index": 7, "badge": "e"}]
+    assert diff_list(current, desired) == (True, [{"index": 0, "badge": "d"}, {"index": 7, "badge": "e"}])
+    assert diff_list(current, [{"index": 0, "badge": "a"}, {"index": 0, "badge": "a"}]) == (
+        True, [{"index": 0, "badge": "a"}])
+
+
+def test_apply_patch_gives_the_desired_object() -> None:
+    """Applying a diff patch to the current object brings in every desired change."""
+    current = {"mtu": 1500, "props": {"a": 1, "b": 2},
+               "badges": [{"index": 1, "badge": "a"}, {"index": 2, "badge": "b"}]}
+    desired = {"props": {"b": 3}, "badges": [{"index": 2, "badge": "c"}, {"index": 0, "badge": "d"}]}
+    changed, patch = diff_value(current, desired)
+    assert changed and apply_patch(current, patch) == {
+        "mtu": 1500, "props": {"a": 1, "b": 3},
+        "badges": [{"index": 1, "badge": "a"}, {"index": 2, "badge": "c"}, {"index": 0, "badge": "d"}],
+    }
+
+
+def test_empty_lists_are_reported() -> None:
+    """An empty list does not clear existing entries, and is reported as such."""
+    current = {"switchpoint": {"leaf1": {"eths": [{"index": 1}], "badges": [], "props": {"eths": [{"index": 2}]}}}}
+    desired = {"switchpoint": {"leaf1": {"eths": [], "badges": [], "props": {"eths": []}}, "new": {"eths": []}}}
+    assert diff_objects(current, desired) == ({"switchpoint": {"new": {"eths": []}}}, {})
+    assert list(kept_lists(current, desired)) == ["switchpoint leaf1.eths", "switchpoint leaf1.props.eths"]
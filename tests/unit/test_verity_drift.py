@@ -0,0 +1,64 @@
+"""Unit tests for drift detection."""
+
+from typing import Any, Dict, Iterator, List, Tuple
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_drift import (
+    DriftBaseline,
+    detect_drift,
+    object_hash,
+)
+
+
+class ObjectsClient:
+    """Streams the objects of each resource path from ``objects``."""
+
+    controller = "https://vnc"
+    changeset_name = None
+
+    def __init__(self, objects: Dict[str, Dict[str, Any]]) -> None:
+        self.objects = objects
+        self.paths: List[str] = []
+
+    def iter_objects(self, path: str, params: Any = None) -> Iterator[Tuple[str, Any, Any]]:
+        self.paths.append(path)
+        for type_key, objects in self.objects.get(path, {}).items():
+            for name, obj in objects.items():
+                yield type_key, name, obj
+
+
+def test_object_hash_is_canonical() -> None:
+    """The order of fields does not matter; their values do."""
+    assert object_hash({"a": 1, "b": [1, 2]}) == object_hash({"b": [1, 2], "a": 1})
+    assert object_hash({"a": 1}) != object_hash({"a": True})
+
+
+def test_drift_since_the_baseline(tmp_path) -> None:
+    """The first run records the baseline; later ones report and diff what changed since."""
+    objects = {
+        "/tenants": {"tenant": {"t1": {"enable": True}}},
+        "/services": {"service": {"s1": {"vlan": 101}, "s2": {"vlan": 102}}},
+    }
+    client = ObjectsClient(objects)
+    baseline = DriftBaseline(str(tmp_path), client.controller)
+    resources = ["services", "tenants"]
+
+    first = detect_drift(client, baseline, resources)
+    assert first["drifted"] is False and first["baselined"] == resources and first["objects"] == 3
+    again = detect_drift(client, baseline, resources)
+    assert again["drifted"] is False and again["root"] == again["baseline_root"] == first["root"]
+
+    objects["/services"]["service"] = {"s1": {"vlan": 111}, "s3": {"vlan": 103}}
+    drift = detect_drift(client, baseline, resources, update=False, diff=True)
+    assert drift["changed"] is True and drift["baselined"] == []
+    assert drift["resources"] == {"services": {"added": ["s3"], "removed": ["s2"], "modified": ["s1"]}}
+    assert [(entry["before_header"], entry["before"], entry["after"]) for entry in drift["diff"]] == [
+        ("services s1", {"vlan": 101}, {"vlan": 111}),
+        ("services s2", {"vlan": 102}, {}),
+        ("services s3", {}, {"vlan": 103}),
+    ]
+    # Not updated: the same drift again, then recorded
+    assert detect_drift(client, baseline, resources)["resources"] == drift["resources"]
+    assert detect_drift(client, baseline, resources)["drifted"] is False
+
+    other = DriftBaseline(str(tmp_path), client.controller, name="approved")
+    assert detect_drift(client, other, ["tenants"])["baselined"] == ["tenants"]
@@ -0,0 +1,96 @@
+"""Unit tests for the streaming export."""
+
+import gzip
+import json
+import os
+from typing import Any, Dict, Iterator, List, Tuple
+from urllib.parse import urlencode
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_client import VerityApiError
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_export import export_resources
+
+
+class ExportClient:
+    """Streams the objects of each resource path; paths in ``failing`` fail once."""
+
+    controller = "https://vnc"
+    changeset_name = None
+
+    def __init__(self, objects: Dict[str, Dict[str, Any]], failing: Tuple[str, ...] = ()) -> None:
+        self.objects = objects
+        self.failing = set(failing)
+        self.paths: List[str] = []
+
+    def iter_objects(self, path: str, params: Any = None) -> Iterator[Tuple[str, Any, Any]]:
+        if params:
+            path += "?" + urlencode(params)
+        self.paths.append(path)
+        if path in self.failing:
+            self.failing.discard(path)
+            raise VerityApiError(f"GET {path} failed with HTTP 500", status=500)
+        if path not in self.objects:
+            raise VerityApiError(f"GET {path} failed with HTTP 404", status=404)
+        for type_key, objects in self.objects[path].items():
+            for name, obj in objects.items():
+                yield type_key, name, obj
+
+
+OBJECTS = {
+    "/tenants": {"tenant": {"t1": {"enable": True}}},
+    "/services": {"service": {"s1": {"tenant": "t1"}, "s2": {"tenant": "t1"}}},
+}
+
+
+def read(path: str) -> List[Dict[str, Any]]:
+    with gzip.open(path, "rt", encoding="utf-8") as fp:
+        return [json.loads(line) for line in fp]
+
+
+def test_export_is_resumed_after_a_failure(tmp_path) -> None:
+    """A failed resource keeps the parts of the others; the next run only reads it."""
+    dest = str(tmp_path / "fabric.jsonl.gz")
+    client = ExportClient(OBJECTS, failing=("/services",))
+    resources = ["tenants", "services", "pods"]
+    result = export_resources(client, dest, resources, max_workers=3)
+    assert result["failed"] is True and "services export failed" in result["msg"]
+    assert not os.path.exists(dest) and os.path.isdir(dest + ".parts")
+
+    client.paths = []
+    result = export_resources(client, dest, resources, max_workers=3)
+    assert client.paths == ["/services"]
+    assert result["changed"] is True and not os.path.exists(dest + ".parts")
+    assert result["resources"]["tenants"]["resumed"] is True
+    assert result["resources"]["tenants"]["objects"] == 1
+    assert result["resources"]["pods"]["objects"] == 0
+    assert read(dest) == [
+        {"resource": "tenants", "type": "tenant", "name": "t1", "object": {"enable": True}},
+        {"resource": "services", "type": "service", "name": "s1", "object": {"tenant": "t1"}},
+        {"resource": "services", "type": "service", "name": "s2", "object": {"tenant": "t1"}},
+    ]
+
+
+def test_unchanged_export_reports_no_change(tmp_path) -> None:
+    """The same objects give the same file, which is then left alone."""
+    dest = str(tmp_path / "fabric.jsonl.gz")
+    first = export_resources(ExportClient(OBJECTS), dest, ["tenants", "services"])
+    second = export_resources(ExportClient(OBJECTS), dest, ["tenants", "services"], resume=False)
+    assert first["changed"] is True and second["changed"] is False
+    assert first["checksum"] == second["checksum"]
+
+
+def test_acls_are_exported_per_ip_version(tmp_path) -> None:
+    """acls are only listed per ip_version; each record keeps the version it was read with."""
+    dest = str(tmp_path / "acls.jsonl.gz")
+    client = ExportClient({
+        "/acls?ip_version=4": {"ipv4_filter": {"f4": {"protocol": "tcp"}}},
+        "/acls?ip_version=6": {"ipv6_filter": {"f6": {"protocol": "udp"}}},
+    })
+    result = export_resources(client, dest, ["acls"])
+    assert sorted(client.paths) == ["/acls?ip_version=4", "/acls?ip_version=6"]
+    assert result["resources"]["acls"]["objects"] == 2
+    assert read(dest) == [
+        {"resource": "acls", "type": "ipv4_filter", "name": "f4", "object": {"protocol": "tcp"},
+         "params": {"ip_version": "4"}},
+        {"resource": "acls", "type": "ipv6_filter", "name": "f6", "object": {"protocol": "udp"},
+         "params": {"ip_version": "6"}},
+    ]
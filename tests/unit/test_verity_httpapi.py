@@ -0,0 +1,98 @@
+"""Unit tests for the be_networks.verity.verity httpapi plugin."""
+
+from typing import Any
+from urllib.error import HTTPError
+
+import pytest
+
+pytest.importorskip("ansible_collections.ansible.netcommon")
+
+from ansible.errors import AnsibleAuthenticationFailure  # noqa: E402
+
+from ansible_collections.be_networks.verity.plugins.httpapi.verity import HttpApi  # noqa: E402
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_api import build_headers  # noqa: E402
+from ansible_collections.be_networks.verity.tests.benchmarks.mock_controller import MockController  # noqa: E402
+
+
+class PersistentConnection:
+    """The parts of the ansible.netcommon.httpapi connection the plugin uses."""
+
+    def __init__(self, url: str, **options: Any) -> None:
+        self._url = url
+        self._auth = None
+        self.options = dict(validate_certs=False, persistent_command_timeout=30,
+                            remote_user="admin", password="s3cret", **options)
+        self.httpapi = HttpApi(self)
+
+    def get_option(self, name: str) -> Any:
+        return self.options[name]
+
+    def _connect(self) -> None:
+        if self._auth is None:
+            self.httpapi.login(self.get_option("remote_user"), self.get_option("password"))
+
+
+@pytest.fixture
+def controller():
+    """Running mock vNetC."""
+    with MockController() as server:
+        yield server
+
+
+def test_login_keeps_the_token(controller: MockController) -> None:
+    """The token returned by /api/auth authenticates the later calls."""
+    connection = PersistentConnection(controller.base_url)
+    connection.httpapi.login("admin", "s3cret")
+    assert connection._auth == build_headers(controller.token)
+
+
+def test_login_failures_raise_authentication_failures(controller: MockController) -> None:
+    """No token, or no answer at all, fails the login."""
+    controller.token = ""
+    with pytest.raises(AnsibleAuthenticationFailure, match="HTTP 200"):
+        PersistentConnection(controller.base_url).httpapi.login("admin", "s3cret")
+
+    with pytest.raises(AnsibleAuthenticationFailure, match="failed"):
+        PersistentConnection("http://127.0.0.1:9").httpapi.login("admin", "s3cret")
+
+
+def test_send_request_logs_in_and_relays_calls(controller: MockController) -> None:
+    """The first call logs in; each returns the status, headers and body of the response."""
+    controller.store["config/pods"] = {"pod": {"p1": {"enable": True}}}
+    connection = PersistentConnection(controller.base_url)
+    response = connection.httpapi.send_request("GET", "/config/pods", timeout=[5, 10])
+    assert response["status"] == 200
+    assert response["body"] == '{"pod": {"p1": {"enable": true}}}'
+    assert connection.httpapi.send_request("PATCH", "/config/pods",
+                                           data={"pod": {"p2": {}}})["status"] == 200
+    assert set(controller.store["config/pods"]["pod"]) == {"p1", "p2"}
+    assert controller.counters["auth"] == 1
+    assert controller.counters["connections"] == 1
+
+
+def test_send_request_logs_in_again_once_on_401(controller: MockController) -> None:
+    """An expired token is replaced once; a token rejected again is reported."""
+    connection = PersistentConnection(controller.base_url)
+    connection._auth = build_headers("expired")
+    assert connection.httpapi.send_request("GET", "/config/pods")["status"] == 200
+    assert connection._auth == build_headers(controller.token)
+    assert controller.counters["auth"] == 1
+
+    # A login that does not help: the call is sent twice at most
+    connection._auth = build_headers("expired")
+    controller.token = "changed"
+    connection.httpapi.login = lambda username, password: None
+    sent = controller.counters["requests"]
+    assert connection.httpapi.send_request("GET", "/config/pods")["status"] == 401
+    assert controller.counters["requests"] == sent + 2
+
+
+def test_handle_httperror_logs_in_again_on_401(controller: MockController) -> None:
+    """HTTP 401 errors of the connection itself get a new token; others are left to the caller."""
+    connection = PersistentConnection(controller.base_url)
+    connection._auth = build_headers("expired")
+    assert connection.httpapi.handle_httperror(HTTPError(controller.base_url, 401, "", {}, None)) is True
+    assert connection._auth == build_headers(controller.token)
+
+    error = HTTPError(controller.base_url, 500, "", {}, None)
+    assert connection.httpapi.handle_httperror(error) is error
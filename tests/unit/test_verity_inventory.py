@@ -0,0 +1,68 @@
+"""Unit tests for the Verity inventory plugin."""
+
+from typing import Any, Dict, List
+
+from ansible.inventory.data import InventoryData  # type: ignore
+from ansible.parsing.dataloader import DataLoader  # type: ignore
+from ansible.plugins.loader import inventory_loader  # type: ignore
+from ansible.template import Templar  # type: ignore
+
+
+OBJECTS = {
+    "switchpoint": {
+        "spine1": {"pod": "", "super_pod": "sp1", "type": "spine", "rack": "r1", "badges": []},
+        "leaf1": {"pod": "pod1", "super_pod": "sp1", "type": "leaf", "rack": "r2",
+                  "badges": [{"index": 1, "badge": "prod", "badge_ref_type_": "badge"}]},
+    },
+    "device_controller": {"dc1": {"switchpoint": "leaf1", "switch_ip_and_mask": "10.0.0.11/24"}},
+}
+
+
+def parse(tmp_path, config: str, fetched: List[Dict[str, Any]]) -> InventoryData:
+    """Parse ``config`` with the plugin, which reads OBJECTS instead of the vNetC."""
+    path = tmp_path / "verity.yml"
+    path.write_text("plugin: be_networks.verity.verity\nbase_url: https://vnc\ntoken: t\n" + config)
+    plugin = inventory_loader.get("be_networks.verity.verity")
+    plugin.fetch = lambda: fetched.append(OBJECTS) or OBJECTS
+    loader = DataLoader()
+    plugin.templar = Templar(loader=loader)
+    inventory = InventoryData()
+    assert plugin.verify_file(str(path))
+    plugin.parse(inventory, loader, str(path), cache=True)
+    if getattr(plugin, "_cache", None):  # as InventoryManager does after parse
+        plugin.update_cache_if_changed()
+    return inventory
+
+
+def test_hosts_groups_and_variables(tmp_path) -> None:
+    """One host per switchpoint, grouped by attribute and badge, with the controller address."""
+    inventory = parse(tmp_path, "keyed_groups:\n  - key: verity_rack\n    prefix: rack\n", [])
+    assert sorted(host.name for host in inventory.groups["verity_switchpoints"].get_hosts()) == [
+        "leaf1", "spine1"]
+    members = {name: sorted(host.name for host in group.get_hosts())
+               for name, group in inventory.groups.items() if name.startswith(("verity_", "rack_"))}
+    assert members == {
+        "verity_switchpoints": ["leaf1", "spine1"],
+        "verity_pod_pod1": ["leaf1"],
+        "verity_super_pod_sp1": ["leaf1", "spine1"],
+        "verity_type_spine": ["spine1"],
+        "verity_type_leaf": ["leaf1"],
+        "verity_badge_prod": ["leaf1"],
+        "rack_r1": ["spine1"],
+        "rack_r2": ["leaf1"],
+    }
+    leaf = inventory.get_host("leaf1").get_vars()
+    assert leaf["ansible_host"] == "10.0.0.11" and leaf["verity_device_controller"] == "dc1"
+    assert leaf["verity_pod"] == "pod1"
+    assert "ansible_host" not in inventory.get_host("spine1").get_vars()
+
+
+def test_cache_is_read_before_the_vnetc(tmp_path) -> None:
+    """With the inventory cache, the vNetC is only read once per timeout."""
+    fetched: List[Dict[str, Any]] = []
+    config = (f"cache: true\ncache_plugin: ansible.builtin.jsonfile\ncache_connection: {tmp_path}/cache\n"
+              "group_by: [type]\n")
+    for _run in range(2):
+        inventory = parse(tmp_path, config, fetched)
+        assert "verity_type_leaf" in inventory.groups and "verity_pod_pod1" not in inventory.groups
+    assert len(fetched) == 1
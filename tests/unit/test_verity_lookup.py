@@ -0,0 +1,52 @@
+"""Unit tests for the verity_object lookup plugin."""
+
+from typing import Any, List
+
+import pytest
+from ansible.errors import AnsibleError  # type: ignore
+from ansible.plugins.loader import lookup_loader  # type: ignore
+
+from ansible_collections.be_networks.verity.plugins.lookup import verity_object
+
+
+SERVICES = {"service": {"svc1": {"vlan": 101, "vni": 10101}, "svc2": {"vlan": 102, "vni": 10102}}}
+
+
+@pytest.fixture
+def reads(monkeypatch) -> List[Any]:
+    """Record the names of every read, answered from SERVICES."""
+    calls: List[Any] = []
+
+    def read_resource(client: Any, resource: str, path: str, names: Any = None, snapshots: Any = None) -> dict:
+        calls.append(names)
+        return {"changed": False, "response": {"service": {
+            name: obj for name, obj in SERVICES["service"].items() if name in names}}}
+
+    monkeypatch.setattr(verity_object, "_OBJECTS", {})
+    monkeypatch.setattr(verity_object, "plugin_client", lambda name, params: None)
+    monkeypatch.setattr(verity_object, "read_resource", read_resource)
+    return calls
+
+
+def lookup(*terms: str, **options: Any) -> List[Any]:
+    plugin = lookup_loader.get("be_networks.verity.verity_object")
+    return plugin.run(list(terms), {}, base_url="https://vnc", token="t", **options)
+
+
+def test_names_are_read_together_and_memoized(reads) -> None:
+    """One read per lookup for all its names; objects read once are not read again."""
+    assert lookup("services", "svc2", "svc1", "svc2") == [
+        SERVICES["service"]["svc2"], SERVICES["service"]["svc1"], SERVICES["service"]["svc2"]]
+    assert lookup("services", "svc1", fields=["vlan"]) == [{"vlan": 101}]
+    assert reads == [["svc1", "svc2"]]
+
+
+def test_missing_names(reads) -> None:
+    """Missing names fail the lookup unless skipped, and are not read again."""
+    with pytest.raises(AnsibleError, match="no services object named gone"):
+        lookup("services", "gone")
+    assert lookup("services", "svc1", "gone", on_missing="skip") == [SERVICES["service"]["svc1"]]
+    assert reads == [["gone"], ["svc1"]]
+
+    with pytest.raises(AnsibleError, match="first term must be one of"):
+        lookup("nothing", "svc1")
@@ -0,0 +1,44 @@
+"""Unit tests for the Verity thread pool runner and rate limiter."""
+
+import threading
+import time
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_parallel import (
+    TokenBucket,
+    get_bucket,
+    run_parallel,
+)
+
+
+def test_results_keep_input_order_and_bounded_concurrency() -> None:
+    """Later items finishing first do not reorder results; at most max_workers run at once."""
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def work(item: int) -> int:
+        with lock:
+            running.append(item)
+            peak.append(len(running))
+        time.sleep(0.01 * (5 - item % 5))
+        with lock:
+            running.remove(item)
+        return item * 2
+
+    assert run_parallel(work, range(20), max_workers=4) == [item * 2 for item in range(20)]
+    assert max(peak) <= 4
+
+
+def test_token_bucket_limits_the_rate() -> None:
+    """After the burst, calls are spaced by 1/rate seconds."""
+    bucket = TokenBucket(rate=50, burst=2)
+    started = time.monotonic()
+    for _call in range(7):
+        bucket.acquire()
+    assert time.monotonic() - started >= 5 / 50 * 0.9
+
+
+def test_buckets_are_shared_per_controller() -> None:
+    """Every client of one controller gets the same bucket."""
+    assert get_bucket("https://vnc1", 10) is get_bucket("https://vnc1", 10)
+    assert get_bucket("https://vnc1", 10) is not get_bucket("https://vnc2", 10)
@@ -0,0 +1,150 @@
+"""Unit tests for the generic resource actions."""
+
+import io
+import json
+from typing import Any, Dict, Iterator, List, Tuple
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_client import VerityApiError
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_resource import apply_resource
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_snapshot import SnapshotCache
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_stream import iter_objects
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_transport import VerityResponse
+
+
+SWITCHPOINTS = {
+    "switchpoint": {
+        "leaf1": {"name": "leaf1", "pod": "pod1", "rack": "r1", "eths": [{"index": 1}]},
+        "leaf2": {"name": "leaf2", "pod": "pod2", "rack": "r2", "eths": []},
+    },
+}
+
+
+class ReadClient:
+    """Streams ``document`` for every GET, accepts every write and records both."""
+
+    def __init__(self, document: Dict[str, Any], status: int = 200) -> None:
+        self.document = document
+        self.status = status
+        self.params: List[Any] = []
+        self.writes: List[Tuple[str, Any, Any]] = []
+
+    def iter_objects(self, path: str, params: Any = None) -> Iterator[Tuple[str, Any, Any]]:
+        self.params.append(params)
+        if self.status != 200:
+            raise VerityApiError(f"GET {path} failed with HTTP {self.status}",
+                                 status=self.status, response=self.document)
+        return iter_objects(io.BytesIO(json.dumps(self.document).encode()))
+
+    def request(self, method: str, path: str, params: Any = None, data: Any = None) -> VerityResponse:
+        self.writes.append((method, params, data))
+        return VerityResponse(200, body="{}")
+
+
+def test_get_filters_names_and_projects_fields() -> None:
+    """Names are sent as <key>_name and enforced; only the asked fields are kept."""
+    client = ReadClient(SWITCHPOINTS)
+    result = apply_resource(client, "switchpoints", "/switchpoints", "get",
+                            params={"changeset_name": "cs"}, names=["leaf2"], fields=["pod", "missing"])
+    assert client.params == [{"changeset_name": "cs", "switchpoint_name": "leaf2"}]
+    assert result == {"changed": False, "response": {"switchpoint": {"leaf2": {"pod": "pod2"}}}}
+
+    result = apply_resource(ReadClient(SWITCHPOINTS), "switchpoints", "/switchpoints", "get")
+    assert result["response"] == SWITCHPOINTS
+
+
+def test_get_failure_keeps_status_and_response() -> None:
+    """An error answer of the vNetC fails the get with its status."""
+    result = apply_resource(ReadClient({"error": "boom"}, status=404), "tenants", "/tenants", "get",
+                            names=["a", "b"])
+    assert result["failed"] is True and result["status"] == 404
+    assert result["response"] == {"error": "boom"}
+
+
+def test_state_present_sends_only_what_differs() -> None:
+    """New objects are PUT, changed fields PATCHed, and a converged run sends nothing."""
+    client = ReadClient(SWITCHPOINTS)
+    desired = {"switchpoint": {"leaf1": {"pod": "pod1", "rack": "r9"}, "leaf3": {"pod": "pod1"}}}
+    result = apply_resource(client, "switchpoints", "/switchpoints", "create", data=desired,
+                            state="present")
+    assert result["changed"] is True
+    assert client.writes == [
+        ("PUT", {}, {"switchpoint": {"leaf3": {"pod": "pod1"}}}),
+        ("PATCH", {}, {"switchpoint": {"leaf1": {"rack": "r9"}}}),
+    ]
+
+    client = ReadClient(SWITCHPOINTS)
+    result = apply_resource(client, "switchpoints", "/switchpoints", "create", state="present",
+                            data={"switchpoint": {"leaf2": {"pod": "pod2", "eths": []}}})
+    assert result == {"changed": False, "response": {}} and client.writes == []
+
+    client = ReadClient(SWITCHPOINTS)
+    result = apply_resource(client, "switchpoints", "/switchpoints", "create", state="present",
+                            data={"switchpoint": {"leaf1": {"eths": []}}})
+    assert result["changed"] is False and client.writes == []
+    assert result["warnings"] == [
+        "Empty lists do not remove existing entries; left as they are in switchpoint leaf1.eths"]
+
+
+def test_state_absent_only_deletes_existing_objects() -> None:
+    """Missing objects are not deleted; the others go in one DELETE."""
+    client = ReadClient(SWITCHPOINTS)
+    result = apply_resource(client, "switchpoints", "/switchpoints", "delete", state="absent",
+                            names=["leaf1", "gone", "leaf2"])
+    assert result["changed"] is True
+    assert client.writes == [("DELETE", {"switchpoint_name": ["leaf1", "leaf2"]}, None)]
+
+    client = ReadClient(SWITCHPOINTS)
+    result = apply_resource(client, "switchpoints", "/switchpoints", "delete", state="absent",
+                            params={"switchpoint_name": "gone"})
+    assert result["changed"] is False and client.writes == []
+
+
+def test_acls_are_compared_whatever_their_ip_version() -> None:
+    """ipv4_filter and ipv6_filter objects read back count as the ip_filter objects written."""
+    acls = {"ipv4_filter": {"f1": {"enable": True, "protocol": "tcp"}}, "ipv6_filter": {"f6": {"enable": True}}}
+    params = {"ip_version": "4"}
+    client = ReadClient(acls)
+    result = apply_resource(client, "acls", "/acls", "create", state="present", params=params,
+                            data={"ip_filter": {"f1": {"enable": True, "protocol": "tcp"}}})
+    assert result == {"changed": False, "response": {}} and client.writes == []
+
+    client = ReadClient(acls)
+    apply_resource(client, "acls", "/acls", "create", state="present", params=params,
+                   data={"ip_filter": {"f1": {"protocol": "udp"}}})
+    assert client.writes == [("PATCH", params, {"ip_filter": {"f1": {"protocol": "udp"}}})]
+
+    client = ReadClient(acls)
+    result = apply_resource(client, "acls", "/acls", "delete", state="absent", params=params, names=["f1", "f9"])
+    assert result["changed"] is True
+    assert client.writes == [("DELETE", {"ip_version": "4", "ip_filter_name": "f1"}, None)]
+
+
+def test_check_mode_predicts_without_writing() -> None:
+    """Check mode sends no write but reports changed and a diff per object."""
+    client = ReadClient(SWITCHPOINTS)
+    result = apply_resource(client, "switchpoints", "/switchpoints", "update", check_mode=True, diff=True,
+                            data={"switchpoint": {"leaf1": {"eths": [{"index": 1, "enable": True}]},
+                                                  "leaf2": {"pod": "pod2"}}})
+    assert client.writes == [] and result["changed"] is True
+    assert result["diff"] == [{
+        "before_header": "switchpoint leaf1", "after_header": "switchpoint leaf1",
+        "before": SWITCHPOINTS["switchpoint"]["leaf1"],
+        "after": dict(SWITCHPOINTS["switchpoint"]["leaf1"], eths=[{"index": 1, "enable": True}]),
+    }]
+
+    result = apply_resource(client, "switchpoints", "/switchpoints", "delete", check_mode=True,
+                            params={"switchpoint_name": "leaf2"})
+    assert client.writes == [] and result == {"changed": True, "response": {}}
+
+
+def test_get_reads_through_the_snapshot(tmp_path) -> None:
+    """A get stores the whole resource once; later gets, whatever they select, read it."""
+    snapshots = SnapshotCache(str(tmp_path))
+    client = ReadClient(SWITCHPOINTS)
+    result = apply_resource(client, "switchpoints", "/switchpoints", "get", snapshots=snapshots,
+                            params={"switchpoint_name": "leaf1"}, fields=["pod"])
+    assert result["response"] == {"switchpoint": {"leaf1": {"pod": "pod1"}}}
+    result = apply_resource(client, "switchpoints", "/switchpoints", "get", snapshots=snapshots,
+                            names=["leaf2"])
+    assert result["response"] == {"switchpoint": {"leaf2": SWITCHPOINTS["switchpoint"]["leaf2"]}}
+    assert client.params == [{}]
@@ -0,0 +1,145 @@
+"""Unit tests for the Verity API retry policy."""
+
+import time
+from email.utils import formatdate
+from typing import Any, List
+
+import pytest
+
+from ansible_collections.be_networks.verity.plugins.module_utils import verity_client
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_client import (
+    VerityApiError,
+    VerityClient,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_retry import (
+    DEFAULT_MAX_RETRY_AFTER,
+    RetryPolicy,
+    parse_retry_after,
+)
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_transport import (
+    SessionTransport,
+    VerityResponse,
+)
+
+
+def test_backoff_grows_and_stops_at_max_attempts() -> None:
+    """Delays stay within the exponential ceiling until attempts run out."""
+    policy = RetryPolicy(max_attempts=4, backoff=1.0, max_backoff=3.0)
+    for attempt, ceiling in ((1, 1.0), (2, 2.0), (3, 3.0)):
+        delay = policy.next_delay(attempt)
+        assert delay is not None
+        assert 0 <= delay <= ceiling
+    assert policy.next_delay(4) is None
+
+
+def test_retry_after_overrides_backoff() -> None:
+    """A server supplied delay is used as is."""
+    policy = RetryPolicy(max_attempts=3, backoff=0.1)
+    assert policy.next_delay(1, retry_after=7.0) == 7.0
+
+
+def test_deadline_bounds_the_next_delay() -> None:
+    """No retry is scheduled past the deadline."""
+    policy = RetryPolicy(max_attempts=10, deadline=5.0)
+    assert policy.next_delay(1, retry_after=10.0) is None
+    assert policy.next_delay(1, retry_after=1.0) == 1.0
+
+
+def test_parse_retry_after() -> None:
+    """Retry-After accepts seconds and HTTP dates and ignores garbage."""
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert 0 <= parse_retry_after(formatdate(usegmt=True)) <= 1
+
+
+def test_retry_after_is_capped() -> None:
+    """A Retry-After of an hour is not waited for in full, deadline or not."""
+    assert RetryPolicy(max_attempts=3).next_delay(1, retry_after=3600.0) == DEFAULT_MAX_RETRY_AFTER
+    assert RetryPolicy(max_attempts=3, max_retry_after=5.0).next_delay(1, retry_after=7.0) == 5.0
+
+
+class ClientModule:
+    """Just enough of AnsibleModule for :class:`VerityClient`."""
+
+    def __init__(self, **params: Any) -> None:
+        self.params = dict(base_url="https://vnc", token="t0", retry_backoff=0.0, **params)
+
+    def fail_json(self, msg: str, **kwargs: Any) -> None:
+        raise AssertionError(msg)
+
+
+class ScriptedSession:
+    """Pooled session answering with the next of a list of (status, headers)."""
+
+    def __init__(self, *answers: tuple) -> None:
+        self.answers = list(answers)
+        self.cookies: List[str] = []
+        self.timeouts: List[Any] = []
+
+    def request(self, method, url, headers=None, data=None, params=None, timeout=None, stream=False):
+        """Record the token and timeouts of the call and return the next answer."""
+        self.cookies.append(headers["Cookie"])
+        self.timeouts.append(timeout)
+        status, response_headers = self.answers.pop(0)
+        return VerityResponse(status, response_headers, "{}")
+
+
+def scripted_client(session: ScriptedSession, **params: Any) -> VerityClient:
+    client = VerityClient(ClientModule(**params))
+    client.transport = SessionTransport(session, "https://vnc", client.transport.headers)
+    return client
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    """Delays the client sleeps, without sleeping."""
+    delays: List[float] = []
+    monkeypatch.setattr(verity_client.time, "sleep", delays.append)
+    return delays
+
+
+def test_client_retries_throttling_and_unavailable_statuses(sleeps: List[float]) -> None:
+    """429, 502, 503 and 504 are sent again, honouring a capped Retry-After, until attempts run out."""
+    session = ScriptedSession((429, {"Retry-After": "3600"}), (502, {}), (504, {}), (200, {}))
+    assert scripted_client(session, max_attempts=4).request("GET", "/tenants").status == 200
+    assert len(session.cookies) == 4
+    assert sleeps[0] == DEFAULT_MAX_RETRY_AFTER
+
+    session = ScriptedSession((503, {}), (503, {}), (200, {}))
+    assert scripted_client(session, max_attempts=2).request("GET", "/tenants").status == 503
+    assert len(session.answers) == 1
+
+
+def test_client_authenticates_again_once_on_401(monkeypatch: pytest.MonkeyPatch, sleeps: List[float]) -> None:
+    """A rejected token is discarded and replaced once; a second 401 is returned."""
+    discarded: List[str] = []
+    monkeypatch.setattr(verity_client, "get_token", lambda *args, **kwargs: "t1")
+    monkeypatch.setattr(verity_client, "discard_token", lambda *args: discarded.append(args[-1]))
+    session = ScriptedSession((401, {}), (200, {}))
+    client = scripted_client(session, username="admin", password="s3cret")
+    assert client.request("GET", "/tenants").status == 200
+    assert session.cookies == ["ivn_api=t0", "ivn_api=t1"]
+    assert discarded == ["t0"]
+
+    session = ScriptedSession((401, {}), (401, {}))
+    assert scripted_client(session, username="admin", password="s3cret").request("GET", "/tenants").status == 401
+    assert not session.answers
+
+    # Without credentials there is nothing to authenticate with
+    session = ScriptedSession((401, {}))
+    assert scripted_client(session).request("GET", "/tenants").status == 401
+
+
+def test_client_timeouts_are_shortened_to_the_deadline() -> None:
+    """Calls never wait past the deadline, and none is sent once it passed."""
+    session = ScriptedSession((200, {}))
+    client = scripted_client(session, deadline=5.0, connect_timeout=10.0, read_timeout=60.0)
+    client.request("GET", "/tenants")
+    connect, read = session.timeouts[0]
+    assert 0 < connect <= 5.0 and 0 < read <= 5.0
+
+    client.policy.started = time.monotonic() - 6.0
+    with pytest.raises(VerityApiError, match="Deadline"):
+        client.request("GET", "/tenants")
+    assert not session.answers and len(session.timeouts) == 1
@@ -0,0 +1,85 @@
+"""Unit tests for the dependency-ordered batch scheduler."""
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_scheduler import (
+    iter_refs,
+    plan_waves,
+    type_levels,
+)
+
+
+def test_iter_refs_reads_fields_and_list_entries() -> None:
+    """References are found on the object and inside index-keyed lists; empty ones are ignored."""
+    switchpoint = {
+        "pod": "pod1",
+        "pod_ref_type_": "pod",
+        "connected_bundle": "",
+        "connected_bundle_ref_type_": "endpoint_bundle",
+        "badges": [{"index": 1, "badge": "b1", "badge_ref_type_": "badge"}],
+    }
+    assert sorted(iter_refs(switchpoint)) == [("badges", "b1"), ("pods", "pod1")]
+    assert list(iter_refs({"filter": "f1", "filter_ref_type_": "ipv4_filter"})) == [("acls", "f1")]
+
+
+def test_plan_waves_orders_writes_by_reference_and_deletes_in_reverse() -> None:
+    """Referenced objects are fully written first; deletes wait for deletes, and earlier writes, of referencing types."""
+    operations = [
+        {"resource": "services", "data": {"service": {"s1": {"tenant": "t1", "tenant_ref_type_": "tenant"}}}},
+        {"resource": "services", "data": {"service": {"s2": {"tenant": "other", "tenant_ref_type_": "tenant"}}}},
+        {"resource": "tenants", "data": {"tenant": {"t1": {}}}},
+        {"resource": "tenants", "action": "delete", "params": {"tenant_name": "t9"}},
+        {"resource": "services", "action": "delete", "params": {"service_name": "s9"}},
+        {"resource": "tenants", "action": "update", "data": {"tenant": {"t1": {"enable": True}}}},
+    ]
+    waves, cyclic = plan_waves(operations)
+    assert waves == [[1, 2, 4], [5], [0], [3]]
+    assert cyclic == []
+
+
+def test_plan_waves_deletes_after_writes_that_drop_references() -> None:
+    """A tenant is deleted after an earlier service update that may move off it, not before."""
+    operations = [
+        {"resource": "services", "action": "update", "data": {"service": {"S1": {
+            "tenant": "T9", "tenant_ref_type_": "tenant"}}}},
+        {"resource": "tenants", "action": "delete", "params": {"tenant_name": "T1"}},
+        {"resource": "pods", "data": {"pod": {"p1": {}}}},
+    ]
+    assert plan_waves(operations) == ([[0, 2], [1]], [])
+    # Later writes, and writes of resources that cannot reference tenants, do not hold it back
+    assert plan_waves(operations[:0:-1] + operations[:1]) == ([[0, 1, 2]], [])
+
+
+def test_plan_waves_keeps_the_order_of_operations_on_one_object() -> None:
+    """A tenant deleted then recreated is recreated last, and objects referencing it follow."""
+    operations = [
+        {"resource": "tenants", "action": "delete", "params": {"tenant_name": "t1"}},
+        {"resource": "tenants", "data": {"tenant": {"t1": {}}}},
+        {"resource": "services", "data": {"service": {"s1": {"tenant": "t1", "tenant_ref_type_": "tenant"}}}},
+        {"resource": "tenants", "action": "get"},
+        {"resource": "tenants", "data": {"tenant": {"t2": {}}}, "state": "absent"},
+    ]
+    waves, cyclic = plan_waves(operations)
+    assert waves == [[0], [1], [2, 3], [4]]
+    assert cyclic == []
+    assert plan_waves(operations[1::-1]) == ([[0], [1]], [])
+
+
+def test_plan_waves_breaks_reference_cycles() -> None:
+    """A tenant and route map referencing each other still get scheduled, one at a time."""
+    operations = [
+        {"resource": "tenants", "data": {"tenant": {"t1": {
+            "import_route_map": "rm1", "import_route_map_ref_type_": "route_map"}}}},
+        {"resource": "routemaps", "data": {"route_map": {"rm1": {"route_map_clauses": [
+            {"index": 1, "route_map_clause": "c1", "route_map_clause_ref_type_": "route_map_clause"}]}}}},
+        {"resource": "routemapclauses", "data": {"route_map_clause": {"c1": {
+            "tenant": "t1", "tenant_ref_type_": "tenant"}}}},
+    ]
+    waves, cyclic = plan_waves(operations)
+    assert cyclic == [0]
+    assert waves == [[0], [2], [1]]
+
+
+def test_type_levels_respect_static_references() -> None:
+    """Referenced resources sit on lower levels, so their deletes come later."""
+    levels = type_levels()
+    assert levels["pods"] < levels["switchpoints"] < levels["devicecontrollers"]
+    assert levels["tenants"] < levels["services"] < levels["ethportprofiles"]
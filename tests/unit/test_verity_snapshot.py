@@ -0,0 +1,107 @@
+"""Unit tests for the Verity resource snapshots."""
+
+import os
+import threading
+import time
+from typing import Iterator, List, Tuple
+
+import pytest
+from ansible.plugins.loader import cache_loader  # type: ignore
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_snapshot import SnapshotCache
+
+
+def objects(count: int) -> Iterator[Tuple[str, str, dict]]:
+    """Yield ``count`` switchpoint triples, as ``VerityClient.iter_objects`` does."""
+    for index in range(count):
+        yield "switchpoint", f"leaf{index}", {"pod": f"pod{index % 3}", "eths": [{"index": 1}]}
+
+
+def test_snapshot_round_trip_and_expiry(tmp_path) -> None:
+    """Snapshots read back only the asked objects, until they expire or are deleted."""
+    cache = SnapshotCache(str(tmp_path), ttl=60)
+    key = SnapshotCache.key("https://vnc/", "switchpoints", {"changeset_name": "cs"})
+    assert cache.set(key, objects(100), names=["leaf7"]) == {
+        "switchpoint": {"leaf7": {"pod": "pod1", "eths": [{"index": 1}]}}}
+    assert cache.get(key, ["leaf2", "missing"]) == {
+        "switchpoint": {"leaf2": {"pod": "pod2", "eths": [{"index": 1}]}}}
+    assert len(cache.get(key)["switchpoint"]) == 100
+    assert cache.get(SnapshotCache.key("https://vnc", "switchpoints")) is None
+
+    cache.delete(key)
+    assert cache.get(key) is None
+    cache.ttl = -1
+    cache.set(key, objects(1))
+    assert cache.get(key) is None
+
+
+def test_get_or_create_reads_the_resource_once(tmp_path) -> None:
+    """Concurrent callers share the one snapshot the first of them stores."""
+    calls: List[int] = []
+
+    def factory() -> Iterator[Tuple[str, str, dict]]:
+        calls.append(1)
+        time.sleep(0.1)
+        return objects(10)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(
+            SnapshotCache(str(tmp_path)).get_or_create("k", factory, names=["leaf3"])))
+        for _thread in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert all(result == {"switchpoint": {"leaf3": {"pod": "pod0", "eths": [{"index": 1}]}}}
+               for result in results)
+
+
+def test_memory_snapshot_follows_the_file(tmp_path) -> None:
+    """A snapshot kept in memory is reloaded once its file is replaced or deleted."""
+    cache = SnapshotCache(str(tmp_path), memory=True)
+    cache.set("k", objects(3))
+    assert cache.get("k", ["leaf0"])["switchpoint"]["leaf0"]["pod"] == "pod0"
+    SnapshotCache(str(tmp_path)).set("k", [("switchpoint", "leaf0", {"pod": "new"})])
+    assert cache.get("k", ["leaf0"]) == {"switchpoint": {"leaf0": {"pod": "new"}}}
+    SnapshotCache(str(tmp_path)).delete("k")
+    assert cache.get("k") is None
+
+
+def test_least_recently_used_snapshots_are_evicted(tmp_path) -> None:
+    """Past max_size, storing a snapshot evicts those not read for the longest time."""
+    cache = SnapshotCache(str(tmp_path), max_size=1)
+    payload = [("switchpoint", "leaf0", {"notes": os.urandom(300 * 1024).hex()})]
+    for key in ("a", "b"):
+        cache.set(key, payload)
+        time.sleep(0.01)
+    assert cache.get("a") is not None
+    cache.set("c", payload)
+    assert sorted(cache.keys()) == ["a", "c"]
+
+    cache.max_size = 0
+    cache.set("d", payload)
+    assert sorted(cache.keys()) == ["a", "c", "d"]
+
+
+def test_objects_cache_plugin_round_trip(tmp_path, monkeypatch) -> None:
+    """The verity_objects cache plugin stores inventory documents, apart from the module snapshots."""
+    monkeypatch.setenv("VERITY_CACHE_DIR", str(tmp_path))
+    snapshots = SnapshotCache(str(tmp_path))
+    snapshot_key = SnapshotCache.key("https://vnc", "switchpoints")
+    snapshots.set(snapshot_key, [("switchpoint", "leaf1", {})])
+
+    plugin = cache_loader.get("be_networks.verity.verity_objects")
+    document = {"switchpoint": {"leaf1": {"pod": "pod1"}}, "device_controller": {}}
+    plugin.set("inventory", document)
+    assert plugin.contains("inventory") and plugin.get("inventory") == document
+    assert plugin.keys() == ["inventory"]
+    plugin.delete("inventory")
+    with pytest.raises(KeyError):
+        plugin.get("inventory")
+
+    plugin.set("inventory", document)
+    plugin.flush()
+    assert plugin.keys() == [] and snapshots.keys() == [snapshot_key]
@@ -0,0 +1,70 @@
+"""Unit tests for the streaming Verity JSON decoder."""
+
+import io
+import json
+
+import pytest
+
+from ansible_collections.be_networks.verity.plugins.module_utils import verity_stream
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_stream import iter_objects
+
+DOCUMENT = {
+    "switchpoint": {
+        "leaf 1": {"enable": True, "eths": [{"index": 1, "port_name": "{\"tricky\": ["}]},
+        "leaf-2": {"enable": False, "asn": 65000123456, "weight": 1.5e3},
+    },
+    "empty": {},
+    "count": 2,
+    "tenant": {"café": {"description": "ünïcode ☃", "routes": None}},
+}
+EXPECTED = [
+    ("switchpoint", "leaf 1", DOCUMENT["switchpoint"]["leaf 1"]),
+    ("switchpoint", "leaf-2", DOCUMENT["switchpoint"]["leaf-2"]),
+    ("count", None, 2),
+    ("tenant", "café", DOCUMENT["tenant"]["café"]),
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64 * 1024])
+def test_fallback_matches_json_for_any_chunking(monkeypatch: pytest.MonkeyPatch, chunk_size: int) -> None:
+    """Objects come out whole however the bytes are split, multibyte characters included."""
+    monkeypatch.setattr(verity_stream, "HAS_IJSON", False)
+    body = json.dumps(DOCUMENT, indent=2, ensure_ascii=False).encode("utf-8")
+    assert list(iter_objects(io.BytesIO(body), chunk_size=chunk_size)) == EXPECTED
+
+
+def test_text_streams_and_non_object_documents(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Text input is accepted and bare values are yielded as such."""
+    monkeypatch.setattr(verity_stream, "HAS_IJSON", False)
+    assert list(iter_objects(io.StringIO(json.dumps(DOCUMENT)), chunk_size=3)) == EXPECTED
+    assert list(iter_objects(io.StringIO(" {} "))) == []
+    assert list(iter_objects(io.StringIO(""))) == []
+    assert list(iter_objects(io.StringIO("[1, 2]"))) == [(None, None, [1, 2])]
+
+
+def test_truncated_document_raises(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A body cut short fails instead of silently losing objects."""
+    monkeypatch.setattr(verity_stream, "HAS_IJSON", False)
+    with pytest.raises(ValueError):
+        list(iter_objects(io.BytesIO(b'{"pod": {"p1": {"enable": true}, "p2": {"ena'), chunk_size=4))
+
+
+@pytest.mark.skipif(not verity_stream.HAS_IJSON, reason="ijson is not installed")
+def test_ijson_matches_fallback() -> None:
+    """Both decoders yield the same triples."""
+    body = json.dumps(DOCUMENT).encode("utf-8")
+    assert list(iter_objects(io.BytesIO(body))) == EXPECTED
+
+
+@pytest.mark.parametrize("use_ijson", [False, True])
+def test_value_after_a_collection_has_no_name(monkeypatch: pytest.MonkeyPatch, use_ijson: bool) -> None:
+    """A top-level value following a collection is not given the name of its last object."""
+    if use_ijson:
+        pytest.importorskip("ijson")
+    monkeypatch.setattr(verity_stream, "HAS_IJSON", use_ijson)
+    body = b'{"switchpoint":{"leaf1":{"enable":true}},"list":[1,2],"count":3}'
+    assert list(iter_objects(io.BytesIO(body))) == [
+        ("switchpoint", "leaf1", {"enable": True}),
+        ("list", None, [1, 2]),
+        ("count", None, 3),
+    ]
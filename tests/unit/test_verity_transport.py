@@ -0,0 +1,145 @@
+"""Unit tests for the Verity HTTP transports."""
+
+import json
+
+import pytest
+
+from ansible_collections.be_networks.verity.plugins.module_utils import verity_transport
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_transport import (
+    GZIP_MIN_SIZE,
+    BuiltinSession,
+    VerityResponse,
+    send_json,
+)
+from ansible_collections.be_networks.verity.tests.benchmarks.mock_controller import MockController
+
+URL = "https://vnetc.example/api/config/tenants"
+LARGE = {"tenant": {"t1": {"description": "x" * GZIP_MIN_SIZE}}}
+
+
+class ScriptedSession:
+    """Session answering each request with the next of a list of (status, body)."""
+
+    def __init__(self, *answers: tuple) -> None:
+        self.answers = list(answers)
+        self.encodings: list = []
+
+    def request(self, method, url, headers=None, data=None, params=None, timeout=None, stream=False):
+        """Record the Content-Encoding of the request and return the next answer."""
+        self.encodings.append(headers.get("Content-Encoding"))
+        status, body = self.answers.pop(0)
+        if stream:
+            return VerityResponse(status, {}, None, VerityResponse(status, {}, body).stream())
+        return VerityResponse(status, {}, body)
+
+
+@pytest.fixture(autouse=True)
+def forget_rejections(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start each test with no controller known to reject gzip."""
+    monkeypatch.setattr(verity_transport, "_GZIP_REJECTED", set())
+
+
+def test_415_is_resent_uncompressed() -> None:
+    """A 415 answer gets an uncompressed resend, and later bodies skip gzip."""
+    session = ScriptedSession((415, ""), (200, "{}"), (200, "{}"))
+    assert send_json(session, "PATCH", URL, {}, data=LARGE).status == 200
+    assert send_json(session, "PATCH", URL, {}, data=LARGE).status == 200
+    assert session.encodings == ["gzip", None, None]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_400_only_falls_back_when_it_names_the_encoding(stream: bool) -> None:
+    """Invalid data errors come back as they are; encoding errors get a resend."""
+    session = ScriptedSession((400, '{"error": "tenant t1 is invalid"}'))
+    response = send_json(session, "PATCH", URL, {}, data=LARGE, stream=stream)
+    assert response.status == 400
+    assert response.data() == {"error": "tenant t1 is invalid"}
+    assert session.encodings == ["gzip"]
+
+    session = ScriptedSession((400, "Unsupported Content-Encoding: gzip"), (200, "{}"))
+    assert send_json(session, "PATCH", URL, {}, data=LARGE, stream=stream).status == 200
+    assert session.encodings == ["gzip", None]
+
+
+def test_failed_resend_keeps_gzip() -> None:
+    """A resend that fails too does not turn gzip off for the controller."""
+    session = ScriptedSession((415, ""), (503, ""), (200, "{}"))
+    assert send_json(session, "PATCH", URL, {}, data=LARGE).status == 503
+    assert send_json(session, "PATCH", URL, {}, data=LARGE).status == 200
+    assert session.encodings == ["gzip", None, "gzip"]
+
+
+@pytest.fixture
+def controller():
+    """Running mock vNetC, accepting gzip request bodies."""
+    with MockController() as server:
+        yield server
+
+
+def auth(session: BuiltinSession, controller: MockController) -> VerityResponse:
+    """Send an authentication call, which the mock answers without a token."""
+    return session.request("POST", f"{controller.base_url}/api/auth", data=b"{}",
+                           headers={"Content-Type": "application/json"})
+
+
+def test_builtin_session_reuses_connections(controller: MockController) -> None:
+    """Calls made one after the other share one keep-alive connection."""
+    session = BuiltinSession(controller.base_url)
+    for _ in range(3):
+        assert auth(session, controller).data() == {"token": controller.token}
+    assert controller.counters["connections"] == 1
+    assert len(session._idle) == 1
+
+
+def test_builtin_session_replaces_connections_closed_while_idle(
+    controller: MockController, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Idle connections closed by the vNetC are replaced, whether seen before reuse or not."""
+    session = BuiltinSession(controller.base_url)
+    auth(session, controller)
+    controller.drop_connections()
+    assert auth(session, controller).status == 200
+    assert controller.counters["connections"] == 2
+
+    # Unseen by the readability check: the request fails on it and is resent
+    controller.drop_connections()
+    monkeypatch.setattr(verity_transport.select, "select", lambda *args: ([], [], []))
+    assert auth(session, controller).status == 200
+    assert controller.counters["connections"] == 3
+
+
+def test_builtin_session_inflates_gzip_responses(controller: MockController) -> None:
+    """Gzip-encoded responses are decoded, read whole or in small pieces."""
+    controller.store["config/tenants"] = {"tenant": {f"t{n}": {"enable": True} for n in range(200)}}
+    session = BuiltinSession(controller.base_url)
+    headers = {"Cookie": f"ivn_api={controller.token}", "Accept-Encoding": "gzip"}
+    url = f"{controller.base_url}/api/config/tenants"
+    whole = session.request("GET", url, headers=headers)
+    assert whole.header("content-encoding") == "gzip"
+    assert json.loads(whole.body) == controller.store["config/tenants"]
+    assert controller.counters["bytes_out"] < len(whole.body)
+
+    streamed = session.request("GET", url, headers=headers, stream=True)
+    chunks = []
+    while True:
+        chunk = streamed.stream().read(7)
+        if not chunk:
+            break
+        assert len(chunk) <= 7
+        chunks.append(chunk)
+    streamed.close()
+    assert b"".join(chunks).decode() == whole.body
+    assert controller.counters["connections"] == 1
+
+
+def test_builtin_session_resends_bodies_rejected_with_415() -> None:
+    """A vNetC refusing gzip bodies gets the call again uncompressed, on the same connection."""
+    with MockController(gzip_requests=False) as controller:
+        session = BuiltinSession(controller.base_url)
+        headers = {"Cookie": f"ivn_api={controller.token}"}
+        url = f"{controller.base_url}/api/config/tenants"
+        assert send_json(session, "PATCH", url, headers, data=LARGE).status == 200
+        assert controller.store["config/tenants"] == LARGE
+        assert controller.counters["requests"] == 2
+        assert controller.counters["connections"] == 1
+        assert controller.base_url in verity_transport._GZIP_REJECTED
@@ -0,0 +1,80 @@
+"""Unit tests for the client-side validation of resource data."""
+
+import importlib.util
+import os
+
+import pytest
+
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_resource import apply_resource
+from ansible_collections.be_networks.verity.plugins.module_utils.verity_validate import validate_data
+
+from .test_verity_resource import SWITCHPOINTS, ReadClient
+
+
+TOOLS = os.path.join(os.path.dirname(__file__), "..", "..", "tools")
+
+
+def test_generated_schemas_are_up_to_date() -> None:
+    """verity_schema.py matches the DOCUMENTATION of the modules."""
+    generator = os.path.join(TOOLS, "generate_schemas.py")
+    if not os.path.exists(generator):
+        pytest.skip("tools/ is not shipped with the built collection")
+    spec = importlib.util.spec_from_file_location("generate_schemas", generator)
+    generate_schemas = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generate_schemas)
+    with open(generate_schemas.OUTPUT, encoding="utf-8") as fp:
+        assert fp.read() == generate_schemas.render(), "run tools/generate_schemas.py"
+
+
+def test_values_are_converted_and_checked() -> None:
+    """Values get their documented type; unknown fields, bad types and choices are reported."""
+    data, errors = validate_data("switchpoints", {"switchpoint": {
+        "leaf1": {"bgp_as_number": "65001", "locked": "yes", "eths": [{"index": "2", "breakout": "1x100G"}]},
+    }})
+    assert errors == []
+    assert data == {"switchpoint": {
+        "leaf1": {"bgp_as_number": 65001, "locked": True, "eths": [{"index": 2, "breakout": "1x100G"}]},
+    }}
+
+    _data, errors = validate_data("switchpoints", {
+        "switchpoint": {"leaf1": {"colour": "red", "bgp_as_number": True, "type": "router",
+                                  "eths": [{"index": 1}, {"index": "x"}], "badges": {}}},
+        "switch": {},
+    })
+    assert errors == [
+        "switchpoint.leaf1.colour: unknown field",
+        "switchpoint.leaf1.bgp_as_number: True is not a valid int",
+        "switchpoint.leaf1.type: 'router' is not one of '', 'packet_broker', 'management', 'leaf', "
+        "'spine', 'packet_broker_tor', 'superspine', 'enterprise'",
+        "switchpoint.leaf1.eths[1].index: 'x' is not a valid int",
+        "switchpoint.leaf1.badges: expected a list, got dict",
+        "switch: unknown object type, expected switchpoint",
+    ]
+
+
+def test_defaults_are_filled_only_on_request() -> None:
+    """Missing fields get their documented default with fill, nested ones included."""
+    data = {"switchpoint": {"leaf1": {"pod": "pod1", "object_properties": {}}}}
+    assert validate_data("switchpoints", data)[0] == data
+    leaf = validate_data("switchpoints", data, fill=True)[0]["switchpoint"]["leaf1"]
+    assert leaf["pod"] == "pod1" and leaf["type"] == "leaf" and leaf["locked"] is False
+    assert "bgp_as_number" not in leaf
+    assert leaf["object_properties"]["user_notes"] == ""
+
+
+def test_invalid_data_is_never_sent() -> None:
+    """apply_resource fails before any call; creates get the defaults, updates do not."""
+    client = ReadClient(SWITCHPOINTS)
+    result = apply_resource(client, "switchpoints", "/switchpoints", "update", validate=True,
+                            data={"switchpoint": {"leaf1": {"rack": 7, "typo": 1}}})
+    assert result["failed"] is True and result["errors"] == ["switchpoint.leaf1.typo: unknown field"]
+    assert client.writes == []
+
+    apply_resource(client, "switchpoints", "/switchpoints", "update", validate=True,
+                   data={"switchpoint": {"leaf1": {"rack": 7}}})
+    apply_resource(client, "switchpoints", "/switchpoints", "create", state="present", validate=True,
+                   data={"switchpoint": {"leaf1": {"rack": "r1"}, "leaf3": {"pod": "pod1"}}})
+    assert client.writes[0] == ("PATCH", None, {"switchpoint": {"leaf1": {"rack": "7"}}})
+    assert client.writes[1][0] == "PUT" and list(client.writes[1][2]["switchpoint"]) == ["leaf3"]
+    assert client.writes[1][2]["switchpoint"]["leaf3"]["type"] == "leaf"
+    assert len(client.writes) == 2
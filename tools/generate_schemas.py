@@ -0,0 +1,153 @@
+"""Generate plugins/module_utils/verity_schema.py from the resource module docs.
+
+The ``data`` option of every resource module documents its objects as
+``data.<object type>.name.<fields>`` suboption trees. This script reads the
+DOCUMENTATION of each module, without importing it, and writes the field
+trees, reduced to what validation needs, as the ``SCHEMAS`` dict that
+``verity_validate`` compiles into validators.
+
+Usage: python tools/generate_schemas.py [--check]
+"""
+
+import argparse
+import ast
+import json
+import os
+import sys
+from typing import Any, Dict
+
+import yaml
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = os.path.join(ROOT, "plugins", "modules")
+OUTPUT = os.path.join(ROOT, "plugins", "module_utils", "verity_schema.py")
+KEPT = ("type", "elements", "choices", "default")
+
+HEADER = """\
+# -*- coding: utf-8 -*-
+# Generated by tools/generate_schemas.py from the DOCUMENTATION of the
+# resource modules; run it again after changing them, do not edit.
+
+# Resource -> object type -> field -> spec (type, elements, choices,
+# default and the options of dict and list-of-dict fields)
+SCHEMAS = """
+
+
+def documentation(path: str) -> Any:
+    """Return the parsed DOCUMENTATION of the module at ``path``, or None.
+
+    Args:
+        path: Module file.
+
+    Returns:
+        Any: The documentation, None if the module has none.
+    """
+    with open(path, encoding="utf-8") as fp:
+        tree = ast.parse(fp.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+                isinstance(target, ast.Name) and target.id == "DOCUMENTATION" for target in node.targets):
+            return yaml.safe_load(node.value.value)
+    return None
+
+
+def reduce_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep the validation keys of each option, recursively.
+
+    Args:
+        options: Documented suboptions.
+
+    Returns:
+        Dict[str, Any]: Field name to spec.
+    """
+    fields = {}
+    for name, option in sorted(options.items()):
+        spec = {key: option[key] for key in KEPT if option.get(key) is not None}
+        if "suboptions" in option:
+            spec["options"] = reduce_options(option["suboptions"])
+        fields[name] = spec
+    return fields
+
+
+def schemas() -> Dict[str, Any]:
+    """Build the schemas of every resource module.
+
+    Returns:
+        Dict[str, Any]: Resource to object type to fields.
+    """
+    result = {}
+    for filename in sorted(os.listdir(MODULES)):
+        doc = documentation(os.path.join(MODULES, filename)) if filename.endswith(".py") else None
+        data = ((doc or {}).get("options") or {}).get("data")
+        if not data or "suboptions" not in data:
+            continue
+        result[filename[:-len(".py")]] = {
+            object_type: reduce_options(spec["suboptions"]["name"].get("suboptions") or {})
+            for object_type, spec in sorted(data["suboptions"].items())
+        }
+    return result
+
+
+def literal(value: Any, indent: int = 0, start: int = 0) -> str:
+    """Format ``value`` as Python source, on one line when it fits in 100 columns.
+
+    Args:
+        value: Decoded YAML value.
+        indent: Indentation of the line the value is on.
+        start: Column the value starts at.
+
+    Returns:
+        str: Python literal.
+    """
+    if isinstance(value, str):
+        return json.dumps(value)
+    if isinstance(value, list):
+        items = [literal(item) for item in value]
+        opening, closing = "[", "]"
+    elif isinstance(value, dict):
+        items = [f"{json.dumps(key)}: {literal(item)}" for key, item in value.items()]
+        opening, closing = "{", "}"
+    else:
+        return repr(value)
+    inline = opening + ", ".join(items) + closing
+    if max(start, indent) + len(inline) + 1 <= 100 or not value:
+        return inline
+    pad = " " * (indent + 4)
+    if isinstance(value, list):
+        lines = [f"{pad}{item}," for item in items]
+    else:
+        lines = []
+        for key, item in value.items():
+            prefix = f"{pad}{json.dumps(key)}: "
+            lines.append(prefix + literal(item, indent + 4, len(prefix)) + ",")
+    return opening + "\n" + "\n".join(lines) + "\n" + " " * indent + closing
+
+
+def render() -> str:
+    """Render the generated module.
+
+    Returns:
+        str: Content of verity_schema.py.
+    """
+    return HEADER + literal(schemas()) + "\n"
+
+
+def main() -> None:
+    """Write verity_schema.py, or with --check fail if it is out of date."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="only check that the file is up to date")
+    args = parser.parse_args()
+
+    content = render()
+    if args.check:
+        with open(OUTPUT, encoding="utf-8") as fp:
+            if fp.read() != content:
+                sys.exit(f"{OUTPUT} is out of date, run {sys.argv[0]}")
+        return
+    with open(OUTPUT, "w", encoding="utf-8") as fp:
+        fp.write(content)
+
+
+if __name__ == "__main__":
+    main()